@@ -0,0 +1,367 @@
+# Built-in Modules
+import random
+import sys
+import tempfile
+import threading
+import time
+from argparse import Namespace
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+# PyWiFi Modules
+import pywifi
+from pywifi import const
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Core Modules
+from core.association import AssociationHistory, percentile
+from core.wifi_connect import CONNECT_PHASES, ConnectionAttempt, WiFiConnector
+from core.wifi_snapshot import write_snapshot
+
+# Constants
+JITTER: float = 0.25  # simulated latencies vary by up to +-25%
+BENCHMARK_PASSWORD: str = "benchmark-password"
+
+
+def _network(ssid: str, signal: int) -> pywifi.Profile:
+    """Build a WPA2 network (or profile) like the ones pywifi returns."""
+    network = pywifi.Profile()
+    network.ssid = ssid
+    network.bssid = f"02:00:00:00:{len(ssid):02x}:{sum(map(ord, ssid)) % 256:02x}"
+    network.signal = signal
+    network.auth = const.AUTH_ALG_OPEN
+    network.akm = [const.AKM_TYPE_WPA2PSK]
+    network.cipher = const.CIPHER_TYPE_CCMP
+    return network
+
+
+class SimulatedInterface:
+    """
+    A wireless interface with configurable latencies, shaped like pywifi's.
+
+    Every other visible network has a saved profile. The profile store also
+    holds networks that are out of range, up to `profile_count` profiles.
+    Listing profiles costs `profile_read_cost` per profile, as pywifi on
+    Windows reads each profile's XML separately.
+
+    A scan takes `scan_latency` seconds; its results are empty until then. An
+    association takes `association_delay` seconds and fails with probability
+    `failure_rate`, in which case the interface falls back to disconnected.
+    """
+
+    def __init__(
+        self,
+        *,
+        networks: int,
+        profile_count: int,
+        scan_latency: float,
+        association_delay: float,
+        failure_rate: float,
+        profile_read_cost: float,
+        seed: Optional[int] = None,
+    ) -> None:
+        self.scan_latency: float = scan_latency
+        self.association_delay: float = association_delay
+        self.failure_rate: float = failure_rate
+        self.profile_read_cost: float = profile_read_cost
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        # Saved and unsaved networks alternate, so cycling through them mixes both
+        saved: int = (networks + 1) // 2
+        self.visible: List[pywifi.Profile] = [
+            _network(
+                f"Network-{i // 2:03d}" if i % 2 == 0 else f"Guest-{i // 2:03d}",
+                -50 - i,
+            )
+            for i in range(networks)
+        ]
+        self.saved_ssids: Set[str] = {f"Network-{i:03d}" for i in range(saved)}
+        self.profiles: Dict[str, pywifi.Profile] = {
+            f"Network-{i:03d}": _network(f"Network-{i:03d}", 0)
+            for i in range(max(profile_count, saved))
+        }
+        self._scan_done_at: float = 0.0
+        self._status: int = const.IFACE_DISCONNECTED
+        self._association_done_at: Optional[float] = None
+        self._association_fails: bool = False
+
+    def _jitter(self, seconds: float) -> float:
+        return seconds * self._random.uniform(1 - JITTER, 1 + JITTER)
+
+    def name(self) -> str:
+        return "Simulated Wi-Fi"
+
+    def scan(self) -> None:
+        with self._lock:
+            self._scan_done_at = time.perf_counter() + self._jitter(self.scan_latency)
+
+    def scan_results(self) -> List[pywifi.Profile]:
+        with self._lock:
+            done: bool = time.perf_counter() >= self._scan_done_at
+        return list(self.visible) if done else []
+
+    def network_profiles(self) -> List[pywifi.Profile]:
+        with self._lock:
+            profiles: List[pywifi.Profile] = list(self.profiles.values())
+        time.sleep(self.profile_read_cost * len(profiles))
+        return profiles
+
+    def add_network_profile(self, profile: pywifi.Profile) -> pywifi.Profile:
+        with self._lock:
+            self.profiles[profile.ssid] = profile
+        return profile
+
+    def remove_network_profile(self, profile: pywifi.Profile) -> None:
+        with self._lock:
+            self.profiles.pop(profile.ssid, None)
+
+    def connect(self, profile: pywifi.Profile) -> None:
+        with self._lock:
+            self._status = const.IFACE_CONNECTING
+            self._association_done_at = time.perf_counter() + self._jitter(
+                self.association_delay
+            )
+            self._association_fails = self._random.random() < self.failure_rate
+
+    def disconnect(self) -> None:
+        with self._lock:
+            self._status = const.IFACE_DISCONNECTED
+            self._association_done_at = None
+
+    def status(self) -> int:
+        with self._lock:
+            if (
+                self._status == const.IFACE_CONNECTING
+                and time.perf_counter() >= self._association_done_at
+            ):
+                self._status = (
+                    const.IFACE_DISCONNECTED
+                    if self._association_fails
+                    else const.IFACE_CONNECTED
+                )
+            return self._status
+
+
+class AttemptRecorder:
+    """Keeps attempts in memory; stands in for ConnectTelemetry."""
+
+    def __init__(self) -> None:
+        self.attempts: List[ConnectionAttempt] = []
+
+    def record(self, attempt: ConnectionAttempt) -> None:
+        self.attempts.append(attempt)
+
+
+def publish_snapshot(interface: SimulatedInterface, path: Path) -> None:
+    """Publish the visible networks the way the background scanner does."""
+    write_snapshot(
+        [
+            {
+                "ssid": network.ssid,
+                "signal": network.signal,
+                "akm": list(network.akm),
+                "cipher": network.cipher,
+            }
+            for network in interface.visible
+        ],
+        1,
+        path,
+    )
+
+
+def run_benchmark(
+    interface: SimulatedInterface,
+    runs: int,
+    *,
+    use_snapshot: bool = False,
+    force: bool = True,
+) -> Dict:
+    """
+    Connect `runs` times through WiFiConnector.process_input.
+
+    Targets cycle through the visible networks, saved and unsaved ones in
+    turn. The password dialog is replaced by a stub that answers at once, and
+    profiles added for unsaved networks are removed again after each run so
+    every run sees the same profile store.
+
+    Args:
+        interface: The simulated adapter
+        runs: How many connections to make
+        use_snapshot: Resolve networks from a fresh scanner snapshot instead
+            of scanning
+        force: Ignore the negative cache, so every run takes the full path
+
+    Runs that end in an unexpected exception are counted in "outcomes" but
+    kept out of the timings, since they did not take the real path.
+
+    Returns:
+        dict: "attempts" (ConnectionAttempts), "end_to_end" (the seconds each
+        process_input call took), "outcomes" (count per outcome) and
+        "crashed" (the attempts that ended in an exception)
+    """
+    recorder = AttemptRecorder()
+    end_to_end: List[float] = []
+    crashed: List[ConnectionAttempt] = []
+
+    with tempfile.TemporaryDirectory() as directory:
+        snapshot_file: Path = Path(directory) / "wifi_data.json"
+        connector = WiFiConnector(
+            interface,
+            snapshot_max_age=60.0 if use_snapshot else 0.0,
+            snapshot_file=snapshot_file,
+            association_history=AssociationHistory(
+                Path(directory) / "association_history.json"
+            ),
+            telemetry=recorder,
+        )
+        connector.show_password_dialog = lambda ssid=None: BENCHMARK_PASSWORD
+
+        for run in range(runs):
+            ssid: str = interface.visible[run % len(interface.visible)].ssid
+            if use_snapshot:
+                publish_snapshot(interface, snapshot_file)
+
+            start: float = time.perf_counter()
+            connector.process_input(f"c={ssid}" + (" --force" if force else ""))
+            seconds: float = time.perf_counter() - start
+            if recorder.attempts and recorder.attempts[-1].exception is not None:
+                crashed.append(recorder.attempts[-1])
+            else:
+                end_to_end.append(seconds)
+
+            if ssid not in interface.saved_ssids:
+                interface.remove_network_profile(_network(ssid, 0))
+                connector.profiles.invalidate()
+
+    outcomes: Dict[str, int] = {}
+    for attempt in recorder.attempts:
+        outcome: str = attempt.error_class or attempt.status
+        outcomes[outcome] = outcomes.get(outcome, 0) + 1
+
+    return {
+        "attempts": [
+            attempt for attempt in recorder.attempts if attempt.exception is None
+        ],
+        "end_to_end": end_to_end,
+        "outcomes": outcomes,
+        "crashed": crashed,
+    }
+
+
+def format_results(results: Dict) -> str:
+    """Render per-phase p50/p95 latencies as a plain-text table."""
+    samples: Dict[str, List[float]] = {phase: [] for phase in CONNECT_PHASES}
+    for attempt in results["attempts"]:
+        for phase, seconds in attempt.timings.items():
+            samples[phase].append(seconds)
+    samples["end-to-end"] = results["end_to_end"]
+
+    lines: List[str] = [
+        "Outcomes: "
+        + ", ".join(
+            f"{outcome} {count}"
+            for outcome, count in sorted(results["outcomes"].items())
+        ),
+        f"{'phase':<16}{'runs':>6}{'p50':>10}{'p95':>10}",
+    ]
+    for phase, values in samples.items():
+        if values:
+            lines.append(
+                f"{phase:<16}{len(values):>6}"
+                f"{percentile(values, 0.5):>9.3f}s{percentile(values, 0.95):>9.3f}s"
+            )
+    return "\n".join(lines)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Connect-flow latency benchmark against a simulated adapter"
+    )
+    parser.add_argument(
+        "-n", "--runs", help="Connections to make", type=int, default=40
+    )
+    parser.add_argument(
+        "--networks", help="Visible networks (half saved)", type=int, default=20
+    )
+    parser.add_argument(
+        "--profiles", help="Saved profiles in total", type=int, default=50
+    )
+    parser.add_argument(
+        "--scan-latency", help="Seconds a scan takes", type=float, default=0.5
+    )
+    parser.add_argument(
+        "--association-delay",
+        help="Seconds an association takes",
+        type=float,
+        default=0.3,
+    )
+    parser.add_argument(
+        "--failure-rate",
+        help="Fraction of associations that fail (0-1)",
+        type=float,
+        default=0.0,
+    )
+    parser.add_argument(
+        "--profile-read-cost",
+        help="Seconds to read one saved profile when listing them",
+        type=float,
+        default=0.002,
+    )
+    parser.add_argument(
+        "--snapshot",
+        help="Resolve networks from a fresh scanner snapshot instead of scanning",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--no-force",
+        help="Let recent failures fail fast (measures the negative cache)",
+        action="store_true",
+    )
+    parser.add_argument("--seed", help="Seed for the simulated jitter", type=int)
+    args: Namespace = parser.parse_args()
+
+    if args.networks < 2 or args.runs < 1:
+        parser.error("--networks must be at least 2 and --runs at least 1")
+
+    interface = SimulatedInterface(
+        networks=args.networks,
+        profile_count=args.profiles,
+        scan_latency=args.scan_latency,
+        association_delay=args.association_delay,
+        failure_rate=args.failure_rate,
+        profile_read_cost=args.profile_read_cost,
+        seed=args.seed,
+    )
+    print(
+        f"Connect benchmark: {args.runs} runs, {args.networks} networks visible, "
+        f"{len(interface.profiles)} saved profiles"
+    )
+    print(
+        f"scan {args.scan_latency:g}s, association {args.association_delay:g}s, "
+        f"failure rate {args.failure_rate:.0%}, "
+        f"resolve from {'snapshot' if args.snapshot else 'scan'}"
+    )
+    results: Dict = run_benchmark(
+        interface, args.runs, use_snapshot=args.snapshot, force=not args.no_force
+    )
+    print(format_results(results))
+
+    if results["crashed"]:
+        first: ConnectionAttempt = results["crashed"][0]
+        print(
+            f"Error: {len(results['crashed'])} of {args.runs} runs ended in an "
+            f"exception and were left out of the timings; first: "
+            f"{first.exception!r}",
+            file=sys.stderr,
+        )
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,15 +1,30 @@
-from core.available_networks import open_wifi_manager
-from core.command_processor import CommandProcessor
-from core.inline_autocomplete import TerminalAutoComplete
-from core.wifi_connect import WiFiConnector
-from core.wifi_disconnect import disconnect
-from core.wifi_networks import load_wifi_networks
-
-__all__: list[str] = [
-    "TerminalAutoComplete",
-    "CommandProcessor",
-    "WiFiConnector",
-    "disconnect",
-    "load_wifi_networks",
-    "open_wifi_manager",
-]
+# Built-in Modules
+from importlib import import_module
+from typing import Any
+
+# Module of each public name. Modules are imported on first use, so the
+# command-line tools, the headless mode and the benchmarks only load what they
+# need (no widgets for a connect, no Windows DLLs for a simulated adapter).
+_EXPORTS: dict[str, str] = {
+    "TerminalAutoComplete": "core.inline_autocomplete",
+    "CommandProcessor": "core.command_processor",
+    "NetworkTableView": "core.network_model",
+    "WiFiConnector": "core.wifi_connect",
+    "disconnect": "core.wifi_disconnect",
+    "disconnect_interface": "core.wifi_disconnect",
+    "run_headless": "core.headless",
+    "load_wifi_networks": "core.wifi_networks",
+    "poll_wifi_networks": "core.wifi_networks",
+    "open_wifi_manager": "core.available_networks",
+}
+
+__all__: list[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,187 @@
+# Built-in Modules
+import json
+import math
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# PyWiFi Modules
+from pywifi import const, iface
+
+# Helpers Modules
+from helpers import CancellationToken
+
+# Constants
+ASSOCIATION_HISTORY_FILE: Path = Path(__file__).parent / "association_history.json"
+DEFAULT_TIMEOUT: float = 10.0  # seconds, used until an SSID has enough history
+MIN_TIMEOUT: float = 3.0
+MAX_TIMEOUT: float = 30.0  # hard limit, also while the interface keeps connecting
+CONNECTING_GRACE: float = 5.0  # extra seconds for an interface still connecting
+TIMEOUT_HEADROOM: float = 2.0  # multiplier applied to the percentile
+TIMEOUT_PERCENTILE: float = 0.95
+MIN_SAMPLES: int = 3
+MAX_SAMPLES: int = 20  # successful associations kept per SSID
+
+# Status backoff: start tight, grow until the poll interval reaches the cap
+FIRST_POLL: float = 0.025
+POLL_GROWTH: float = 1.5
+MAX_POLL: float = 0.25
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    """
+    Return a percentile of a list of samples (nearest rank).
+
+    Args:
+        samples: A non-empty list of numbers
+        fraction: The percentile as a fraction, e.g. 0.95
+
+    Returns:
+        float: The sample at that rank
+    """
+    ordered: List[float] = sorted(samples)
+    rank: int = max(math.ceil(fraction * len(ordered)) - 1, 0)
+    return ordered[min(rank, len(ordered) - 1)]
+
+
+def wait_for_association(
+    interface: iface.Interface,
+    token: CancellationToken,
+    timeout: float = DEFAULT_TIMEOUT,
+    max_timeout: float = MAX_TIMEOUT,
+    *,
+    connected_before: bool = False,
+) -> str:
+    """
+    Wait for the interface to finish associating after connect().
+
+    The status is polled on a backoff starting at 25ms, so a fast association
+    is noticed almost immediately. Falling back to disconnected after having
+    been seen connecting is reported as a failure right away. An interface that
+    is still connecting when `timeout` runs out is given CONNECTING_GRACE more
+    seconds, up to `max_timeout`.
+
+    Args:
+        interface: The interface connect() was called on
+        token: Checked between status polls
+        timeout: The expected upper bound for this network, in seconds
+        max_timeout: The hard limit while the interface is still connecting
+        connected_before: The interface was connected when connect() was
+            called; its connected status then only counts once another status
+            has been seen, since until then it may be the old link
+
+    Returns:
+        str: "connected", "failed" or "timeout"
+
+    Raises:
+        OperationCancelled: If the token is cancelled while waiting
+    """
+    start: float = time.perf_counter()
+    delay: float = FIRST_POLL
+    seen_connecting: bool = False
+    left_connected: bool = not connected_before
+
+    while True:
+        status: int = interface.status()
+        if status == const.IFACE_CONNECTED:
+            if left_connected:
+                return "connected"
+        else:
+            left_connected = True
+        if status == const.IFACE_CONNECTING:
+            seen_connecting = True
+        elif seen_connecting and status in (
+            const.IFACE_DISCONNECTED,
+            const.IFACE_INACTIVE,
+        ):
+            return "failed"
+
+        elapsed: float = time.perf_counter() - start
+        limit: float = (
+            min(timeout + CONNECTING_GRACE, max_timeout)
+            if status == const.IFACE_CONNECTING
+            else timeout
+        )
+        if elapsed >= limit:
+            return "timeout"
+
+        token.wait(min(delay, limit - elapsed))
+        delay = min(delay * POLL_GROWTH, MAX_POLL)
+
+
+class AssociationHistory:
+    """
+    Recent successful association durations per SSID, kept in a JSON file.
+
+    Used to give each network a timeout that fits it: quick home networks
+    fail fast, while slow enterprise networks are not cut off too early.
+    """
+
+    def __init__(self, path: Path = ASSOCIATION_HISTORY_FILE) -> None:
+        """
+        Initialize the history; the file is read on first use.
+
+        Args:
+            path: The JSON file holding the durations
+        """
+        self.path: Path = path
+        self._durations: Optional[Dict[str, List[float]]] = None
+        self._lock = threading.Lock()
+
+    def _load(self) -> Dict[str, List[float]]:
+        """Read the file once (lock held); a missing or corrupt file is empty."""
+        if self._durations is None:
+            try:
+                with open(self.path, "r") as f:
+                    data = json.load(f)
+                self._durations = {
+                    str(ssid): [float(d) for d in durations][-MAX_SAMPLES:]
+                    for ssid, durations in data.items()
+                }
+            except (OSError, ValueError, TypeError, AttributeError):
+                self._durations = {}
+        return self._durations
+
+    def timeout_for(self, ssid: str) -> float:
+        """
+        Return the association timeout for a network.
+
+        Args:
+            ssid: The name of the network
+
+        Returns:
+            float: A high percentile of past successes with some headroom,
+            or DEFAULT_TIMEOUT if there are too few of them
+        """
+        with self._lock:
+            durations: List[float] = self._load().get(ssid, [])
+
+        if len(durations) < MIN_SAMPLES:
+            return DEFAULT_TIMEOUT
+
+        timeout: float = percentile(durations, TIMEOUT_PERCENTILE) * TIMEOUT_HEADROOM
+        return min(max(timeout, MIN_TIMEOUT), MAX_TIMEOUT)
+
+    def record(self, ssid: str, seconds: float) -> None:
+        """
+        Remember a successful association and save the history.
+
+        Args:
+            ssid: The name of the network
+            seconds: How long the association took
+        """
+        with self._lock:
+            durations: Dict[str, List[float]] = self._load()
+            samples: List[float] = durations.setdefault(ssid, [])
+            samples.append(round(seconds, 3))
+            del samples[:-MAX_SAMPLES]
+
+            try:
+                temp_path: Path = self.path.with_name(f"{self.path.name}.tmp")
+                with open(temp_path, "w") as f:
+                    json.dump(durations, f)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Could not save association history: {e}")
@@ -0,0 +1,194 @@
+# Built-in Modules
+import re
+import time
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+# Core Modules
+from core.command_registry import CommandError
+
+# "a && b" runs b if a succeeded, "a || b" if it failed, "a ; b" always.
+# "a & b" runs a and b side by side as one step. A single "|" is not an
+# operator: it separates the fallback networks of a connect. "&" and ";" only
+# count with whitespace around them, so SSIDs such as "AT&T" stay intact.
+PARALLEL_OPERATOR: str = "&"
+_OPERATORS = re.compile(r"\s*(&&|\|\||(?:^|(?<=\s))[;&](?=\s|$))\s*")
+
+# Runs a command and calls back with its outcome once it has finished
+CommandRunner = Callable[[str, Callable[[bool], None]], None]
+
+# Schedules a callable to run later (e.g. from the event loop)
+Deferrer = Callable[[Callable[[], None]], None]
+
+
+def defer_to_event_loop(callback: Callable[[], None]) -> None:
+    """Runs a callable from the Qt event loop once control returns to it."""
+    # PyQt6 Modules
+    from PyQt6.QtCore import QTimer
+
+    QTimer.singleShot(0, callback)
+
+
+class ChainStep(NamedTuple):
+    """Commands run side by side, and how the step joins the one before it."""
+
+    operator: str  # "&&", "||" or ";" (the first step always runs)
+    commands: Tuple[str, ...]
+
+
+class StepResult(NamedTuple):
+    """The outcome of one step of a chain."""
+
+    commands: Tuple[str, ...]
+    ok: bool
+    seconds: float
+    skipped: bool = False
+
+    def format(self) -> str:
+        """Returns the step as e.g. "✅ disconnect 0.21s"."""
+        text: str = f" {PARALLEL_OPERATOR} ".join(self.commands)
+        if self.skipped:
+            return f"⏭ {text}"
+        return f"{'✅' if self.ok else '❌'} {text} {self.seconds:.2f}s"
+
+
+def parse_chain(text: str) -> List[ChainStep]:
+    """
+    Split a command line into the steps of a chain.
+
+    Args:
+        text: e.g. "disconnect && connect Office & refresh || connect Home"
+
+    Returns:
+        list: The steps in order; a line without operators is one step
+
+    Raises:
+        CommandError: If an operator is not followed (or preceded) by a command
+    """
+    parts: List[str] = _OPERATORS.split(text.strip())
+    if len(parts) == 1:
+        return [ChainStep(";", (parts[0],))]
+
+    for index, command in enumerate(parts[::2]):
+        if not command:
+            operator: str = parts[2 * index - 1] if index else parts[1]
+            raise CommandError(f"Missing command next to '{operator}'")
+
+    steps: List[ChainStep] = []
+    operator = ";"
+    group: List[str] = [parts[0]]
+    for next_operator, command in zip(parts[1::2], parts[2::2]):
+        if next_operator == PARALLEL_OPERATOR:
+            group.append(command)
+            continue
+        steps.append(ChainStep(operator, tuple(group)))
+        operator, group = next_operator, [command]
+    steps.append(ChainStep(operator, tuple(group)))
+    return steps
+
+
+class ChainExecutor:
+    """
+    Runs the steps of a chain, each one once the previous one has finished.
+
+    Commands report their own completion through a callback (a connect only
+    completes when its worker does), so the next step starts as soon as the
+    work is done instead of after a fixed delay. Steps are started from the
+    event loop, which keeps the GUI responsive between them.
+    """
+
+    def __init__(
+        self,
+        steps: List[ChainStep],
+        run_command: CommandRunner,
+        on_finished: Callable[[List[StepResult], float], None],
+        defer: Optional[Deferrer] = None,
+    ) -> None:
+        """
+        Initialize the executor.
+
+        Args:
+            steps: The chain to run (see parse_chain)
+            run_command: Starts one command and calls back with its outcome
+            on_finished: Called with the step results and the total seconds
+            defer: Schedules the next step; defaults to the Qt event loop.
+                Without an event loop, pass one that calls it right away
+        """
+        self.steps: List[ChainStep] = steps
+        self.run_command: CommandRunner = run_command
+        self.on_finished = on_finished
+        self.defer: Deferrer = defer or defer_to_event_loop
+
+        self.results: List[StepResult] = []
+        self._last_ok: bool = True
+        self._started_at: float = 0.0
+        self._step_started_at: float = 0.0
+        self._pending: int = 0
+        self._step_ok: bool = True
+        self.cancelled: bool = False
+
+    def start(self) -> None:
+        """Runs the first step."""
+        self._started_at = time.perf_counter()
+        self._run_step(0)
+
+    def cancel(self) -> None:
+        """
+        Stops the chain: no further step is started.
+
+        The step in flight is not interrupted here; its commands are cancelled
+        by their owner (e.g. the connect worker), and once they report back the
+        chain finishes with the remaining steps marked as skipped.
+        """
+        self.cancelled = True
+
+    def _should_run(self, step: ChainStep) -> bool:
+        if self.cancelled:
+            return False
+        if step.operator == "&&":
+            return self._last_ok
+        if step.operator == "||":
+            return not self._last_ok
+        return True
+
+    def _run_step(self, index: int) -> None:
+        # Skipped steps keep the status of the last step that ran, as in a shell
+        while index < len(self.steps) and not self._should_run(self.steps[index]):
+            self.results.append(
+                StepResult(self.steps[index].commands, False, 0.0, True)
+            )
+            index += 1
+
+        if index >= len(self.steps):
+            self.on_finished(self.results, time.perf_counter() - self._started_at)
+            return
+
+        step: ChainStep = self.steps[index]
+        self._step_started_at = time.perf_counter()
+        self._pending = len(step.commands)
+        self._step_ok = True
+        for command in step.commands:
+            self.run_command(
+                command, lambda ok, index=index: self._command_done(index, ok)
+            )
+
+    def _command_done(self, index: int, ok: bool) -> None:
+        self._step_ok = self._step_ok and ok
+        self._pending -= 1
+        if self._pending:
+            return
+
+        self._last_ok = self._step_ok
+        self.results.append(
+            StepResult(
+                self.steps[index].commands,
+                self._step_ok,
+                time.perf_counter() - self._step_started_at,
+            )
+        )
+        # Continue from the event loop, not from inside the finished command
+        self.defer(lambda: self._run_step(index + 1))
+
+
+def format_chain_results(results: List[StepResult], total: float) -> str:
+    """Returns the per-step and total wall time of a chain on one line."""
+    return " · ".join([result.format() for result in results] + [f"total {total:.2f}s"])
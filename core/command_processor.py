@@ -2,17 +2,39 @@
 import subprocess
 import sys
 import time
+from collections import deque
 from pathlib import Path
+from typing import Callable, Dict, Optional
 
 # PyQt6 Modules
-from PyQt6.QtCore import QTimer
+from PyQt6.QtCore import QThreadPool, QTimer
 from PyQt6.QtWidgets import QApplication
 
 # Core Modules
 from core.available_networks import open_wifi_manager
-from core.wifi_connect import WiFiConnector
+from core.command_chain import (
+    ChainExecutor,
+    ChainStep,
+    StepResult,
+    format_chain_results,
+    parse_chain,
+)
+from core.command_registry import CommandError, CommandRegistry, build_registry
+from core.connect_worker import ConnectWorker
+from core.network_model import SORT_MODES
+from core.password_dialog import PasswordDialog
+from core.wifi_connect import (
+    ConnectionAttempt,
+    NoWirelessInterface,
+    WiFiConnector,
+    parse_connect_args,
+)
 from core.wifi_disconnect import disconnect
-from core.wifi_networks import load_wifi_networks
+from core.wifi_networks import (
+    cancel_fallback_scan,
+    get_render_latency_stats,
+    load_wifi_networks,
+)
 
 # Helpers Modules
 from helpers import (
@@ -22,226 +44,456 @@ from helpers import (
     get_and_apply_styles,
     hibernate,
     hide_output_box_with_animation,
+    hold_output_box,
     lock_or_logout,
     processing,
     reboot,
+    release_output_box,
     show_output_box_with_animation,
+    show_status_notice,
     shutdown,
     sleep,
 )
 
+# How long a connection result (with its phase timings) stays visible, in ms
+CONNECT_RESULT_DURATION: int = 3000
+# How long the summary of a command chain stays visible, in ms
+CHAIN_RESULT_DURATION: int = 3000
+
+# What happens to input entered while a command runs: "queue" runs it once the
+# command bar is free again, "reject" hands it back to the command bar
+QUEUE_POLICY: str = "queue"
+MAX_QUEUED_INPUTS: int = 5
+QUEUE_POLL_INTERVAL: int = 100  # ms between checks for a free command bar
+
 
 class CommandProcessor:
-    def __init__(self, window) -> None:
+    def __init__(self, window, *, queue_policy: str = QUEUE_POLICY) -> None:
         """
         Initialize the CommandProcessor with a reference to the main window.
 
         Args:
             window: Reference to the MasterWindow instance
+            queue_policy: "queue" or "reject" input entered while busy
         """
+        if queue_policy not in ("queue", "reject"):
+            raise ValueError(f"Unknown queue policy '{queue_policy}'")
         self.window = window
-        self.wifi_connector = WiFiConnector()
+        self.queue_policy: str = queue_policy
+        try:
+            self.wifi_connector = WiFiConnector()
+        except NoWirelessInterface as e:
+            print(f"Error: {e}")
+            sys.exit(1)
+        self.registry: CommandRegistry = self._build_registry()
+
+        # The connection attempt and the command chain in flight, if any
+        self.connect_worker: Optional[ConnectWorker] = None
+        self.chain: Optional[ChainExecutor] = None
+        QApplication.instance().aboutToQuit.connect(self.cancel_connect)
+
+        # Input waiting for the running command to finish
+        self.queue: deque[str] = deque()
+        self.queue_timer = QTimer()
+        self.queue_timer.setInterval(QUEUE_POLL_INTERVAL)
+        self.queue_timer.timeout.connect(self._run_queued)
+        self._placeholder: Optional[str] = None
 
     def process_input(self, input_text: str) -> None:
         """
-        Process user input, handling command chaining with &&.
+        Process user input, handling command chains.
+
+        "&&", "||" and ";" run the next step if the previous one succeeded,
+        failed or either; "&" runs commands side by side. Each step starts as
+        soon as the previous one has finished, and a chain ends with the wall
+        time of every step.
 
         Args:
             input_text (str): The text input from the command bar
         """
-        # Parse commands and execute them sequentially
-        commands: list[str] = input_text.split("&&")
-        self._execute_command_chain(commands)
+        if self.is_busy():
+            self._enqueue(input_text)
+            return
+
+        try:
+            steps: list[ChainStep] = parse_chain(input_text)
+        except CommandError as e:
+            self._show_invalid_command_message(str(e))
+            return
+
+        chained: bool = len(steps) > 1 or len(steps[0].commands) > 1
+        if chained:
+            # Steps share the output box instead of each animating it in and out
+            processing(self.window, begin=True)
+            hold_output_box(self.window)
+
+        self.chain = ChainExecutor(
+            steps,
+            self.execute_command,
+            lambda results, total: self._on_chain_finished(results, total, chained),
+        )
+        self.chain.start()
+
+    def is_busy(self) -> bool:
+        """Returns True while a command runs or shows its result."""
+        return self.chain is not None or getattr(
+            self.window, "processing_active", False
+        )
+
+    def _enqueue(self, input_text: str) -> None:
+        """Queues input entered while busy, or rejects it per the queue policy."""
+        if self.queue_policy == "reject" or len(self.queue) >= MAX_QUEUED_INPUTS:
+            # Hand the input back so it can be sent again later
+            self.window.command_bar.setText(input_text)
+            QApplication.beep()
+            return
+
+        self.queue.append(input_text)
+        self.queue_timer.start()
+        self._update_placeholder()
+
+    def _run_queued(self) -> None:
+        """Runs the next queued input once the previous result is off screen."""
+        if self.is_busy() or getattr(self.window, "output_box_shown", False):
+            return
+        if self.queue:
+            self.process_input(self.queue.popleft())
+        if not self.queue:
+            self.queue_timer.stop()
+        self._update_placeholder()
+
+    def _update_placeholder(self) -> None:
+        """Shows the number of queued inputs in the empty command bar."""
+        command_bar = self.window.command_bar
+        if self._placeholder is None:
+            self._placeholder = command_bar.placeholderText()
+        command_bar.setPlaceholderText(
+            f"{len(self.queue)} queued · Esc cancels"
+            if self.queue
+            else self._placeholder
+        )
 
-    def _execute_command_chain(self, commands: list[str], index: int = 0) -> None:
+    def cancel(self) -> bool:
         """
-        Execute commands sequentially with proper handling of animations.
+        Aborts the running command (Esc): the connect or scan in flight and the
+        remaining steps of its chain. Queued input is dropped as well.
 
-        Args:
-            commands (list[str]): List of commands to execute
-            index (int): Current command index
+        Returns:
+            bool: True if there was anything to cancel
         """
-        # Base case: all commands processed
-        if index >= len(commands):
+        dropped: int = len(self.queue)
+        self.queue.clear()
+        self.queue_timer.stop()
+        self._update_placeholder()
+
+        # A refresh returns before its fallback scan ends, so the scan may
+        # still run after its chain is gone
+        if self.chain is not None:
+            self.chain.cancel()
+        connect_cancelled: bool = self.cancel_connect()
+        scan_cancelled: bool = cancel_fallback_scan()
+        if self.chain is not None:
+            return True
+
+        notices: list[str] = []
+        if scan_cancelled:
+            notices.append("Scan cancelled")
+        if dropped:
+            notices.append(f"Dropped {dropped} queued command(s)")
+        if notices:
+            show_status_notice(self.window, " · ".join(notices), success=True)
+        return bool(dropped) or connect_cancelled or scan_cancelled
+
+    def _on_chain_finished(
+        self, results: list[StepResult], total: float, chained: bool
+    ) -> None:
+        """Shows the outcome of a chain with the wall time of each step."""
+        self.chain = None
+        if not chained:
             return
 
-        # Get current command (preserve original case for SSID)
-        current_command: str = commands[index].strip()
+        ran: list[StepResult] = [result for result in results if not result.skipped]
+        succeeded: bool = bool(ran) and ran[-1].ok
 
-        # Process current command
-        if current_command.startswith("-c ") or current_command.startswith("connect "):
-            command_result: bool = self.execute_command(current_command)
-        else:
-            command_result: bool = self.execute_command(current_command.lower())
+        # Keep the first line of the last step's output above the summary
+        last_output: list[str] = self.window.output_box.toPlainText().splitlines()
+        text: str = format_chain_results(results, total)
+        if last_output:
+            text = f"{last_output[0]}\n{text}"
 
-        # If command uses animation, wait for animation to complete
-        if current_command in ["-d", "disconnect"] or not command_result:
-            # For commands with animation or invalid commands, wait for animation to complete
-            QTimer.singleShot(
-                2000, lambda: self._execute_command_chain(commands, index + 1)
-            )
-        else:
-            # For commands without animation, proceed immediately
-            self._execute_command_chain(commands, index + 1)
+        self._set_output(
+            "output_box_success.qss" if succeeded else "output_box_failure.qss", text
+        )
+        show_output_box_with_animation(self.window)
+
+        def release() -> None:
+            release_output_box(self.window)
+            hide_output_box_with_animation(self.window)
+            QTimer.singleShot(300, lambda: processing(self.window, end=True))
 
-    def execute_command(self, command: str) -> bool:
+        QTimer.singleShot(CHAIN_RESULT_DURATION, release)
+
+    def _build_registry(self) -> CommandRegistry:
+        """
+        Registers the commands of the command bar.
+
+        Returns:
+            CommandRegistry: Every command with its handler
+        """
+        return build_registry(
+            {
+                "quit": lambda _: self._run(QApplication.quit),
+                "connect": self._connect,
+                "disconnect": lambda _: disconnect(self.window),
+                "refresh": lambda _: self._run(
+                    load_wifi_networks, self.window.table, force_refresh=True
+                ),
+                "latency": self._latency,
+                "filter": self._filter,
+                "sort": self._sort,
+                "wifi-manager": lambda _: self._run(open_wifi_manager, terminal="cmd"),
+                "shutdown": lambda _: self._run(shutdown),
+                "reboot": lambda _: self._run(reboot),
+                "sleep": lambda _: self._run(sleep),
+                "hibernate": lambda _: self._run(hibernate),
+                "lock": lambda _: self._run(lock_or_logout),
+                "help": self._help,
+            }
+        )
+
+    def execute_command(
+        self, command: str, on_done: Optional[Callable[[bool], None]] = None
+    ) -> bool:
         """
         Execute a single command and return whether it was successful.
 
         Args:
             command (str): The command to execute
+            on_done: Called with the outcome once the command has finished;
+                for an async command (connect) that is when its work ends
 
         Returns:
-            bool: True if command executed successfully, False otherwise
+            bool: True if command executed (or, if async, started) successfully,
+            False otherwise
         """
-        command_lower: str = command.lower()
+        on_done = on_done or (lambda ok: None)
+        try:
+            spec, args = self.registry.parse(command)
+        except CommandError as e:
+            self._show_invalid_command_message(str(e))
+            on_done(False)
+            return False
+
+        if spec.confirm and not self._confirm():
+            on_done(False)
+            return False
+
+        return self.registry.run(spec, args, on_done)
 
+    @staticmethod
+    def _run(action: Callable[..., object], *args, **kwargs) -> bool:
+        """Runs a command that cannot fail and reports success."""
+        action(*args, **kwargs)
+        return True
+
+    def _confirm(self) -> bool:
+        """Asks "Are you sure?" before a command flagged with confirm."""
         msg_box = MessageBox(
             title="Confirmation",
             text="Are you sure?",
             fixed_size=(180, 125),
             icon_path=Path(__file__).parent.parent / "assets" / "lock_icon.png",
         )
+        return bool(msg_box.show())
 
-        # Match other commands using the lowercase version
-        if command_lower in ["-q", "cls", "quit", "exit", "close", "terminate"]:
-            QApplication.quit()
-            return True
+    def _connect(self, args: str, on_done: Callable[[bool], None]) -> bool:
+        """Handles "connect A | B | C [--force]"; on_done follows the worker."""
+        if self.connect_worker is not None:
+            self._show_invalid_command_message("A connection is already in progress")
+            return False
+
+        # "connect A | B | C" tries each network in priority order
+        ssids, force = parse_connect_args(args)
+        if not ssids:
+            self._show_invalid_command_message(
+                f"Missing argument. Usage: {self.registry.get('connect').usage}"
+            )
+            return False
 
-        elif command_lower in ["-d", "disconnect"]:
-            disconnect(self.window)
+        # Connect on a worker thread; the result arrives via signals
+        self.start_connect(ssids, force=force, on_done=on_done)
+        return True
+
+    def _filter(self, args: str) -> bool:
+        """Type-to-filter from the command bar; no text clears the filter."""
+        self.window.filter_bar.setText(args)
+        return True
+
+    def _sort(self, args: str) -> bool:
+        """Reorders the rows in the proxy model; no rescan or file read."""
+        try:
+            mode: str = self.window.table.set_sort_mode(args.lower() or "strength")
+        except ValueError as e:
+            show_status_notice(self.window, f"❌ {e}. Use: {', '.join(SORT_MODES)}")
+            return False
+        show_status_notice(self.window, f"✅ Sorted by {mode}", success=True)
+        return True
+
+    def _latency(self, _: str) -> bool:
+        """Shows the scan-to-screen latency of the snapshots shown so far."""
+        stats: Dict[str, float] = get_render_latency_stats()
+        if not stats["count"]:
+            show_status_notice(self.window, "No new scans shown yet", success=True)
             return True
 
-        elif command_lower in ["-r", "refresh"]:
-            load_wifi_networks(self.window.table, force_refresh=True)
+        show_status_notice(
+            self.window,
+            f"Scan to screen: p50 {stats['p50']:.2f}s · p95 {stats['p95']:.2f}s · "
+            f"max {stats['max']:.2f}s · last {stats['last']:.2f}s "
+            f"({stats['count']} shown)",
+            success=True,
+            duration=3000,
+        )
+        return True
+
+    def _help(self, args: str) -> bool:
+        """Shows how to use one command, or opens the documentation."""
+        if args:
+            try:
+                text: str = self.registry.help_text(args)
+            except CommandError as e:
+                self._show_invalid_command_message(str(e))
+                return False
+            show_status_notice(self.window, text, success=True, duration=3000)
             return True
 
-        elif command_lower in ["shutdown"]:
-            if msg_box.show():
-                shutdown()
-                return True
-            return False
+        try:
+            # Determine the full path to the script
+            docs_app_path: Path = Path(__file__).parent.parent / "docs" / "docs_app.py"
 
-        elif command_lower in ["reboot", "restart"]:
-            if msg_box.show():
-                reboot()
-                return True
-            return False
+            if not docs_app_path.exists():
+                raise FileNotFoundError(f"docs_app.py not found at {docs_app_path}")
 
-        elif command_lower == "sleep":
-            if msg_box.show():
-                sleep()
-                return True
-            return False
+            # Start the script using the system's default Python interpreter
+            subprocess.Popen(
+                [sys.executable, docs_app_path],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
 
-        elif command_lower in ["hibernate"]:
-            if msg_box.show():
-                hibernate()
-                return True
-            return False
+            # Wait a short time to ensure the process starts
+            time.sleep(1)
+        except Exception as e:
+            start_msg_box = MessageBox(
+                title="Starting Error",
+                text=f"Error starting {e}",
+                fixed_size=(502, 131),
+                icon=Icons.Critical,
+                buttons=Buttons.Ok,
+            )
+            start_msg_box.show()
+            raise
+        return True
+
+    def start_connect(
+        self,
+        ssids: list[str],
+        *,
+        force: bool = False,
+        on_done: Optional[Callable[[bool], None]] = None,
+    ) -> ConnectWorker:
+        """
+        Starts connecting to a network, or the first of a fallback list that
+        associates, on the global thread pool.
 
-        elif command_lower in ["lock", "logout"]:
-            if msg_box.show():
-                lock_or_logout()
-                return True
-            return False
+        The window stays busy while the attempt runs. Each phase is shown in
+        the output box as it starts, and the final result is shown together
+        with the time spent in every phase.
 
-        elif command_lower in ["-w", "wifi-manager"]:
-            open_wifi_manager(terminal="cmd")
-            return True
+        Args:
+            ssids (list[str]): The networks, highest priority first
+            force (bool): Retry even if the network failed moments ago
+            on_done: Called with the outcome once the attempt has finished;
+                connected before the worker starts, so a fast failure is not
+                missed
+
+        Returns:
+            ConnectWorker: The running worker
+        """
+        processing(self.window, begin=True)
+        self._set_output("output_box.qss", f"⏳ Connecting to {' | '.join(ssids)}...")
+        show_output_box_with_animation(self.window)
 
-        elif command.startswith("-c ") or command.startswith("connect "):
-            # Extract the SSID from the command
-            parts: list[str] = command.split(" ", 1)
-            if len(parts) == 2 and parts[1].strip():
-                ssid: str = parts[1].strip()
-
-                # Show processing animation
-                processing(self.window, begin=True)
-
-                # Prepare to connect using the WiFiConnector
-                result: str = self.wifi_connector.process_input(f"connect={ssid}")
-
-                # Display result in output box
-                get_and_apply_styles(
-                    script_file=Path(__file__).parent,
-                    set_content_funcs={
-                        (
-                            "output_box_success.qss"
-                            if "Successfully" in result
-                            else "output_box_failure.qss"
-                        ): self.window.output_box.setStyleSheet
-                    },
-                )
-                self.window.output_box.setPlainText(result)
-
-                # Show the output box with animation
-                show_output_box_with_animation(self.window)
-
-                # Hide the output box after 1.5 seconds and enable the command bar
-                QTimer.singleShot(
-                    1500, lambda: hide_output_box_with_animation(self.window)
-                )
-                QTimer.singleShot(1800, lambda: processing(self.window, end=True))
-
-                return True
-            else:
-                # No SSID provided
-                processing(self.window, begin=True)
-                get_and_apply_styles(
-                    script_file=Path(__file__).parent,
-                    set_content_funcs={
-                        "output_box_failure.qss": self.window.output_box.setStyleSheet
-                    },
-                )
-                self.window.output_box.setPlainText(
-                    "❌ No Wi-Fi network name provided. Usage: connect [NETWORK_NAME]"
-                )
-
-                # Show and hide with animation
-                show_output_box_with_animation(self.window)
-                QTimer.singleShot(
-                    1500, lambda: hide_output_box_with_animation(self.window)
-                )
-                QTimer.singleShot(1800, lambda: processing(self.window, end=True))
+        worker = ConnectWorker(self.wifi_connector, ssids, force=force)
+        worker.signals.phase.connect(self._on_connect_phase)
+        worker.signals.password_requested.connect(self._on_password_requested)
+        worker.signals.finished.connect(self._on_connect_finished)
+        if on_done is not None:
+            worker.signals.finished.connect(lambda attempt: on_done(attempt.succeeded))
 
-                return False
+        self.connect_worker = worker
+        QThreadPool.globalInstance().start(worker)
+        return worker
 
-        elif command_lower in ["-h", "--help"]:
-            try:
-                # Determine the full path to the script
-                docs_app_path: Path = (
-                    Path(__file__).parent.parent / "docs" / "docs_app.py"
-                )
-
-                if not docs_app_path.exists():
-                    raise FileNotFoundError(f"docs_app.py not found at {docs_app_path}")
-
-                # Start the script using the system's default Python interpreter
-                subprocess.Popen(
-                    [sys.executable, docs_app_path],
-                    stdout=subprocess.DEVNULL,
-                    stderr=subprocess.DEVNULL,
-                )
-
-                # Wait a short time to ensure the process starts
-                time.sleep(1)
-            except Exception as e:
-                start_msg_box = MessageBox(
-                    title="Starting Error",
-                    text=f"Error starting {e}",
-                    fixed_size=(502, 131),
-                    icon=Icons.Critical,
-                    buttons=Buttons.Ok,
-                )
-                start_msg_box.show()
-                raise
-
-        else:
-            self._show_invalid_command_message()
+    def cancel_connect(self) -> bool:
+        """Cancels the connection attempt in flight; returns False if none."""
+        if self.connect_worker is None:
             return False
+        self.connect_worker.cancel()
+        return True
+
+    def _on_connect_phase(self, phase: str, seconds: Optional[float]) -> None:
+        """Shows the phase that just started."""
+        if seconds is None and self.connect_worker is not None:
+            self.window.output_box.setPlainText(
+                f"⏳ Connecting to {self.connect_worker.ssid}: {phase.replace('_', ' ')}..."
+            )
 
-    def _show_invalid_command_message(self) -> None:
+    def _on_password_requested(self, ssid: str) -> None:
+        """Asks for the security key on the GUI thread and hands it to the worker."""
+        dialog = PasswordDialog(ssid)
+        password: Optional[str] = dialog.password if dialog.exec() else None
+        if self.connect_worker is not None:
+            self.connect_worker.provide_password(password)
+
+    def _on_connect_finished(self, attempt: ConnectionAttempt) -> None:
+        """Shows the result of a connection attempt with its phase timings."""
+        self.connect_worker = None
+
+        icon: str = "✅" if attempt.succeeded else "❌"
+        text: str = f"{icon} {attempt.message}"
+        if attempt.timings:
+            text += f"\n{attempt.format_timings()}"
+
+        self._set_output(
+            (
+                "output_box_success.qss"
+                if attempt.succeeded
+                else "output_box_failure.qss"
+            ),
+            text,
+        )
+
+        QTimer.singleShot(
+            CONNECT_RESULT_DURATION,
+            lambda: hide_output_box_with_animation(self.window),
+        )
+        QTimer.singleShot(
+            CONNECT_RESULT_DURATION + 300, lambda: processing(self.window, end=True)
+        )
+
+    def _set_output(self, style: str, text: str) -> None:
+        """Applies an output box style and replaces its text."""
+        get_and_apply_styles(
+            script_file=Path(__file__).parent,
+            set_content_funcs={style: self.window.output_box.setStyleSheet},
+        )
+        self.window.output_box.setPlainText(text)
+
+    def _show_invalid_command_message(
+        self,
+        message: str = "Invalid Command, Type '--help or -h' to see available commands.",
+    ) -> None:
         """Display the invalid command message with animation"""
         processing(self.window, begin=True)
         get_and_apply_styles(
@@ -250,9 +502,7 @@ class CommandProcessor:
                 "output_box_failure.qss": self.window.output_box.setStyleSheet
             },
         )
-        self.window.output_box.setPlainText(
-            "❌ Invalid Command, Type '--help or -h' to see available commands."
-        )
+        self.window.output_box.setPlainText(f"❌ {message}")
 
         # Show the output box with animation
         show_output_box_with_animation(self.window)
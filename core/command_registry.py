@@ -0,0 +1,283 @@
+# Built-in Modules
+import difflib
+from dataclasses import dataclass, replace
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+
+class CommandError(Exception):
+    """Raised when a command line does not match a registered command."""
+
+
+@dataclass(frozen=True)
+class CommandSpec:
+    """
+    A command of the command bar.
+
+    Attributes:
+        name: The name shown by autocomplete and help
+        aliases: Other spellings, such as short flags ("-c")
+        args: The argument grammar shown in help, e.g. "<SSID> [--force]";
+            empty if the command takes no arguments
+        args_required: Reject the command when no arguments are given
+        confirm: Ask for confirmation before running the handler
+        is_async: The handler only starts the work, which finishes later; it
+            is called with a second argument, a callback taking the outcome
+        help: A one-line description
+        handler: Called with the argument text; returns True on success. None
+            if the command is not available in this frontend
+    """
+
+    name: str
+    aliases: Tuple[str, ...] = ()
+    args: str = ""
+    args_required: bool = False
+    confirm: bool = False
+    is_async: bool = False
+    help: str = ""
+    handler: Optional[Callable[..., bool]] = None
+
+    @property
+    def usage(self) -> str:
+        """The command with its argument grammar, e.g. "sort [MODE]"."""
+        return f"{self.name} {self.args}".strip()
+
+
+class CommandRegistry:
+    """
+    The commands of the command bar, looked up by name or alias in O(1).
+
+    Dispatch, validation, autocomplete and help are all derived from the
+    registered specs, so a new command is added in one place.
+    """
+
+    def __init__(self) -> None:
+        self._specs: List[CommandSpec] = []
+        self._by_name: Dict[str, CommandSpec] = {}
+
+    def register(self, spec: CommandSpec) -> CommandSpec:
+        """
+        Add a command.
+
+        Args:
+            spec: The command to add
+
+        Returns:
+            CommandSpec: The registered spec
+
+        Raises:
+            ValueError: If its name or an alias is already taken
+        """
+        names: List[str] = [name.lower() for name in (spec.name, *spec.aliases)]
+        for name in names:
+            if name in self._by_name:
+                raise ValueError(f"Command '{name}' is already registered")
+
+        self._specs.append(spec)
+        for name in names:
+            self._by_name[name] = spec
+        return spec
+
+    def get(self, name: str) -> Optional[CommandSpec]:
+        """Return the command with this name or alias, or None."""
+        return self._by_name.get(name.lower())
+
+    def __iter__(self) -> Iterator[CommandSpec]:
+        return iter(self._specs)
+
+    def parse(self, command_line: str) -> Tuple[CommandSpec, str]:
+        """
+        Split a command line into its command and arguments and validate it.
+
+        The command name is case-insensitive; the arguments keep their case
+        (SSIDs are case-sensitive).
+
+        Args:
+            command_line: e.g. "connect Office --force"
+
+        Returns:
+            tuple: (the command, the stripped argument text)
+
+        Raises:
+            CommandError: If the command is unknown or its arguments are invalid
+        """
+        name, _, args = command_line.strip().partition(" ")
+        spec: Optional[CommandSpec] = self.get(name)
+        if spec is None:
+            suggestion: Optional[str] = self.suggest(name)
+            raise CommandError(
+                f"Unknown command '{name}'. Did you mean '{suggestion}'?"
+                if suggestion
+                else "Invalid Command, Type '--help or -h' to see available commands."
+            )
+        if spec.handler is None:
+            raise CommandError(f"'{spec.name}' is not available here")
+
+        args = args.strip()
+        if args and not spec.args:
+            raise CommandError(f"'{spec.name}' takes no arguments")
+        if not args and spec.args_required:
+            raise CommandError(f"Missing argument. Usage: {spec.usage}")
+        return (spec, args)
+
+    @staticmethod
+    def run(spec: CommandSpec, args: str, on_done: Callable[[bool], None]) -> bool:
+        """
+        Run a parsed command and report its outcome through on_done.
+
+        A sync handler's result is reported as soon as it returns. An async
+        handler receives on_done and calls it itself once its work ends, unless
+        it fails to start.
+
+        Args:
+            spec: The command, as returned by parse
+            args: Its arguments
+            on_done: Called once with the outcome
+
+        Returns:
+            bool: True if the command succeeded (or, if async, started)
+        """
+        if spec.is_async:
+            started: bool = spec.handler(args, on_done)
+            if not started:
+                on_done(False)
+            return started
+
+        ok: bool = spec.handler(args)
+        on_done(ok)
+        return ok
+
+    def suggest(self, name: str) -> Optional[str]:
+        """Return the command whose name is closest to a misspelled one, if any."""
+        matches: List[str] = difflib.get_close_matches(
+            name.lower(),
+            [spec.name for spec in self._specs if spec.handler is not None],
+            n=1,
+            cutoff=0.6,
+        )
+        return matches[0] if matches else None
+
+    def completions(self) -> List[str]:
+        """Return the names and word aliases for autocomplete (no short flags)."""
+        return [
+            name
+            for spec in self._specs
+            if spec.handler is not None
+            for name in (spec.name, *spec.aliases)
+            if not name.startswith("-")
+        ]
+
+    def help_text(self, name: Optional[str] = None) -> str:
+        """
+        Describe one command, or list all of them.
+
+        Args:
+            name: A command name or alias; None lists every command
+
+        Returns:
+            str: The usage, aliases and description of each command
+
+        Raises:
+            CommandError: If `name` is not a registered command
+        """
+        specs: List[CommandSpec] = [
+            spec for spec in self._specs if spec.handler is not None
+        ]
+        if name is not None:
+            spec: Optional[CommandSpec] = self.get(name)
+            if spec is None or spec.handler is None:
+                raise CommandError(f"Unknown command '{name}'")
+            specs = [spec]
+
+        lines: List[str] = []
+        for spec in specs:
+            line: str = spec.usage
+            if spec.aliases:
+                line += f" ({', '.join(spec.aliases)})"
+            if spec.help:
+                line += f": {spec.help}"
+            lines.append(line)
+        return "\n".join(lines)
+
+
+# The command vocabulary shared by the window and the headless mode; each one
+# supplies the handlers (see build_registry)
+COMMANDS: Tuple[CommandSpec, ...] = (
+    CommandSpec(
+        "quit",
+        aliases=("-q", "cls", "exit", "close", "terminate"),
+        help="Close Wi-Fi Center",
+    ),
+    CommandSpec(
+        "connect",
+        aliases=("-c",),
+        args="<SSID> [| <SSID> ...] [--force]",
+        args_required=True,
+        is_async=True,
+        help="Connect to a network, or the first of a fallback list",
+    ),
+    CommandSpec(
+        "disconnect", aliases=("-d",), help="Disconnect from the current network"
+    ),
+    CommandSpec("refresh", aliases=("-r",), help="Reload the network list"),
+    CommandSpec(
+        "latency", help="Show how long new scans take to reach the network list"
+    ),
+    CommandSpec(
+        "filter",
+        aliases=("-f",),
+        args="[TEXT]",
+        help="Show only matching networks; no text clears the filter",
+    ),
+    CommandSpec(
+        "sort",
+        aliases=("-s",),
+        args="[MODE]",
+        help="Order the network list by strength, name, security, band or last-seen",
+    ),
+    CommandSpec(
+        "wifi-manager", aliases=("-w",), help="Open the Wi-Fi manager in a terminal"
+    ),
+    CommandSpec("shutdown", confirm=True, help="Shut down the computer"),
+    CommandSpec(
+        "reboot", aliases=("restart",), confirm=True, help="Restart the computer"
+    ),
+    CommandSpec("sleep", confirm=True, help="Put the computer to sleep"),
+    CommandSpec(
+        "hibernate",
+        confirm=True,
+        help="Hibernate the computer (or sleep if unavailable)",
+    ),
+    CommandSpec("lock", aliases=("logout",), confirm=True, help="Lock the computer"),
+    CommandSpec(
+        "help",
+        aliases=("-h", "--help"),
+        args="[COMMAND]",
+        help="Open the documentation, or show how to use a command",
+    ),
+)
+
+
+def build_registry(handlers: Dict[str, Callable[..., bool]]) -> CommandRegistry:
+    """
+    Build a registry of COMMANDS with a frontend's handlers.
+
+    Commands without a handler stay registered, so they are recognized (and
+    reported as unavailable) but not completed or listed in help.
+
+    Args:
+        handlers: The handler of each available command, by command name
+
+    Returns:
+        CommandRegistry: The registry
+
+    Raises:
+        ValueError: If a handler is given for a command that does not exist
+    """
+    unknown: List[str] = sorted(set(handlers) - {spec.name for spec in COMMANDS})
+    if unknown:
+        raise ValueError(f"No such command: {', '.join(unknown)}")
+
+    registry = CommandRegistry()
+    for spec in COMMANDS:
+        registry.register(replace(spec, handler=handlers.get(spec.name)))
+    return registry
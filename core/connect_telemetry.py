@@ -0,0 +1,201 @@
+# Built-in Modules
+import sqlite3
+import sys
+import threading
+import time
+from argparse import Namespace
+from contextlib import closing
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Core Modules
+from core.association import percentile
+
+# Constants
+TELEMETRY_FILE: Path = Path(__file__).parent / "connect_telemetry.sqlite3"
+RETENTION_DAYS: int = 90
+
+# One column per connection phase (see wifi_connect.CONNECT_PHASES)
+PHASE_COLUMNS: Tuple[str, ...] = (
+    "resolve",
+    "profile_lookup",
+    "credentials",
+    "add_profile",
+    "associate",
+    "verify",
+)
+
+_SCHEMA: str = f"""
+CREATE TABLE IF NOT EXISTS attempts (
+    started_at REAL NOT NULL,
+    ssid TEXT NOT NULL,
+    outcome TEXT NOT NULL,
+    error_class TEXT,
+    resolved_from TEXT,
+    total REAL NOT NULL,
+    {", ".join(f"{phase} REAL" for phase in PHASE_COLUMNS)}
+);
+CREATE INDEX IF NOT EXISTS attempts_by_ssid ON attempts (ssid, started_at);
+"""
+
+
+class ConnectTelemetry:
+    """
+    A local SQLite log of connection attempts.
+
+    Each attempt is one row holding its outcome, error class and the seconds
+    spent in every phase (NULL for skipped phases). Rows older than
+    RETENTION_DAYS are dropped as new ones are written.
+    """
+
+    def __init__(self, path: Path = TELEMETRY_FILE) -> None:
+        """
+        Initialize the store; the database is created on first write.
+
+        Args:
+            path: The SQLite database file
+        """
+        self.path: Path = path
+        self._lock = threading.Lock()
+        self._ready: bool = False
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database, creating the schema once per process."""
+        connection = sqlite3.connect(self.path, timeout=2.0)
+        if not self._ready:
+            connection.executescript(_SCHEMA)
+            self._ready = True
+        return connection
+
+    def record(self, attempt) -> None:
+        """
+        Log a finished connection attempt.
+
+        Telemetry must never break a connect, so errors are only printed.
+
+        Args:
+            attempt: A wifi_connect.ConnectionAttempt
+        """
+        now: float = time.time()
+        total: float = sum(attempt.timings.values())
+        row: List = [
+            now - total,
+            attempt.ssid,
+            attempt.status,
+            attempt.error_class,
+            attempt.resolved_from,
+            total,
+        ] + [attempt.timings.get(phase) for phase in PHASE_COLUMNS]
+
+        try:
+            with self._lock, closing(self._connect()) as connection, connection:
+                connection.execute(
+                    f"INSERT INTO attempts VALUES ({', '.join('?' * len(row))})",
+                    row,
+                )
+                connection.execute(
+                    "DELETE FROM attempts WHERE started_at < ?",
+                    (now - RETENTION_DAYS * 86400,),
+                )
+        except sqlite3.Error as e:
+            print(f"Could not record connection telemetry: {e}")
+
+    def summary(
+        self, ssid: Optional[str] = None, since: Optional[float] = None
+    ) -> Dict[str, Dict]:
+        """
+        Summarize the logged attempts per SSID.
+
+        Args:
+            ssid: Only summarize this network
+            since: Only include attempts started after this Unix time
+
+        Returns:
+            A dictionary mapping each SSID to its "attempts", "successes",
+            "errors" (count per error class) and "phases" (phase -> (p50, p95)),
+            with "total" included as a phase
+        """
+        columns: str = ", ".join(
+            ("ssid", "outcome", "error_class", "total") + PHASE_COLUMNS
+        )
+        query: str = f"SELECT {columns} FROM attempts WHERE 1=1"
+        params: List = []
+        if ssid is not None:
+            query += " AND ssid = ?"
+            params.append(ssid)
+        if since is not None:
+            query += " AND started_at >= ?"
+            params.append(since)
+
+        if not self.path.exists():
+            return {}
+        with self._lock, closing(self._connect()) as connection:
+            rows: List[Tuple] = connection.execute(query, params).fetchall()
+
+        samples: Dict[str, Dict] = {}
+        for name, outcome, error_class, *durations in rows:
+            entry: Dict = samples.setdefault(
+                name,
+                {"attempts": 0, "successes": 0, "errors": {}, "durations": {}},
+            )
+            entry["attempts"] += 1
+            if outcome == "success":
+                entry["successes"] += 1
+            elif error_class:
+                entry["errors"][error_class] = entry["errors"].get(error_class, 0) + 1
+
+            for phase, seconds in zip(("total",) + PHASE_COLUMNS, durations):
+                if seconds is not None:
+                    entry["durations"].setdefault(phase, []).append(seconds)
+
+        for entry in samples.values():
+            durations: Dict[str, List[float]] = entry.pop("durations")
+            entry["phases"] = {
+                phase: (percentile(values, 0.5), percentile(values, 0.95))
+                for phase, values in durations.items()
+            }
+        return samples
+
+
+def format_summary(summary: Dict[str, Dict]) -> str:
+    """Render a summary as a plain-text table, slowest networks first."""
+    if not summary:
+        return "No connection attempts recorded."
+
+    lines: List[str] = []
+    ordered = sorted(
+        summary.items(), key=lambda item: -item[1]["phases"].get("total", (0, 0))[1]
+    )
+    for ssid, entry in ordered:
+        rate: float = 100 * entry["successes"] / entry["attempts"]
+        lines.append(f"{ssid}: {entry['attempts']} attempts, {rate:.0f}% successful")
+        for error_class, count in sorted(entry["errors"].items()):
+            lines.append(f"    {error_class}: {count}")
+        lines.append(f"    {'phase':<16}{'p50':>9}{'p95':>9}")
+        for phase in ("total",) + PHASE_COLUMNS:
+            if phase in entry["phases"]:
+                p50, p95 = entry["phases"][phase]
+                lines.append(f"    {phase:<16}{p50:>8.2f}s{p95:>8.2f}s")
+    return "\n".join(lines)
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Connection latency percentiles per Wi-Fi network"
+    )
+    parser.add_argument("-s", "--ssid", help="Only show this network", type=str)
+    parser.add_argument("-d", "--days", help="Only include the last N days", type=float)
+    args: Namespace = parser.parse_args()
+
+    since: Optional[float] = time.time() - args.days * 86400 if args.days else None
+    print(format_summary(ConnectTelemetry().summary(args.ssid, since)))
+
+
+if __name__ == "__main__":
+    main()
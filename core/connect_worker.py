@@ -0,0 +1,86 @@
+# Built-in Modules
+import threading
+from typing import List, Optional
+
+# PyQt6 Modules
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+# Core Modules
+from core.wifi_connect import ConnectionAttempt, WiFiConnector
+
+# Helpers Modules
+from helpers import CancellationToken
+
+
+class ConnectSignals(QObject):
+    phase = pyqtSignal(str, object)  # (phase, seconds or None when it starts)
+    target = pyqtSignal(str)  # the network being tried from a fallback list
+    password_requested = pyqtSignal(str)
+    finished = pyqtSignal(object)  # ConnectionAttempt
+
+
+class ConnectWorker(QRunnable):
+    """
+    Runs WiFiConnector.connect (or connect_any for a fallback list) on the
+    global thread pool.
+
+    The password dialog must be shown on the GUI thread: the worker emits
+    password_requested and blocks until provide_password() is called.
+    """
+
+    def __init__(
+        self, connector: WiFiConnector, ssids: List[str], *, force: bool = False
+    ) -> None:
+        super().__init__()
+        self.connector = connector
+        self.ssids: List[str] = ssids
+        self.ssid: str = " | ".join(ssids)  # the network(s) currently being tried
+        self.force = force
+        self.token = CancellationToken()
+        self.signals = ConnectSignals()
+
+        self._password: Optional[str] = None
+        self._password_ready = threading.Event()
+
+    def run(self) -> None:
+        """Connect and report the attempt through the finished signal."""
+        if len(self.ssids) == 1:
+            attempt: ConnectionAttempt = self.connector.connect(
+                self.ssid,
+                token=self.token,
+                on_phase=self.signals.phase.emit,
+                request_password=self._request_password,
+                force=self.force,
+            )
+        else:
+            attempt = self.connector.connect_any(
+                self.ssids,
+                token=self.token,
+                on_phase=self.signals.phase.emit,
+                on_target=self._set_target,
+                request_password=self._request_password,
+                force=self.force,
+            )
+        self.signals.finished.emit(attempt)
+
+    def _set_target(self, ssid: str) -> None:
+        """Track and announce the network being tried."""
+        self.ssid = ssid
+        self.signals.target.emit(ssid)
+
+    def _request_password(self, ssid: str) -> Optional[str]:
+        """Ask the GUI thread for a password and wait for the answer."""
+        self._password_ready.clear()
+        self.signals.password_requested.emit(ssid)
+        while not self._password_ready.wait(0.1):
+            self.token.raise_if_cancelled()
+        return self._password
+
+    def provide_password(self, password: Optional[str]) -> None:
+        """Hand the entered password (None if cancelled) back to the worker."""
+        self._password = password
+        self._password_ready.set()
+
+    def cancel(self, reason: str = "Connection cancelled") -> None:
+        """Stop the attempt at the next phase boundary or status poll."""
+        self.token.cancel(reason)
@@ -0,0 +1,154 @@
+# Built-in Modules
+import gzip
+import os
+import queue
+import shutil
+import threading
+from pathlib import Path
+from typing import List, TextIO
+
+# Constants
+MAX_BYTES: int = 1024 * 1024  # size at which the log file is rotated
+BACKUP_COUNT: int = 5  # compressed files kept: name.1.gz (newest) .. name.5.gz
+MAX_PENDING: int = 10000  # lines queued for the writer before new ones are dropped
+WRITE_BUFFER: int = 64 * 1024
+CLOSE_TIMEOUT: float = 2.0  # seconds to wait for queued lines on close
+
+_CLOSE = object()  # tells the writer thread to finish
+
+
+class RotatingFileSink:
+    """
+    Appends log lines to a file on a background thread.
+
+    Callers only put the line on a bounded queue, so logging never waits for
+    the disk; if the writer falls behind by MAX_PENDING lines, new lines are
+    dropped and the number dropped is written once it catches up. The writer
+    drains the queue in batches through a buffered file and flushes once the
+    queue is empty.
+
+    When the file reaches `max_bytes` it is compressed to name.1.gz, older
+    archives move up one number, and the oldest beyond `backup_count` is
+    deleted.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        *,
+        max_bytes: int = MAX_BYTES,
+        backup_count: int = BACKUP_COUNT,
+        max_pending: int = MAX_PENDING,
+    ) -> None:
+        """
+        Open the log file and start the writer thread.
+
+        Args:
+            path: The log file; appended to if it exists
+            max_bytes: Rotate once the file is this large (0 never rotates)
+            backup_count: How many compressed files to keep
+            max_pending: How many lines may wait for the writer
+
+        Raises:
+            OSError: If the file cannot be opened
+        """
+        self.path: Path = path
+        self.max_bytes: int = max_bytes
+        self.backup_count: int = backup_count
+        self.dropped: int = 0
+        self._queue: "queue.Queue" = queue.Queue(maxsize=max_pending)
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file: TextIO = self._open()
+        self._size: int = self.path.stat().st_size
+        self._thread = threading.Thread(
+            target=self._write_loop, name="log-file-sink", daemon=True
+        )
+        self._thread.start()
+
+    def __call__(self, line: str) -> None:
+        """Queue a line for the file; returns at once (see the class docs)."""
+        try:
+            self._queue.put_nowait(line)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self, timeout: float = CLOSE_TIMEOUT) -> None:
+        """Write the queued lines and close the file."""
+        try:
+            self._queue.put(_CLOSE, timeout=timeout)
+        except queue.Full:
+            pass
+        self._thread.join(timeout)
+
+    def _open(self) -> TextIO:
+        return open(
+            self.path, "a", encoding="utf-8", buffering=WRITE_BUFFER, newline="\n"
+        )
+
+    def _write_loop(self) -> None:
+        while True:
+            batch: List = [self._queue.get()]
+            while True:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+
+            closing: bool = _CLOSE in batch
+            self._write([line for line in batch if line is not _CLOSE])
+            if closing:
+                self._file.close()
+                return
+
+    def _write(self, lines: List[str]) -> None:
+        try:
+            if self._file.closed:
+                # A failed rotation could not reopen the file; try again
+                self._file = self._open()
+            if self.dropped:
+                dropped, self.dropped = self.dropped, 0
+                lines.insert(0, f"[{dropped} log lines dropped]")
+            for line in lines:
+                line += "\n"
+                self._file.write(line)
+                # Counted here: tell() would flush the buffer on every line
+                self._size += len(line.encode("utf-8"))
+                if self.max_bytes and self._size >= self.max_bytes:
+                    self._rotate()
+            self._file.flush()
+        except Exception as e:
+            # The scanner (and this thread) keep running without the log file
+            print(f"⚠ Error writing {self.path}: {e}")
+
+    def _archive(self, number: int) -> Path:
+        return self.path.with_name(f"{self.path.name}.{number}.gz")
+
+    def _rotate(self) -> None:
+        """
+        Compress the full file to name.1.gz and start a new one.
+
+        If that fails, logging continues in the same file and the rotation is
+        tried again once another `max_bytes` have been written.
+        """
+        self._file.close()
+
+        try:
+            oldest: Path = self._archive(self.backup_count)
+            if oldest.exists():
+                oldest.unlink()
+            for number in range(self.backup_count - 1, 0, -1):
+                if self._archive(number).exists():
+                    os.replace(self._archive(number), self._archive(number + 1))
+
+            if self.backup_count > 0:
+                with open(self.path, "rb") as source, gzip.open(
+                    self._archive(1), "wb"
+                ) as target:
+                    shutil.copyfileobj(source, target)
+            self.path.unlink()
+        except OSError as e:
+            print(f"⚠ Error rotating {self.path}: {e}")
+
+        self._size = 0
+        self._file = self._open()
@@ -0,0 +1,373 @@
+# Built-in Modules
+import getpass
+import json
+import sys
+from argparse import Namespace
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Core Modules
+from core.command_chain import ChainExecutor, StepResult, parse_chain
+from core.command_registry import CommandError, CommandRegistry, build_registry
+from core.wifi_snapshot import read_fresh_snapshot
+
+# Exit codes
+EXIT_OK: int = 0  # every step that ran succeeded
+EXIT_FAILED: int = 1  # the last step that ran failed
+EXIT_USAGE: int = 2  # the command line is invalid or a command is unknown
+EXIT_INTERRUPTED: int = 130  # Ctrl+C
+
+REFRESH_MAX_AGE: float = 5.0  # seconds a scanner snapshot is listed without a scan
+
+# The system commands and the helpers they run, imported only when used
+_SYSTEM_COMMANDS: Dict[str, str] = {
+    "shutdown": "shutdown",
+    "reboot": "reboot",
+    "sleep": "sleep",
+    "hibernate": "hibernate",
+    "lock": "lock_or_logout",
+}
+
+
+class HeadlessSession:
+    """
+    Runs command lines with the command bar's registry, without a window.
+
+    Commands that only make sense in the window (quit, filter, sort and the
+    Wi-Fi manager) are reported as unavailable. Nothing here imports Qt
+    widgets, qtawesome or the styles, and the Wi-Fi interface is only opened
+    by commands that need it, so "help" starts without touching pywifi.
+    """
+
+    def __init__(self, *, assume_yes: bool = False, echo: bool = True) -> None:
+        """
+        Initialize the session.
+
+        Args:
+            assume_yes: Run commands that need confirmation (shutdown, ...)
+            echo: Print each command's output as it finishes (text mode)
+        """
+        self.assume_yes: bool = assume_yes
+        self.echo: bool = echo
+        self.outputs: List[Dict[str, Any]] = []
+        self.usage_error: bool = False
+        self._command: str = ""  # the command being run, as typed
+        self._connector = None
+
+        handlers: Dict[str, Callable[..., bool]] = {
+            "connect": self._connect,
+            "disconnect": self._disconnect,
+            "refresh": self._refresh,
+            "help": self._help,
+        }
+        for name, helper in _SYSTEM_COMMANDS.items():
+            handlers[name] = lambda _, helper=helper: self._system(helper)
+        self.registry: CommandRegistry = build_registry(handlers)
+
+    @property
+    def connector(self):
+        """
+        The WiFiConnector, created (and pywifi loaded) on first use.
+
+        Raises:
+            NoWirelessInterface: If there is no Wi-Fi interface to use
+        """
+        if self._connector is None:
+            # Core Modules
+            from core.wifi_connect import WiFiConnector
+
+            self._connector = WiFiConnector()
+        return self._connector
+
+    def run(self, command_line: str) -> Dict[str, Any]:
+        """
+        Run a command line, chain operators included, to completion.
+
+        Args:
+            command_line: e.g. "disconnect && connect Office"
+
+        Returns:
+            dict: "ok", "exit_code", "total" (seconds), "steps" and "outputs"
+        """
+        self.outputs = []
+        self.usage_error = False
+        finished: Dict[str, Any] = {}
+
+        try:
+            steps = parse_chain(command_line)
+        except CommandError as e:
+            self.usage_error = True
+            self._report(command_line, False, str(e))
+            steps = []
+
+        if steps:
+            # Every command finishes before its callback, so each step can
+            # start right away instead of from an event loop
+            ChainExecutor(
+                steps,
+                self.execute_command,
+                lambda results, total: finished.update(results=results, total=total),
+                defer=lambda callback: callback(),
+            ).start()
+
+        results: List[StepResult] = finished.get("results", [])
+        ran: List[StepResult] = [result for result in results if not result.skipped]
+        ok: bool = bool(ran) and ran[-1].ok and not self.usage_error
+        if self.usage_error:
+            exit_code: int = EXIT_USAGE
+        else:
+            exit_code = EXIT_OK if ok else EXIT_FAILED
+
+        return {
+            "ok": ok,
+            "exit_code": exit_code,
+            "total": round(finished.get("total", 0.0), 3),
+            "steps": [
+                {
+                    "commands": list(result.commands),
+                    "ok": result.ok,
+                    "skipped": result.skipped,
+                    "seconds": round(result.seconds, 3),
+                }
+                for result in results
+            ],
+            "outputs": self.outputs,
+        }
+
+    def execute_command(
+        self, command: str, on_done: Optional[Callable[[bool], None]] = None
+    ) -> bool:
+        """
+        Execute a single command and return whether it was successful.
+
+        Args:
+            command: The command to execute
+            on_done: Called with the outcome once the command has finished
+
+        Returns:
+            bool: True if the command succeeded
+        """
+        on_done = on_done or (lambda ok: None)
+        self._command = command.strip()
+        try:
+            spec, args = self.registry.parse(command)
+        except CommandError as e:
+            self.usage_error = True
+            on_done(self._report(self._command, False, str(e)))
+            return False
+
+        if spec.confirm and not self.assume_yes:
+            self.usage_error = True
+            on_done(
+                self._report(
+                    self._command,
+                    False,
+                    f"'{spec.name}' needs confirmation: pass --yes",
+                )
+            )
+            return False
+
+        return self.registry.run(spec, args, on_done)
+
+    def _report(self, command: str, ok: bool, message: str, **details: Any) -> bool:
+        """Records (and in text mode prints) the output of a command."""
+        self.outputs.append(
+            {"command": command, "ok": ok, "message": message, **details}
+        )
+        if self.echo:
+            print(message if ok else f"error: {message}")
+        return ok
+
+    def _connect(self, args: str, on_done: Callable[[bool], None]) -> bool:
+        """Connects on this thread; passwords are read from the terminal."""
+        # Core Modules
+        from core.wifi_connect import (
+            ConnectionAttempt,
+            NoWirelessInterface,
+            parse_connect_args,
+        )
+
+        ssids, force = parse_connect_args(args)
+        if not ssids:
+            self.usage_error = True
+            self._report(
+                self._command,
+                False,
+                f"Missing argument. Usage: {self.registry.get('connect').usage}",
+            )
+            return False
+
+        try:
+            connector = self.connector
+        except NoWirelessInterface as e:
+            self._report(self._command, False, str(e), error_class="no_interface")
+            return False
+
+        attempt: ConnectionAttempt = connector.connect_any(
+            ssids, request_password=self._ask_password, force=force
+        )
+        message: str = attempt.message
+        if attempt.timings:
+            message += f" ({attempt.format_timings()})"
+        on_done(
+            self._report(
+                self._command,
+                attempt.succeeded,
+                message,
+                ssid=attempt.ssid,
+                status=attempt.status,
+                error_class=attempt.error_class,
+                timings={
+                    phase: round(seconds, 3)
+                    for phase, seconds in attempt.timings.items()
+                },
+            )
+        )
+        return True
+
+    @staticmethod
+    def _ask_password(ssid: str) -> Optional[str]:
+        """Prompts for a password on a terminal; None when input is piped."""
+        if not sys.stdin.isatty():
+            return None
+        return getpass.getpass(f"Password for {ssid}: ") or None
+
+    def _disconnect(self, _: str) -> bool:
+        # Core Modules
+        from core.wifi_disconnect import disconnect_interface
+
+        ok, message = disconnect_interface()
+        return self._report(self._command, ok, message)
+
+    def _refresh(self, _: str) -> bool:
+        """Lists the networks of a fresh scanner snapshot, or scans for them."""
+        snapshot: Optional[Dict] = read_fresh_snapshot(REFRESH_MAX_AGE)
+        if snapshot is not None:
+            source: str = "snapshot"
+            networks: List[Dict[str, Any]] = [
+                {"ssid": item["ssid"], "strength": item.get("strength")}
+                for item in snapshot["networks"]
+            ]
+        else:
+            # Core Modules
+            from core.wifi_connect import NoWirelessInterface
+
+            source = "scan"
+            try:
+                results = self.connector.scan_networks()
+            except NoWirelessInterface as e:
+                return self._report(
+                    self._command, False, str(e), error_class="no_interface"
+                )
+            except Exception as e:
+                return self._report(self._command, False, f"Scan failed: {e}")
+
+            # Percentages, like the scanner's snapshot
+            strongest: Dict[str, int] = {}
+            for network in results:
+                if network.ssid:
+                    strength: int = min(max(0, (network.signal + 100) * 2), 100)
+                    strongest[network.ssid] = max(
+                        strength, strongest.get(network.ssid, strength)
+                    )
+            networks = [
+                {"ssid": ssid, "strength": signal}
+                for ssid, signal in sorted(strongest.items(), key=lambda x: -x[1])
+            ]
+
+        lines: List[str] = [f"{len(networks)} networks (from {source})"]
+        lines += [f"    {network['ssid']}" for network in networks]
+        return self._report(
+            self._command, True, "\n".join(lines), source=source, networks=networks
+        )
+
+    def _help(self, args: str) -> bool:
+        try:
+            text: str = self.registry.help_text(args or None)
+        except CommandError as e:
+            self.usage_error = True
+            return self._report(self._command, False, str(e))
+        return self._report(self._command, True, text)
+
+    def _system(self, helper: str) -> bool:
+        # Helpers Modules
+        import helpers
+
+        getattr(helpers, helper)()
+        return self._report(self._command, True, f"{self._command} requested")
+
+
+def format_summary(result: Dict[str, Any]) -> str:
+    """Returns the per-step and total wall time of a run on one line."""
+    parts: List[str] = []
+    for step in result["steps"]:
+        text: str = " & ".join(step["commands"])
+        if step["skipped"]:
+            parts.append(f"{text} skipped")
+        else:
+            parts.append(
+                f"{text} {'ok' if step['ok'] else 'failed'} {step['seconds']:.2f}s"
+            )
+    return " · ".join(parts + [f"total {result['total']:.2f}s"])
+
+
+def run_headless(command_line: str, *, as_json: bool = False, yes: bool = False) -> int:
+    """
+    Run a command line without a window and print its results.
+
+    Args:
+        command_line: The commands to run, chain operators included
+        as_json: Print one JSON document instead of text
+        yes: Run commands that need confirmation
+
+    Returns:
+        int: The exit code (EXIT_OK, EXIT_FAILED or EXIT_USAGE)
+    """
+    session = HeadlessSession(assume_yes=yes, echo=not as_json)
+    try:
+        result: Dict[str, Any] = session.run(command_line)
+    except KeyboardInterrupt:
+        if not as_json:
+            print("Interrupted.")
+        return EXIT_INTERRUPTED
+
+    if as_json:
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+    elif len(result["steps"]) > 1:
+        print(format_summary(result))
+    return result["exit_code"]
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="Run Wi-Fi Center commands without opening the window"
+    )
+    parser.add_argument(
+        "--exec",
+        help='The commands to run, e.g. "disconnect && connect Office"',
+        required=True,
+        metavar="COMMANDS",
+    )
+    parser.add_argument("--json", help="Print the results as JSON", action="store_true")
+    parser.add_argument(
+        "-y",
+        "--yes",
+        help="Run commands that need confirmation (shutdown, reboot, ...)",
+        action="store_true",
+    )
+    try:
+        args: Namespace = parser.parse_args(argv)
+    except SystemExit as e:
+        return EXIT_USAGE if e.code else EXIT_OK
+
+    return run_headless(args.exec, as_json=args.json, yes=args.yes)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,141 @@
+# Built-in Modules
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+# PyQt6 Modules
+from PyQt6.QtCore import QRect, QSize, Qt
+from PyQt6.QtGui import QPainter, QPixmap
+
+# Constants
+ICON_CACHE_DIR: Path = Path(__file__).parent / "icon_cache"
+
+# A glyph is (qtawesome icon name, color, logical size in pixels)
+Glyph = Tuple[str, str, int]
+
+
+def glyph_key(name: str, color: str, size: int, dpr: float) -> str:
+    """Returns the cache key of a glyph rendered at the given device pixel ratio."""
+    return f"{name}|{color}|{size}|{dpr:g}"
+
+
+class IconAtlas:
+    """
+    A set of glyphs rendered once per device pixel ratio into a single pixmap.
+
+    The atlas image and an index of glyph rectangles are cached on disk. When a
+    cached atlas covers every requested glyph it is loaded directly and
+    qtawesome (and its icon fonts) is never imported.
+    """
+
+    def __init__(
+        self, glyphs: List[Glyph], dpr: float, cache_dir: Path = ICON_CACHE_DIR
+    ) -> None:
+        """
+        Loads the atlas from disk, rendering and saving it if necessary.
+
+        Args:
+            glyphs: The glyphs the atlas must contain
+            dpr: The device pixel ratio to render at
+            cache_dir: The directory holding cached atlases
+        """
+        self.dpr: float = dpr
+        self.keys: List[str] = [glyph_key(*glyph, dpr) for glyph in glyphs]
+        self.pixmaps: Dict[str, QPixmap] = {}
+
+        # One file per glyph set and DPR, so changing a color never reuses stale art
+        digest: str = hashlib.sha1("\n".join(self.keys).encode()).hexdigest()[:12]
+        self.image_path: Path = cache_dir / f"atlas@{dpr:g}x-{digest}.png"
+        self.index_path: Path = self.image_path.with_suffix(".json")
+
+        if not self._load():
+            self._render(glyphs)
+            self._save()
+
+    def pixmap(self, name: str, color: str, size: int) -> QPixmap:
+        """
+        Returns the pre-rendered pixmap of a glyph.
+
+        Args:
+            name: The qtawesome icon name
+            color: The icon color
+            size: The logical size in pixels
+
+        Returns:
+            The glyph's pixmap, with its device pixel ratio already set
+        """
+        return self.pixmaps[glyph_key(name, color, size, self.dpr)]
+
+    def _load(self) -> bool:
+        """Loads the atlas from disk, returning False if it is missing or stale."""
+        try:
+            with open(self.index_path, "r") as f:
+                index: Dict[str, List[int]] = json.load(f)
+        except (OSError, ValueError):
+            return False
+
+        if any(key not in index for key in self.keys):
+            return False
+
+        atlas = QPixmap(str(self.image_path))
+        if atlas.isNull():
+            return False
+
+        for key in self.keys:
+            glyph: QPixmap = atlas.copy(QRect(*index[key]))
+            glyph.setDevicePixelRatio(self.dpr)
+            self.pixmaps[key] = glyph
+
+        self.atlas: QPixmap = atlas
+        self.index: Dict[str, List[int]] = index
+        return True
+
+    def _render(self, glyphs: List[Glyph]) -> None:
+        """Renders every glyph with qtawesome and packs them into one row."""
+        import qtawesome as qta
+
+        rendered: List[QPixmap] = []
+        for name, color, size in glyphs:
+            glyph: QPixmap = qta.icon(name, color=color).pixmap(
+                QSize(size, size), self.dpr
+            )
+            glyph.setDevicePixelRatio(self.dpr)
+            rendered.append(glyph)
+
+        width: int = sum(glyph.width() for glyph in rendered)
+        height: int = max((glyph.height() for glyph in rendered), default=0)
+
+        self.atlas = QPixmap(max(width, 1), max(height, 1))
+        self.atlas.fill(Qt.GlobalColor.transparent)
+        self.index = {}
+
+        painter = QPainter(self.atlas)
+        x = 0
+        for key, glyph in zip(self.keys, rendered):
+            # Draw in device pixels so rectangles in the index are exact
+            device_glyph: QPixmap = QPixmap(glyph)
+            device_glyph.setDevicePixelRatio(1.0)
+            painter.drawPixmap(x, 0, device_glyph)
+
+            self.index[key] = [x, 0, glyph.width(), glyph.height()]
+            self.pixmaps[key] = glyph
+            x += glyph.width()
+        painter.end()
+
+    def _save(self) -> None:
+        """Writes the atlas and its index to the cache directory."""
+        try:
+            self.image_path.parent.mkdir(parents=True, exist_ok=True)
+
+            temp_image: Path = self.image_path.with_name(self.image_path.name + ".tmp")
+            if not self.atlas.save(str(temp_image), "PNG"):
+                return
+            os.replace(temp_image, self.image_path)
+
+            # The index is written last; it marks the atlas as complete
+            with open(self.index_path, "w") as f:
+                json.dump(self.index, f)
+        except OSError as e:
+            print(f"Could not cache icon atlas: {e}")
@@ -0,0 +1,208 @@
+# Built-in Modules
+import bisect
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Deque, Dict, Iterator, List, Tuple
+
+# Core Modules
+from core.association import percentile
+
+# Constants
+# Upper bounds of the histogram buckets, in seconds
+DEFAULT_BUCKETS: Tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+)
+ROLLING_WINDOW: int = 200  # recent samples kept for the percentiles shown
+
+
+class RollingHistogram:
+    """
+    Latency samples as a cumulative histogram plus a window of recent ones.
+
+    The bucket counts, sum and count only grow, as the text exposition format
+    expects; the window of the last `window` samples gives the current
+    percentiles shown in the UI.
+    """
+
+    def __init__(
+        self, buckets: Tuple[float, ...] = DEFAULT_BUCKETS, window: int = ROLLING_WINDOW
+    ) -> None:
+        self.buckets: Tuple[float, ...] = buckets
+        self.bucket_counts: List[int] = [0] * len(buckets)  # not cumulative
+        self.count: int = 0
+        self.sum: float = 0.0
+        self.last: float = 0.0
+        self.recent: Deque[float] = deque(maxlen=window)
+
+    def observe(self, seconds: float) -> None:
+        """Add a sample."""
+        index: int = bisect.bisect_left(self.buckets, seconds)
+        if index < len(self.buckets):
+            self.bucket_counts[index] += 1
+        self.count += 1
+        self.sum += seconds
+        self.last = seconds
+        self.recent.append(seconds)
+
+    def percentile(self, fraction: float) -> float:
+        """A percentile of the recent samples (0 if there are none)."""
+        return percentile(list(self.recent), fraction) if self.recent else 0.0
+
+    def exposition(self, name: str, labels: str = "") -> List[str]:
+        """The _bucket, _sum and _count lines of the text exposition format."""
+        prefix: str = f"{labels}," if labels else ""
+        lines: List[str] = []
+        cumulative: int = 0
+        for bound, count in zip(self.buckets, self.bucket_counts):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{prefix}le="{bound:g}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{prefix}le="+Inf"}} {self.count}')
+        suffix: str = f"{{{labels}}}" if labels else ""
+        lines.append(f"{name}_sum{suffix} {self.sum:.6f}")
+        lines.append(f"{name}_count{suffix} {self.count}")
+        return lines
+
+
+class PhaseMetrics:
+    """
+    Per-phase timings of a repeated operation, with counters and gauges.
+
+    Safe to use from several threads (e.g. the scan loop and a manual scan).
+    """
+
+    def __init__(self, namespace: str, phases: Tuple[str, ...] = ()) -> None:
+        """
+        Initialize the metrics.
+
+        Args:
+            namespace: The prefix of the exported metric names
+            phases: Phases listed up front, in the order they run; others are
+                added when first recorded
+        """
+        self.namespace: str = namespace
+        self.phases: Dict[str, RollingHistogram] = {
+            phase: RollingHistogram() for phase in phases
+        }
+        self.counters: Dict[str, int] = {}
+        self.gauges: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, phase: str, seconds: float) -> None:
+        """Record how long a phase took."""
+        with self._lock:
+            if phase not in self.phases:
+                self.phases[phase] = RollingHistogram()
+            self.phases[phase].observe(seconds)
+
+    @contextmanager
+    def phase(self, phase: str) -> Iterator[None]:
+        """Time the body of a with statement as a phase (even if it raises)."""
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(phase, time.perf_counter() - start)
+
+    def increment(self, counter: str, amount: int = 1) -> None:
+        """Add to a counter, e.g. "cycles" or "errors"."""
+        with self._lock:
+            self.counters[counter] = self.counters.get(counter, 0) + amount
+
+    def set_gauge(self, gauge: str, value: float) -> None:
+        """Set a gauge, e.g. the number of networks in the last scan."""
+        with self._lock:
+            self.gauges[gauge] = value
+
+    def format_table(self) -> str:
+        """The phases as a plain-text table of recent latencies, in ms."""
+        with self._lock:
+            lines: List[str] = [
+                f"{'phase (ms)':<14}{'count':>7}{'last':>9}{'p50':>9}{'p95':>9}"
+            ]
+            for phase, histogram in self.phases.items():
+                lines.append(
+                    f"{phase:<14}{histogram.count:>7}"
+                    f"{histogram.last * 1000:>9.1f}"
+                    f"{histogram.percentile(0.5) * 1000:>9.1f}"
+                    f"{histogram.percentile(0.95) * 1000:>9.1f}"
+                )
+            totals: List[str] = [
+                f"{name} {value}" for name, value in sorted(self.counters.items())
+            ] + [f"{name} {value:g}" for name, value in sorted(self.gauges.items())]
+        if totals:
+            lines.append(" · ".join(totals))
+        return "\n".join(lines)
+
+    def exposition(self) -> str:
+        """Every metric in the Prometheus text exposition format."""
+        name: str = f"{self.namespace}_phase_seconds"
+        with self._lock:
+            lines: List[str] = [
+                f"# HELP {name} Time spent in each phase.",
+                f"# TYPE {name} histogram",
+            ]
+            for phase, histogram in self.phases.items():
+                lines += histogram.exposition(name, f'phase="{phase}"')
+            for counter, value in sorted(self.counters.items()):
+                lines += [
+                    f"# TYPE {self.namespace}_{counter}_total counter",
+                    f"{self.namespace}_{counter}_total {value}",
+                ]
+            for gauge, value in sorted(self.gauges.items()):
+                lines += [
+                    f"# TYPE {self.namespace}_{gauge} gauge",
+                    f"{self.namespace}_{gauge} {value:g}",
+                ]
+        return "\n".join(lines) + "\n"
+
+
+def serve_metrics(metrics: PhaseMetrics, port: int, host: str = "127.0.0.1") -> Any:
+    """
+    Serve the metrics at http://host:port/metrics from a background thread.
+
+    Args:
+        metrics: The metrics to serve
+        port: The port to listen on
+        host: The address to listen on; local only by default
+
+    Returns:
+        ThreadingHTTPServer: The server (call shutdown() to stop it)
+
+    Raises:
+        OSError: If the port cannot be bound
+    """
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+    class MetricsHandler(BaseHTTPRequestHandler):
+        def do_GET(self) -> None:
+            if self.path.split("?")[0] != "/metrics":
+                self.send_error(404)
+                return
+            body: bytes = metrics.exposition().encode("utf-8")
+            self.send_response(200)
+            self.send_header("Content-Type", "text/plain; version=0.0.4")
+            self.send_header("Content-Length", str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, format: str, *args) -> None:
+            pass  # scrapes are not logged
+
+    server = ThreadingHTTPServer((host, port), MetricsHandler)
+    threading.Thread(
+        target=server.serve_forever, name="metrics-server", daemon=True
+    ).start()
+    return server
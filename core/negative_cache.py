@@ -0,0 +1,133 @@
+# Built-in Modules
+import hashlib
+import hmac
+import os
+import threading
+import time
+from typing import Dict, NamedTuple, Optional, Tuple
+
+# How long each kind of failure is remembered, in seconds. Failures not listed
+# here (cancellations, invalid names, unexpected errors) are never cached.
+NEGATIVE_TTLS: Dict[str, float] = {
+    "not_found": 15.0,
+    "association_timeout": 60.0,
+    "association_failed": 300.0,  # usually a wrong password
+    "verify_failed": 60.0,
+}
+
+# Shorter limits for failures where no password was entered (a saved profile
+# or an open network): nothing the user types can change the next attempt,
+# so it is only held back briefly
+NO_CREDENTIAL_TTLS: Dict[str, float] = {
+    "association_failed": 15.0,
+}
+
+
+class NegativeEntry(NamedTuple):
+    """A remembered failure."""
+
+    error_class: str
+    message: str
+    failed_at: float
+    expires_at: float
+
+
+class NegativeCache:
+    """
+    Remembers failed connection attempts for a short while.
+
+    Entries are keyed by SSID and a fingerprint of the credential that was
+    used. The fingerprint is an HMAC with a key generated for this process, so
+    passwords are never stored and fingerprints mean nothing outside of it.
+    Failures that do not depend on a password are stored with an empty
+    fingerprint.
+    """
+
+    def __init__(
+        self,
+        ttls: Dict[str, float] = NEGATIVE_TTLS,
+        no_credential_ttls: Dict[str, float] = NO_CREDENTIAL_TTLS,
+    ) -> None:
+        """
+        Initialize an empty cache.
+
+        Args:
+            ttls: Seconds to remember each error class for
+            no_credential_ttls: Overrides of `ttls` for failures where no
+                credential was used
+        """
+        self.ttls: Dict[str, float] = ttls
+        self.no_credential_ttls: Dict[str, float] = no_credential_ttls
+        self._key: bytes = os.urandom(32)
+        self._entries: Dict[Tuple[str, str], NegativeEntry] = {}
+        self._lock = threading.Lock()
+
+    def fingerprint(self, credential: Optional[str]) -> str:
+        """Return the keyed fingerprint of a credential ("" for none)."""
+        if not credential:
+            return ""
+        return hmac.new(self._key, credential.encode(), hashlib.sha256).hexdigest()
+
+    def check(
+        self, ssid: str, credential: Optional[str] = None
+    ) -> Optional[NegativeEntry]:
+        """
+        Look up a recent failure.
+
+        Args:
+            ssid: The name of the network
+            credential: The password about to be used, if any
+
+        Returns:
+            NegativeEntry: The remembered failure, or None if there is none
+        """
+        key: Tuple[str, str] = (ssid, self.fingerprint(credential))
+        with self._lock:
+            entry: Optional[NegativeEntry] = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return entry
+
+    def remember(
+        self,
+        ssid: str,
+        credential: Optional[str],
+        error_class: Optional[str],
+        message: str,
+    ) -> None:
+        """
+        Store a failure if its error class is cacheable.
+
+        Args:
+            ssid: The name of the network
+            credential: The password that was used, if any
+            error_class: The error class of the failed attempt
+            message: The message shown for the failure
+        """
+        ttl: Optional[float] = self.ttls.get(error_class or "")
+        if not credential:
+            ttl = self.no_credential_ttls.get(error_class or "", ttl)
+        if ttl is None:
+            return
+
+        now: float = time.monotonic()
+        with self._lock:
+            self._entries[(ssid, self.fingerprint(credential))] = NegativeEntry(
+                error_class, message, now, now + ttl
+            )
+
+    def forget(self, ssid: str) -> None:
+        """Drop every failure remembered for a network (e.g. after a success)."""
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == ssid]:
+                del self._entries[key]
+
+    @staticmethod
+    def explain(ssid: str, entry: NegativeEntry) -> str:
+        """Return a user-facing explanation for failing fast on an entry."""
+        now: float = time.monotonic()
+        return (
+            f"{entry.message} (failed {now - entry.failed_at:.0f}s ago; "
+            f"not retrying {ssid} for {entry.expires_at - now:.0f}s, use --force to retry now)"
+        )
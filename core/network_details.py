@@ -0,0 +1,64 @@
+# Built-in Modules
+from typing import List, Tuple
+
+# PyWiFi Modules
+from pywifi import const
+
+# Security labels, strongest first
+_SECURITY_LABELS: List[Tuple[int, str]] = [
+    (const.AKM_TYPE_WPA2, "WPA2-Enterprise"),
+    (const.AKM_TYPE_WPA2PSK, "WPA2-Personal"),
+    (const.AKM_TYPE_WPA, "WPA-Enterprise"),
+    (const.AKM_TYPE_WPAPSK, "WPA-Personal"),
+    (const.AKM_TYPE_NONE, "Open"),
+]
+
+
+def describe_security(akm: List[int]) -> str:
+    """
+    Returns a short label for the strongest key management a network offers.
+
+    Args:
+        akm: The network's list of AKM types (pywifi.const.AKM_TYPE_*)
+
+    Returns:
+        str: A label such as "WPA2-Personal" or "Open"
+    """
+    if not akm:
+        return "Open"
+
+    for akm_type, label in _SECURITY_LABELS:
+        if akm_type in akm:
+            return label
+
+    return "Other"
+
+
+def describe_frequency(freq: int) -> Tuple[int, int, str]:
+    """
+    Converts a reported center frequency into MHz, channel number and band.
+
+    Windows reports the frequency in kHz while wpa_supplicant reports MHz; both
+    are accepted.
+
+    Args:
+        freq: The center frequency as reported by pywifi
+
+    Returns:
+        tuple: (frequency in MHz, channel, band label), with channel 0 and an
+        empty band if the frequency is unknown
+    """
+    mhz: int = int(freq or 0)
+    if mhz > 100000:
+        mhz //= 1000
+
+    if mhz == 2484:
+        return (mhz, 14, "2.4 GHz")
+    if 2400 <= mhz < 2500:
+        return (mhz, (mhz - 2407) // 5, "2.4 GHz")
+    if 5000 <= mhz < 5925:
+        return (mhz, (mhz - 5000) // 5, "5 GHz")
+    if 5925 <= mhz <= 7125:
+        return (mhz, (mhz - 5950) // 5, "6 GHz")
+
+    return (mhz, 0, "")
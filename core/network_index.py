@@ -0,0 +1,101 @@
+# Built-in Modules
+from typing import Dict, Iterable, Set
+
+
+def fuzzy_contains(name: str, query: str) -> bool:
+    """
+    Check if every character of the query appears in the name, in order.
+
+    Args:
+        name: The casefolded text to search in
+        query: The casefolded query
+
+    Returns:
+        bool: True if the query is a subsequence of the name
+    """
+    remaining = iter(name)
+    return all(char in remaining for char in query)
+
+
+class NetworkIndex:
+    """
+    An incremental type-to-filter index over network names.
+
+    Matching is by substring and, optionally, by fuzzy subsequence. Both are
+    narrowing: anything matching a longer query also matches its prefix. When the
+    user keeps typing, only the previous matches are re-tested, and when the
+    scanner updates the list, only added names are tested against the query.
+    """
+
+    def __init__(self, *, fuzzy: bool = True) -> None:
+        """
+        Initialize an empty index.
+
+        Args:
+            fuzzy: If True, subsequence matches are accepted besides substrings
+        """
+        self.fuzzy: bool = fuzzy
+        self.query: str = ""
+        self._names: Dict[str, str] = {}  # ssid -> casefolded ssid
+        self._matches: Set[str] = set()
+
+    def _test(self, folded_name: str, query: str) -> bool:
+        """Check a single casefolded name against a casefolded query."""
+        if query in folded_name:
+            return True
+        return self.fuzzy and fuzzy_contains(folded_name, query)
+
+    def update(self, ssids: Iterable[str]) -> None:
+        """
+        Replace the indexed names, testing only those that were not indexed yet.
+
+        Args:
+            ssids: Every network name currently in the list
+        """
+        current: Set[str] = set(ssids)
+
+        for ssid in self._names.keys() - current:
+            del self._names[ssid]
+            self._matches.discard(ssid)
+
+        for ssid in current - self._names.keys():
+            folded: str = ssid.casefold()
+            self._names[ssid] = folded
+            if self.query and self._test(folded, self.query):
+                self._matches.add(ssid)
+
+    def set_query(self, query: str) -> Set[str]:
+        """
+        Change the filter text.
+
+        Args:
+            query: The text typed by the user
+
+        Returns:
+            The set of matching network names (every name if the query is empty)
+        """
+        query = query.strip().casefold()
+
+        if not query:
+            self.query = ""
+            self._matches = set()
+            return set(self._names)
+
+        # Narrowing the previous query only needs to re-test its matches
+        if self.query and query.startswith(self.query):
+            candidates: Iterable[str] = self._matches
+        else:
+            candidates = self._names
+
+        self._matches = {
+            ssid for ssid in candidates if self._test(self._names[ssid], query)
+        }
+        self.query = query
+        return set(self._matches)
+
+    def accepts(self, ssid: str) -> bool:
+        """Check if a network name passes the current filter."""
+        return not self.query or ssid in self._matches
+
+    def __len__(self) -> int:
+        return len(self._names)
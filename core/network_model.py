@@ -0,0 +1,347 @@
+# Built-in Modules
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# PyQt6 Modules
+from PyQt6.QtCore import (
+    QAbstractTableModel,
+    QModelIndex,
+    QObject,
+    QRect,
+    QSortFilterProxyModel,
+    Qt,
+)
+from PyQt6.QtGui import QColor, QFont, QFontMetrics, QPainter
+from PyQt6.QtWidgets import (
+    QApplication,
+    QStyle,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
+    QTableView,
+    QWidget,
+)
+
+# Core Modules
+from core.network_index import NetworkIndex
+from core.wifi_networks import get_cached_wifi_pixmap, get_lock_pixmap
+from core.wifi_snapshot import NetworkEntry
+
+# Group order of the "security" sort mode
+_SECURITY_ORDER: Dict[str, int] = {
+    "Open": 0,
+    "WPA2-Personal": 1,
+    "WPA-Personal": 2,
+    "WPA2-Enterprise": 3,
+    "WPA-Enterprise": 4,
+    "Other": 5,
+}
+
+# Sort modes: a key per network, and whether larger keys come first
+SORT_MODES: Dict[str, Tuple[Callable[[NetworkEntry], Tuple], bool]] = {
+    "strength": (lambda n: (-n.strength, n.ssid.casefold()), False),
+    "name": (lambda n: (n.ssid.casefold(), -n.strength), False),
+    "security": (
+        lambda n: (_SECURITY_ORDER.get(n.security, 6), -n.strength),
+        False,
+    ),
+    "band": (lambda n: (not n.band, n.band, n.channel, -n.strength), False),
+    "last-seen": (lambda n: (n.last_seen, n.strength), True),
+}
+
+SORT_MODE_ALIASES: Dict[str, str] = {
+    "signal": "strength",
+    "ssid": "name",
+    "channel": "band",
+    "seen": "last-seen",
+    "last_seen": "last-seen",
+}
+
+
+class NetworkTableModel(QAbstractTableModel):
+    """
+    The list of scanned networks, one row per SSID.
+
+    Updates are applied as a diff against the current rows, so views and proxies
+    only see the rows that were actually added, removed or changed.
+    """
+
+    HEADERS: List[str] = ["Network Name", "Signal Strength"]
+    BATCH_CHANGE_THRESHOLD: int = 32
+
+    SsidRole: int = Qt.ItemDataRole.UserRole
+    StrengthRole: int = Qt.ItemDataRole.UserRole + 1
+    RequiresLoginRole: int = Qt.ItemDataRole.UserRole + 2
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self._rows: List[NetworkEntry] = []
+        self._row_of: Dict[str, int] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(
+        self,
+        section: int,
+        orientation: Qt.Orientation,
+        role: int = Qt.ItemDataRole.DisplayRole,
+    ) -> Any:
+        if (
+            orientation == Qt.Orientation.Horizontal
+            and role == Qt.ItemDataRole.DisplayRole
+        ):
+            return self.HEADERS[section]
+        return None
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+
+        network: NetworkEntry = self._rows[index.row()]
+        ssid, strength, requires_login = network[:3]
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return ssid if index.column() == 0 else f"{strength}%"
+        if role == Qt.ItemDataRole.ToolTipRole and index.column() == 0:
+            return ssid
+        if role == self.SsidRole:
+            return ssid
+        if role == self.StrengthRole:
+            return strength
+        if role == self.RequiresLoginRole:
+            return requires_login
+        return None
+
+    def network(self, row: int) -> NetworkEntry:
+        """Returns the network shown in a source row."""
+        return self._rows[row]
+
+    def set_networks(self, networks: List[NetworkEntry]) -> None:
+        """
+        Applies a new list of networks as a diff against the current rows.
+
+        Args:
+            networks: A list of NetworkEntry rows
+        """
+        incoming: Dict[str, NetworkEntry] = {
+            network.ssid: network for network in networks
+        }
+
+        # Remove vanished networks, one contiguous block at a time from the end
+        row: int = len(self._rows) - 1
+        while row >= 0:
+            if self._rows[row].ssid in incoming:
+                row -= 1
+                continue
+            last: int = row
+            while row >= 0 and self._rows[row].ssid not in incoming:
+                row -= 1
+            self.beginRemoveRows(QModelIndex(), row + 1, last)
+            del self._rows[row + 1 : last + 1]
+            self.endRemoveRows()
+
+        self._row_of = {network.ssid: row for row, network in enumerate(self._rows)}
+
+        # Update changed networks in place
+        changed: List[int] = []
+        for ssid, row in self._row_of.items():
+            network: NetworkEntry = incoming[ssid]
+            if network != self._rows[row]:
+                self._rows[row] = network
+                changed.append(row)
+
+        # A few changes are re-sorted row by row; a full refresh in one batch
+        last_column: int = self.columnCount() - 1
+        if len(changed) > self.BATCH_CHANGE_THRESHOLD:
+            self.dataChanged.emit(
+                self.index(0, 0), self.index(len(self._rows) - 1, last_column)
+            )
+        else:
+            for row in changed:
+                self.dataChanged.emit(self.index(row, 0), self.index(row, last_column))
+
+        # Append new networks in a single insertion
+        added: List[NetworkEntry] = [
+            network for ssid, network in incoming.items() if ssid not in self._row_of
+        ]
+        if added:
+            first: int = len(self._rows)
+            self.beginInsertRows(QModelIndex(), first, first + len(added) - 1)
+            for offset, network in enumerate(added):
+                self._rows.append(network)
+                self._row_of[network.ssid] = first + offset
+            self.endInsertRows()
+
+
+class NetworkProxyModel(QSortFilterProxyModel):
+    """
+    Filters networks through a NetworkIndex and orders them by a sort mode.
+
+    Sorting is dynamic: when the scanner changes a single row, Qt moves just
+    that row to its new position instead of re-sorting the whole list. Changing
+    the mode only re-sorts the rows already in the model.
+    """
+
+    def __init__(self, index: NetworkIndex, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.network_index: NetworkIndex = index
+        self.sort_mode: str = "strength"
+        self.setDynamicSortFilter(True)
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        ssid: str = self.sourceModel().network(source_row).ssid
+        return self.network_index.accepts(ssid)
+
+    def lessThan(self, left: QModelIndex, right: QModelIndex) -> bool:
+        key, descending = SORT_MODES[self.sort_mode]
+        model: NetworkTableModel = self.sourceModel()
+        left_key: Tuple = key(model.network(left.row()))
+        right_key: Tuple = key(model.network(right.row()))
+        return right_key < left_key if descending else left_key < right_key
+
+    def set_sort_mode(self, mode: str) -> str:
+        """
+        Changes the row order without touching the underlying data.
+
+        Args:
+            mode: A key of SORT_MODES or SORT_MODE_ALIASES
+
+        Returns:
+            The canonical name of the mode that was applied
+
+        Raises:
+            ValueError: If the mode is unknown
+        """
+        mode = SORT_MODE_ALIASES.get(mode, mode)
+        if mode not in SORT_MODES:
+            raise ValueError(f"Unknown sort mode '{mode}'")
+
+        if mode != self.sort_mode:
+            self.sort_mode = mode
+            self.invalidate()
+        return mode
+
+    def set_filter_text(self, text: str) -> None:
+        """Re-filters the rows for the given type-to-filter text."""
+        self.network_index.set_query(text)
+        self.invalidateRowsFilter()
+
+
+class NetworkItemDelegate(QStyledItemDelegate):
+    """Paints network rows directly, instead of creating widgets per cell."""
+
+    TEXT_COLOR = QColor("#ffffff")
+
+    def __init__(self, parent: Optional[QObject] = None) -> None:
+        super().__init__(parent)
+        self.font = QFont("Cambria")
+        self.font.setPixelSize(14)
+        self.font.setWeight(QFont.Weight.Bold)
+        self.metrics = QFontMetrics(self.font)
+
+    def paint(
+        self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex
+    ) -> None:
+        # Let the style draw the item background (hover etc.) without its text
+        background = QStyleOptionViewItem(option)
+        self.initStyleOption(background, index)
+        background.text = ""
+        style: QStyle = (
+            background.widget.style() if background.widget else QApplication.style()
+        )
+        style.drawControl(
+            QStyle.ControlElement.CE_ItemViewItem, background, painter, option.widget
+        )
+
+        rect: QRect = option.rect.adjusted(8, 0, -8, 0)
+        center_y: int = rect.center().y()
+
+        painter.save()
+        painter.setFont(self.font)
+        painter.setPen(self.TEXT_COLOR)
+
+        if index.column() == 0:
+            ssid: str = index.data(NetworkTableModel.SsidRole)
+            requires_login: bool = index.data(NetworkTableModel.RequiresLoginRole)
+
+            lock = get_lock_pixmap() if requires_login else None
+            lock_width: int = (
+                int(lock.width() / lock.devicePixelRatio()) + 6 if lock else 0
+            )
+            text: str = self.metrics.elidedText(
+                ssid, Qt.TextElideMode.ElideRight, rect.width() - lock_width
+            )
+            painter.drawText(
+                rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, text
+            )
+
+            if lock:
+                x: int = rect.left() + self.metrics.horizontalAdvance(text) + 6
+                lock_height = int(lock.height() / lock.devicePixelRatio())
+                painter.drawPixmap(x, center_y - lock_height // 2, lock)
+        else:
+            strength: int = index.data(NetworkTableModel.StrengthRole)
+            icon = get_cached_wifi_pixmap(strength)
+            icon_size = int(icon.width() / icon.devicePixelRatio())
+            text = f"{strength}%"
+
+            width: int = icon_size + 6 + self.metrics.horizontalAdvance(text)
+            x = rect.center().x() - width // 2
+            painter.drawPixmap(x, center_y - icon_size // 2, icon)
+            painter.drawText(
+                QRect(x + icon_size + 6, rect.top(), width, rect.height()),
+                Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+                text,
+            )
+
+        painter.restore()
+
+
+class NetworkTableView(QTableView):
+    """
+    A virtualized, filterable view of the scanned networks.
+
+    Only visible rows are painted, so the view stays responsive with thousands
+    of networks while the scanner keeps publishing updates underneath.
+    """
+
+    def __init__(self, parent: Optional[QWidget] = None) -> None:
+        super().__init__(parent)
+        self.network_index = NetworkIndex()
+        self.network_model = NetworkTableModel(self)
+        self.proxy = NetworkProxyModel(self.network_index, self)
+        self.proxy.setSourceModel(self.network_model)
+
+        self.setModel(self.proxy)
+        self.setItemDelegate(NetworkItemDelegate(self))
+        self.proxy.sort(0, Qt.SortOrder.AscendingOrder)
+
+        self._last_networks: Optional[List[NetworkEntry]] = None
+
+    def set_networks(self, networks: List[NetworkEntry]) -> None:
+        """
+        Shows a new list of networks.
+
+        Args:
+            networks: A list of NetworkEntry rows
+        """
+        # The Wi-Fi cache hands back the same list until a new snapshot arrives
+        if networks is self._last_networks:
+            return
+        self._last_networks = networks
+
+        self.network_index.update(network.ssid for network in networks)
+        self.network_model.set_networks(networks)
+
+    def set_filter_text(self, text: str) -> None:
+        """Shows only the networks matching the type-to-filter text."""
+        self.proxy.set_filter_text(text)
+        self.scrollToTop()
+
+    def set_sort_mode(self, mode: str) -> str:
+        """Orders the networks by the given mode; see NetworkProxyModel."""
+        mode = self.proxy.set_sort_mode(mode)
+        self.scrollToTop()
+        return mode
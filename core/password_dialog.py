@@ -0,0 +1,178 @@
+# Built-in Modules
+import sys
+from functools import lru_cache
+from pathlib import Path
+
+# PyQt6 Modules
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QIcon
+from PyQt6.QtWidgets import (
+    QCheckBox,
+    QDialog,
+    QFrame,
+    QHBoxLayout,
+    QLabel,
+    QLineEdit,
+    QPushButton,
+    QVBoxLayout,
+)
+
+# Helpers Modules
+from helpers import Blur, center_on_screen, get_and_apply_styles
+
+
+class PasswordDialog(QDialog):
+    def __init__(self, ssid, parent=None) -> None:
+        super().__init__(parent)
+        self.ssid = ssid
+        self.password = None
+        self.init_ui()
+
+    def init_ui(self) -> None:
+        # Set window properties
+        self.setWindowTitle("Connect to Wi-Fi Network")
+        self.setFixedSize(400, 250)
+
+        icon_path: Path = (
+            Path(__file__).parent.parent / "assets" / "connect_to_wifi_icon.png"
+        )
+
+        self.setWindowIcon(QIcon(str(icon_path)))
+
+        # Main layout
+        main_layout = QVBoxLayout()
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(15)
+
+        # Network name section
+        wifi_label = QLabel(f"Enter the password for: {self.ssid}")
+
+        # Password section
+        password_label = QLabel("Security key:")
+        password_label.adjustSize()
+
+        self.password_edit = QLineEdit()
+        self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        self.password_edit.setMinimumHeight(30)
+
+        # Show password checkbox
+        self.show_password = QCheckBox("Show password")
+        self.show_password.toggled.connect(self.toggle_password_visibility)
+
+        # Horizontal line separator
+        line = QFrame()
+        line.setFrameShape(QFrame.Shape.HLine)
+        line.setFrameShadow(QFrame.Shadow.Sunken)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.setSpacing(10)
+
+        self.cancel_button = QPushButton("Cancel")
+        self.cancel_button.setMinimumHeight(32)
+        self.cancel_button.setMinimumWidth(80)
+        self.cancel_button.clicked.connect(self.reject)
+
+        self.next_button = QPushButton("Connect")
+        self.next_button.setMinimumHeight(32)
+        self.next_button.setMinimumWidth(80)
+        self.next_button.clicked.connect(self.accept_password)
+        self.next_button.setDefault(True)
+
+        button_layout.addStretch()
+        button_layout.addWidget(self.cancel_button)
+        button_layout.addWidget(self.next_button)
+
+        # Apply styles
+        get_and_apply_styles(
+            script_file=Path(__file__).parent,
+            set_content_funcs={
+                "cancel_button.qss": self.cancel_button.setStyleSheet,
+                "next_button.qss": self.next_button.setStyleSheet,
+                "password_label.qss": password_label.setStyleSheet,
+                "wifi_label.qss": wifi_label.setStyleSheet,
+                "password_edit.qss": self.password_edit.setStyleSheet,
+                "show_password.qss": self.show_password.setStyleSheet,
+                "line.qss": line.setStyleSheet,
+            },
+        )
+
+        # Add widgets to main layout
+        main_layout.addWidget(wifi_label)
+        main_layout.addWidget(password_label)
+        main_layout.addWidget(self.password_edit)
+        main_layout.addWidget(self.show_password)
+        main_layout.addStretch()
+        main_layout.addWidget(line)
+        main_layout.addLayout(button_layout)
+
+        self.setLayout(main_layout)
+        self.apply_window_style()
+        center_on_screen(self)
+
+    def toggle_password_visibility(self, checked) -> None:
+        """
+        Toggles the visibility of the password in the password edit field.
+
+        :param checked: True to show the password, False to hide it
+        :type checked: bool
+        """
+        if checked:
+            self.password_edit.setEchoMode(QLineEdit.EchoMode.Normal)
+        else:
+            self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+
+    def accept_password(self) -> None:
+        """
+        Called when the user clicks the "Connect" button. Retrieves the password
+        from the password edit field, and then accepts the dialog, which will
+        cause the entered password to be returned to the caller of
+        `PasswordDialog.exec()`.
+        """
+        self.password: str = self.password_edit.text()
+        self.accept()
+
+    @lru_cache(maxsize=1)
+    def is_windows_11(self) -> bool:
+        """
+        Check if the system is running Windows 11.
+
+        Returns:
+            bool: True if Windows 11 (build >= 22000), False otherwise
+        """
+        windows_build: int = sys.getwindowsversion().build
+        return windows_build >= 22000
+
+    def apply_window_style(self) -> None:
+        """
+        Applies the appropriate window style based on the Windows version.
+
+        This function checks the Windows build version to determine if the system
+        is running Windows 11 or an earlier version. Depending on the version, it
+        applies the corresponding stylesheets and settings to the window and its
+        components.
+
+        On Windows 11:
+            - Sets the window to have a translucent background.
+            - Applies styles from 'win11.qss'.
+            - Enables blur effects on the window.
+
+        On Windows 10 or earlier:
+            - Applies styles from 'win10.qss'.
+        """
+        if self.is_windows_11():
+            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
+            get_and_apply_styles(
+                script_file=Path(__file__).parent,
+                set_content_funcs={
+                    "win11.qss": self.setStyleSheet,
+                },
+            )
+            Blur(self.winId(), DarkMode=True)
+        else:
+            get_and_apply_styles(
+                script_file=Path(__file__).parent,
+                set_content_funcs={
+                    "win10.qss": self.setStyleSheet,
+                },
+            )
@@ -0,0 +1,109 @@
+# Built-in Modules
+import threading
+import time
+from typing import Any, Dict, FrozenSet, Optional
+
+# PyWiFi Modules
+from pywifi import iface
+
+# Constants
+PROFILE_TTL: float = 30.0  # seconds before saved profiles are listed again
+
+# One index per wireless interface name, shared within the process
+_indexes: Dict[str, "ProfileIndex"] = {}
+_indexes_lock = threading.Lock()
+
+
+class ProfileIndex:
+    """
+    The saved Wi-Fi profiles of an interface, indexed by SSID.
+
+    Listing profiles is slow on Windows (every profile is read separately), so
+    the list is fetched once and reused until it expires or is invalidated.
+    Adding a profile through the index invalidates it immediately; profiles
+    changed elsewhere (another process, the Windows settings) are picked up when
+    the TTL runs out.
+    """
+
+    def __init__(self, interface: iface.Interface, ttl: float = PROFILE_TTL) -> None:
+        """
+        Initialize an empty index; profiles are listed on first use.
+
+        Args:
+            interface: The wireless interface the profiles belong to
+            ttl: How long a listing is trusted for, in seconds
+        """
+        self.interface: iface.Interface = interface
+        self.ttl: float = ttl
+
+        self._profiles: Dict[str, Any] = {}
+        self._ssids: FrozenSet[str] = frozenset()
+        self._loaded_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loaded(self) -> None:
+        """List the profiles if the index is empty or expired (lock held)."""
+        now: float = time.monotonic()
+        if self._loaded_at is not None and now - self._loaded_at < self.ttl:
+            return
+
+        self._profiles = {
+            profile.ssid: profile for profile in self.interface.network_profiles()
+        }
+        self._ssids = frozenset(self._profiles)
+        self._loaded_at = now
+
+    def get(self, ssid: str) -> Optional[Any]:
+        """Return the saved profile for an SSID, or None."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._profiles.get(ssid)
+
+    def __contains__(self, ssid: str) -> bool:
+        return self.get(ssid) is not None
+
+    def ssids(self) -> FrozenSet[str]:
+        """Return the SSIDs of every saved profile."""
+        with self._lock:
+            self._ensure_loaded()
+            return self._ssids
+
+    def add(self, profile: Any) -> Any:
+        """
+        Add a profile to the interface and invalidate the index.
+
+        Args:
+            profile: The pywifi.Profile to add
+
+        Returns:
+            The profile returned by the interface
+        """
+        added = self.interface.add_network_profile(profile)
+        self.invalidate()
+        return added
+
+    def invalidate(self) -> None:
+        """Forget the listing; the next lookup lists the profiles again."""
+        with self._lock:
+            self._loaded_at = None
+
+
+def shared_profile_index(interface: iface.Interface) -> ProfileIndex:
+    """
+    Return the profile index shared by everything using this interface.
+
+    The scanner, the fallback scan and the connector each open their own
+    interface object; keying by name lets them share one listing.
+
+    Args:
+        interface: A wireless interface
+
+    Returns:
+        ProfileIndex: The index for the interface's adapter
+    """
+    name: str = interface.name()
+    with _indexes_lock:
+        index: Optional[ProfileIndex] = _indexes.get(name)
+        if index is None:
+            index = _indexes[name] = ProfileIndex(interface)
+        return index
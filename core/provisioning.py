@@ -0,0 +1,333 @@
+# Built-in Modules
+import csv
+import json
+import os
+import re
+import sys
+import time
+from argparse import Namespace
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, NamedTuple, Optional, Tuple
+
+# PyWiFi Modules
+import pywifi
+from pywifi import const
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Core Modules
+from core.profile_index import ProfileIndex, shared_profile_index
+from core.seen_networks import SeenNetworks
+
+# Constants
+VALIDATION_WORKERS: int = 8
+
+# Security name in a provisioning file -> (AKM type, cipher)
+SECURITY_TYPES: Dict[str, Tuple[int, int]] = {
+    "open": (const.AKM_TYPE_NONE, const.CIPHER_TYPE_NONE),
+    "wpa2-personal": (const.AKM_TYPE_WPA2PSK, const.CIPHER_TYPE_CCMP),
+    "wpa2psk": (const.AKM_TYPE_WPA2PSK, const.CIPHER_TYPE_CCMP),
+    "wpa2": (const.AKM_TYPE_WPA2PSK, const.CIPHER_TYPE_CCMP),
+    "wpa-personal": (const.AKM_TYPE_WPAPSK, const.CIPHER_TYPE_TKIP),
+    "wpapsk": (const.AKM_TYPE_WPAPSK, const.CIPHER_TYPE_TKIP),
+}
+
+# pywifi writes profiles as XML without escaping them
+_UNSUPPORTED_CHARACTERS = re.compile(r"[&<>]")
+
+
+class ProvisioningEntry(NamedTuple):
+    """One network of a provisioning file, before validation."""
+
+    line: int
+    ssid: str
+    security: str
+    key_ref: str
+
+
+class ValidatedEntry(NamedTuple):
+    """The outcome of validating one entry: a profile or an error."""
+
+    entry: ProvisioningEntry
+    profile: Optional[pywifi.Profile]
+    error: Optional[str]
+
+
+def read_provisioning_file(path: Path) -> List[ProvisioningEntry]:
+    """
+    Read a provisioning file.
+
+    CSV files need a header with the columns ssid, security and key; JSON files
+    hold a list of objects with the same keys. The key column is a reference
+    (see resolve_key_ref), never the password itself.
+
+    Args:
+        path: A .csv or .json file
+
+    Returns:
+        The entries, in file order
+
+    Raises:
+        OSError: If the file cannot be read
+        ValueError: If the file is not valid CSV or JSON
+    """
+    if path.suffix.lower() == ".json":
+        with open(path, "r", encoding="utf-8") as f:
+            rows = json.load(f)
+        if not isinstance(rows, list):
+            raise ValueError("A JSON provisioning file must contain a list")
+        start: int = 1
+    else:
+        with open(path, "r", encoding="utf-8", newline="") as f:
+            rows = list(csv.DictReader(f))
+        start = 2  # line 1 is the header
+
+    return [
+        ProvisioningEntry(
+            number,
+            str(row.get("ssid") or "").strip(),
+            str(row.get("security") or "open").strip().lower(),
+            str(row.get("key") or "").strip(),
+        )
+        for number, row in enumerate(rows, start)
+    ]
+
+
+def resolve_key_ref(key_ref: str, base_dir: Path) -> str:
+    """
+    Resolve a key reference to the key it points to.
+
+    Args:
+        key_ref: "env:NAME" reads an environment variable; "file:PATH" reads
+            the first line of a file (relative to the provisioning file)
+        base_dir: The directory of the provisioning file
+
+    Returns:
+        str: The key
+
+    Raises:
+        ValueError: If the reference is malformed or points nowhere
+    """
+    kind, _, target = key_ref.partition(":")
+    if kind == "env":
+        value: Optional[str] = os.environ.get(target)
+        if value is None:
+            raise ValueError(f"environment variable {target} is not set")
+        return value
+    if kind == "file":
+        try:
+            with open(base_dir / target, "r", encoding="utf-8") as f:
+                return f.readline().rstrip("\r\n")
+        except OSError as e:
+            raise ValueError(f"cannot read key file {target}: {e.strerror}")
+    raise ValueError("key must be an env: or file: reference")
+
+
+def validate_entry(entry: ProvisioningEntry, base_dir: Path) -> ValidatedEntry:
+    """
+    Validate an entry and build its profile.
+
+    Args:
+        entry: The entry to validate
+        base_dir: The directory of the provisioning file (for file: keys)
+
+    Returns:
+        ValidatedEntry: With a profile, or with the reason it is invalid
+    """
+    if not entry.ssid or len(entry.ssid) > 32:
+        return ValidatedEntry(entry, None, "SSID must be 1-32 characters")
+    if _UNSUPPORTED_CHARACTERS.search(entry.ssid):
+        return ValidatedEntry(entry, None, "SSID contains &, < or >")
+    if entry.security not in SECURITY_TYPES:
+        return ValidatedEntry(entry, None, f"unsupported security '{entry.security}'")
+
+    akm, cipher = SECURITY_TYPES[entry.security]
+    profile = pywifi.Profile()
+    profile.ssid = entry.ssid
+    profile.auth = const.AUTH_ALG_OPEN
+    profile.akm = [akm]
+    profile.cipher = cipher
+
+    if akm != const.AKM_TYPE_NONE:
+        try:
+            key: str = resolve_key_ref(entry.key_ref, base_dir)
+        except ValueError as e:
+            return ValidatedEntry(entry, None, str(e))
+
+        if not (8 <= len(key) <= 63 or re.fullmatch(r"[0-9a-fA-F]{64}", key)):
+            return ValidatedEntry(
+                entry, None, "key must be 8-63 characters or 64 hex digits"
+            )
+        if _UNSUPPORTED_CHARACTERS.search(key):
+            return ValidatedEntry(entry, None, "key contains &, < or >")
+        profile.key = key
+
+    return ValidatedEntry(entry, profile, None)
+
+
+def provision(
+    profiles: ProfileIndex, path: Path, *, dry_run: bool = False
+) -> Dict[str, List[str]]:
+    """
+    Add or update every valid profile of a provisioning file in one pass.
+
+    Entries are validated concurrently (key files and variables are read in
+    parallel); the profile index is refreshed once at the end instead of after
+    every profile.
+
+    Args:
+        profiles: The index of the interface to provision
+        path: The provisioning file
+        dry_run: If True, only validate and report what would change
+
+    Returns:
+        A report with the lists "added", "updated", "invalid" and "failed"
+    """
+    entries: List[ProvisioningEntry] = read_provisioning_file(path)
+    with ThreadPoolExecutor(max_workers=VALIDATION_WORKERS) as pool:
+        results: List[ValidatedEntry] = list(
+            pool.map(lambda entry: validate_entry(entry, path.parent), entries)
+        )
+
+    report: Dict[str, List[str]] = {
+        "added": [],
+        "updated": [],
+        "invalid": [],
+        "failed": [],
+    }
+    existing = profiles.ssids()
+    seen: Dict[str, int] = {}
+
+    try:
+        for entry, profile, error in results:
+            if error is None and entry.ssid in seen:
+                error = f"duplicate of line {seen[entry.ssid]}"
+            if error is not None:
+                report["invalid"].append(f"line {entry.line} ({entry.ssid}): {error}")
+                continue
+            seen[entry.ssid] = entry.line
+
+            if not dry_run:
+                try:
+                    profiles.interface.add_network_profile(profile)
+                except Exception as e:
+                    report["failed"].append(f"line {entry.line} ({entry.ssid}): {e}")
+                    continue
+            report["updated" if entry.ssid in existing else "added"].append(entry.ssid)
+    finally:
+        if not dry_run:
+            profiles.invalidate()
+    return report
+
+
+def prune(
+    profiles: ProfileIndex,
+    seen: SeenNetworks,
+    days: float,
+    *,
+    dry_run: bool = False,
+) -> List[str]:
+    """
+    Remove saved profiles of networks not seen in scans for a number of days.
+
+    Networks that were never seen only count as unseen once the scanner's
+    history itself is older than `days`.
+
+    Args:
+        profiles: The index of the interface to prune
+        seen: The scanner's last-seen history
+        days: How many days a network may go unseen
+        dry_run: If True, only report what would be removed
+
+    Returns:
+        The SSIDs of the removed profiles
+    """
+    cutoff: float = time.time() - days * 86400
+    stale: List[str] = sorted(
+        ssid
+        for ssid in profiles.ssids()
+        if (seen.last_seen(ssid) or seen.started_at) < cutoff
+    )
+
+    if not dry_run:
+        for ssid in stale:
+            profiles.interface.remove_network_profile(profiles.get(ssid))
+        profiles.invalidate()
+    return stale
+
+
+def main() -> None:
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Bulk Wi-Fi profile management")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    provision_parser = commands.add_parser(
+        "provision", help="Add or update profiles from a CSV or JSON file"
+    )
+    provision_parser.add_argument("file", type=Path)
+    provision_parser.add_argument(
+        "--dry-run", help="Only report what would change", action="store_true"
+    )
+
+    prune_parser = commands.add_parser(
+        "prune", help="Remove profiles of networks not seen for N days"
+    )
+    prune_parser.add_argument("--days", type=float, required=True)
+    prune_parser.add_argument(
+        "--dry-run", help="Only report what would be removed", action="store_true"
+    )
+    prune_parser.add_argument(
+        "-y", "--yes", help="Do not ask for confirmation", action="store_true"
+    )
+    args: Namespace = parser.parse_args()
+
+    try:
+        interface = pywifi.PyWiFi().interfaces()[0]
+    except IndexError:
+        print("Error: No wireless interface found.")
+        sys.exit(1)
+    profiles: ProfileIndex = shared_profile_index(interface)
+
+    if args.command == "provision":
+        try:
+            report: Dict[str, List[str]] = provision(
+                profiles, args.file, dry_run=args.dry_run
+            )
+        except (OSError, ValueError) as e:
+            print(f"Error reading {args.file}: {e}")
+            sys.exit(1)
+
+        for outcome in ("added", "updated"):
+            print(f"{outcome.capitalize()}: {len(report[outcome])}")
+            for ssid in report[outcome]:
+                print(f"    {ssid}")
+        for outcome in ("invalid", "failed"):
+            print(f"{outcome.capitalize()}: {len(report[outcome])}")
+            for problem in report[outcome]:
+                print(f"    {problem}")
+        sys.exit(1 if report["invalid"] or report["failed"] else 0)
+
+    stale: List[str] = prune(profiles, SeenNetworks(), args.days, dry_run=True)
+    if not stale:
+        print(f"No profiles unseen for {args.days:g} days.")
+        return
+
+    print(f"Profiles unseen for {args.days:g} days:")
+    for ssid in stale:
+        print(f"    {ssid}")
+    if args.dry_run:
+        return
+    if not args.yes and input("Remove them? [y/N] ").strip().lower() != "y":
+        print("Nothing removed.")
+        return
+
+    removed: List[str] = prune(profiles, SeenNetworks(), args.days)
+    print(f"Removed {len(removed)} profiles.")
+
+
+if __name__ == "__main__":
+    main()
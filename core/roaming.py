@@ -0,0 +1,277 @@
+# Built-in Modules
+import os
+import re
+import subprocess
+import threading
+import time
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+# PyWiFi Modules
+from pywifi import const
+
+# Core Modules
+from core.wifi_disconnect import user_disconnected
+
+# Constants
+SMOOTHING: float = 0.3  # EWMA weight of the newest signal sample
+DEGRADED_SIGNAL: float = 40.0  # percent; below this the current link is degraded
+MIN_CANDIDATE_SIGNAL: float = 30.0  # percent; weaker networks are never chosen
+HYSTERESIS: float = 15.0  # percent a candidate must beat the current link by
+MIN_DWELL: float = 30.0  # seconds between two roaming decisions
+STALE_AFTER: float = 15.0  # seconds after which an unseen BSSID is forgotten
+
+
+class Link(NamedTuple):
+    """The network the interface is currently connected to."""
+
+    ssid: str
+    bssid: str
+    signal: int  # percent
+
+
+class Decision(NamedTuple):
+    """A roaming decision: where to connect and why."""
+
+    ssid: str
+    bssid: str
+    signal: float
+    reason: str
+
+
+def normalize_bssid(bssid: str) -> str:
+    """Return a BSSID in one spelling (pywifi on Windows adds a trailing colon)."""
+    return bssid.strip().strip(":").lower()
+
+
+def signal_percent(dbm: int) -> int:
+    """Convert a signal strength in dBm to the 0-100% scale used everywhere else."""
+    return min(max(0, (dbm + 100) * 2), 100)
+
+
+def current_link() -> Optional[Link]:
+    """
+    Read the current connection from `netsh wlan show interfaces`.
+
+    pywifi only reports whether the interface is connected, not to which access
+    point, so netsh is asked instead.
+
+    Returns:
+        Link: The connected network, or None if disconnected or unknown
+    """
+    try:
+        output: str = subprocess.run(
+            ["netsh", "wlan", "show", "interfaces"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+            creationflags=subprocess.CREATE_NO_WINDOW if os.name == "nt" else 0,
+        ).stdout
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+    fields: Dict[str, str] = {}
+    for line in output.splitlines():
+        # Windows 11 labels the access point "AP BSSID"
+        match = re.match(r"^\s*(SSID|(?:AP )?BSSID|Signal)\s*:\s*(.*?)\s*$", line)
+        if match:
+            fields.setdefault(match.group(1).replace("AP ", ""), match.group(2))
+
+    if not {"SSID", "BSSID", "Signal"} <= fields.keys():
+        return None
+
+    return Link(
+        fields["SSID"],
+        normalize_bssid(fields["BSSID"]),
+        int(fields["Signal"].rstrip("%") or 0),
+    )
+
+
+class RoamingEngine:
+    """
+    Connects to the best known network when the current link degrades.
+
+    Every scan feeds a smoothed (EWMA) signal per access point. When the link is
+    lost or drops below DEGRADED_SIGNAL, the strongest access point of a saved
+    network is chosen if it beats the current link by HYSTERESIS, and at most
+    one decision is taken per MIN_DWELL so the interface never thrashes between
+    two similar networks.
+
+    Connections go through WiFiConnector with its saved profile, so only
+    networks that already have a profile are ever chosen. Windows picks the
+    access point within an SSID itself; choosing another access point of the
+    current SSID therefore reconnects and lets it re-select.
+
+    A connection runs on its own thread, so the scan loop calling step() keeps
+    scanning; no new decision is taken until it has finished. After the user
+    disconnected on purpose, a lost link is left alone until they connect
+    again.
+    """
+
+    def __init__(
+        self,
+        connector,
+        log: Callable[[str], None],
+        *,
+        link_reader: Callable[[], Optional[Link]] = current_link,
+        paused: Callable[[], bool] = user_disconnected,
+    ) -> None:
+        """
+        Initialize the engine.
+
+        Args:
+            connector: The WiFiConnector used to connect
+            log: Publishes decisions (the scanner's console log)
+            link_reader: Returns the current Link (netsh by default)
+            paused: Returns True while a lost link must not be replaced
+                (after a manual disconnect by default)
+        """
+        self.connector = connector
+        self.log: Callable[[str], None] = log
+        self.link_reader: Callable[[], Optional[Link]] = link_reader
+        self.paused: Callable[[], bool] = paused
+
+        self.signals: Dict[str, float] = {}  # bssid -> smoothed percent
+        self.ssid_of: Dict[str, str] = {}
+        self.seen_at: Dict[str, float] = {}
+        self.last_decision_at: Optional[float] = None
+        self.degraded: bool = False
+        self.was_paused: bool = False
+        self._connect_thread: Optional[threading.Thread] = None
+
+    @property
+    def connecting(self) -> bool:
+        """True while a roaming decision is still connecting."""
+        return self._connect_thread is not None and self._connect_thread.is_alive()
+
+    def _sample(self, bssid: str, ssid: str, signal: float, now: float) -> None:
+        """Blend one signal sample into an access point's average."""
+        previous: Optional[float] = self.signals.get(bssid)
+        self.signals[bssid] = (
+            signal
+            if previous is None
+            else SMOOTHING * signal + (1 - SMOOTHING) * previous
+        )
+        self.ssid_of[bssid] = ssid
+        self.seen_at[bssid] = now
+
+    def observe(self, scan_results: List) -> None:
+        """
+        Update the smoothed signals from a list of pywifi scan results.
+
+        Args:
+            scan_results: The results of the latest scan
+        """
+        now: float = time.monotonic()
+        for result in scan_results:
+            if result.ssid and result.bssid:
+                self._sample(
+                    normalize_bssid(result.bssid),
+                    result.ssid,
+                    signal_percent(result.signal),
+                    now,
+                )
+
+        for bssid in [
+            b for b, seen in self.seen_at.items() if now - seen > STALE_AFTER
+        ]:
+            del self.signals[bssid], self.ssid_of[bssid], self.seen_at[bssid]
+
+    def evaluate(self, link: Optional[Link]) -> Optional[Decision]:
+        """
+        Decide whether to roam, given the current link.
+
+        Args:
+            link: The current connection, or None if disconnected
+
+        Returns:
+            Decision: Where to connect, or None to stay
+        """
+        now: float = time.monotonic()
+
+        current: float = 0.0
+        if link is not None:
+            self._sample(link.bssid, link.ssid, link.signal, now)
+            current = self.signals[link.bssid]
+
+            if current >= DEGRADED_SIGNAL:
+                if self.degraded:
+                    self.log(f"Roaming: link to {link.ssid} recovered ({current:.0f}%)")
+                self.degraded = False
+                return None
+
+            if not self.degraded:
+                self.log(f"Roaming: link to {link.ssid} degraded ({current:.0f}%)")
+            self.degraded = True
+
+        if (
+            self.last_decision_at is not None
+            and now - self.last_decision_at < MIN_DWELL
+        ):
+            return None
+
+        saved = self.connector.profiles.ssids()
+        candidates = [
+            (signal, bssid)
+            for bssid, signal in self.signals.items()
+            if self.ssid_of[bssid] in saved
+            and (link is None or bssid != link.bssid)
+            and signal >= MIN_CANDIDATE_SIGNAL
+        ]
+        if not candidates:
+            return None
+
+        signal, bssid = max(candidates)
+        if link is not None and signal < current + HYSTERESIS:
+            return None
+
+        reason: str = (
+            "not connected"
+            if link is None
+            else f"{link.ssid} at {current:.0f}%, {bssid} is {signal - current:.0f}% stronger"
+        )
+        return Decision(self.ssid_of[bssid], bssid, signal, reason)
+
+    def step(self) -> None:
+        """Observe the latest scan and roam if the link calls for it."""
+        iface = self.connector.iface
+        self.observe(iface.scan_results())
+        if self.connecting:
+            return
+
+        link: Optional[Link] = self.link_reader()
+        if link is None and iface.status() == const.IFACE_CONNECTED:
+            # Connected but netsh could not tell where; do not second-guess it
+            return
+
+        if link is None and self.paused():
+            if not self.was_paused:
+                self.log("Roaming: paused after a manual disconnect")
+            self.was_paused = True
+            return
+        self.was_paused = False
+
+        decision: Optional[Decision] = self.evaluate(link)
+        if decision is None:
+            return
+
+        self.last_decision_at = time.monotonic()
+        self.log(
+            f"Roaming: connecting to {decision.ssid} ({decision.bssid}, "
+            f"{decision.signal:.0f}%): {decision.reason}"
+        )
+        self._connect_thread = threading.Thread(
+            target=self._connect,
+            args=(decision.ssid,),
+            name="roaming-connect",
+            daemon=True,
+        )
+        self._connect_thread.start()
+
+    def _connect(self, ssid: str) -> None:
+        """Connect on the engine's thread and log the outcome."""
+        try:
+            attempt = self.connector.connect(ssid)
+        except Exception as e:
+            self.log(f"Roaming: error connecting to {ssid}: {e}")
+            return
+        self.log(f"Roaming: {attempt.message} [{attempt.format_timings()}]")
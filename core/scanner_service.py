@@ -0,0 +1,609 @@
+# scanner_service.py - The Wi-Fi scan loop and its sinks, without any Qt dependency
+
+# Built-in Modules
+import datetime
+import os
+import signal
+import socket
+import sys
+import threading
+import time
+from argparse import ArgumentParser, Namespace
+from collections import deque
+from pathlib import Path
+from typing import Callable, Deque, Dict, FrozenSet, List, Optional
+
+# PyWiFi Modules
+from pywifi import PyWiFi, const, iface
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+# Core Modules
+from core.file_log_sink import BACKUP_COUNT, MAX_BYTES, RotatingFileSink
+from core.metrics import PhaseMetrics, serve_metrics
+from core.network_details import describe_frequency, describe_security
+from core.profile_index import shared_profile_index
+from core.seen_networks import SeenNetworks
+from core.wifi_snapshot import (
+    WIFI_DATA_FILE,
+    encode_snapshot,
+    last_snapshot_sequence,
+    write_snapshot_text,
+)
+
+# Import Cython-optimized functions
+try:
+    from wifi_scanner_cy import cy_scan_wifi_networks  # type: ignore
+
+    cython_available = True
+    print("Using Cython-optimized scanning functions")
+except ImportError:
+    cython_available = False
+    print("Cython module not found, using pure Python implementation")
+
+# Constants
+BACKENDS: tuple = ("auto", "cython", "python")
+SCAN_INTERVAL = 0.5
+MAX_NETWORKS: Optional[int] = None  # Publish every network; the master filters
+MAX_LOG_MESSAGES = 100  # lines kept for the console (see --log-buffer)
+# The phases of a scan cycle, in order; the Cython backend reports the four
+# steps from the scan trigger to processing as one "cython_scan" phase
+SCAN_PHASES: tuple = (
+    "profile_fetch",
+    "scan_trigger",
+    "scan_wait",
+    "scan_results",
+    "processing",
+    "serialization",
+    "write",
+)
+output_file: Path = WIFI_DATA_FILE
+using_cython: bool = cython_available
+running = True
+last_scan_time = None
+log_messages: Deque[str] = deque(maxlen=MAX_LOG_MESSAGES)  # ring buffer
+log_lock = threading.RLock()
+snapshot_sequence: int = last_snapshot_sequence()
+snapshot_lock = threading.Lock()
+roaming_engine = None  # A RoamingEngine when started with --auto-connect
+log_file_sink: Optional[RotatingFileSink] = None  # set with --log-file
+seen_networks = SeenNetworks()  # Last-seen times, used to prune old profiles
+metrics = PhaseMetrics("wifi_scanner", SCAN_PHASES + ("cycle",))
+metrics_file: Optional[Path] = None  # rewritten after every cycle (--metrics-file)
+
+# Called with every log line and with the time of every scan (e.g. by the GUI)
+log_listeners: List[Callable[[str], None]] = []
+scan_time_listeners: List[Callable[[str], None]] = []
+
+_stop_requested = threading.Event()
+
+
+# Single Instance Check
+class SingleInstance:
+    """Ensure only one instance of the application is running."""
+
+    def __init__(self, port=50000) -> None:
+        """
+        Initialize single instance check using a socket.
+
+        Args:
+            port (int): Port to use for single instance check
+        """
+        self.port = port
+        self.socket = None
+
+    def already_running(self) -> bool:
+        """
+        Check if another instance is already running.
+
+        Returns:
+            bool: True if another instance is running, False otherwise
+        """
+        try:
+            # Try to create a socket and bind to a specific port
+            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+            self.socket.bind(("127.0.0.1", self.port))
+            self.socket.listen(1)
+            return False
+        except socket.error:
+            # Port is already in use, meaning another instance is running
+            return True
+
+    def __del__(self) -> None:
+        """Close the socket when the object is deleted."""
+        if hasattr(self, "socket") and self.socket:
+            try:
+                self.socket.close()
+            except:
+                pass
+
+
+def configure(
+    *,
+    interval: Optional[float] = None,
+    top_k: Optional[int] = None,
+    output: Optional[Path] = None,
+    backend: str = "auto",
+    log_buffer: Optional[int] = None,
+) -> None:
+    """
+    Set up the scan loop before it starts.
+
+    Args:
+        interval: Seconds between two scans
+        top_k: Publish only the strongest `top_k` networks (None for all)
+        output: The snapshot file to publish to
+        backend: "cython", "python", or "auto" to use Cython when it is built
+        log_buffer: How many log lines to keep for the console
+
+    Raises:
+        ValueError: If the backend is unknown or "cython" is not available
+    """
+    global SCAN_INTERVAL, MAX_NETWORKS, output_file, snapshot_sequence, using_cython
+    global log_messages
+
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown backend '{backend}'")
+    if backend == "cython" and not cython_available:
+        raise ValueError("The Cython backend is not built (see core/README.md)")
+    using_cython = cython_available and backend != "python"
+
+    if interval is not None:
+        SCAN_INTERVAL = interval
+    MAX_NETWORKS = top_k
+    if output is not None and output != output_file:
+        output_file = output
+        # Continue the numbering of the file that is published to
+        snapshot_sequence = last_snapshot_sequence(output_file)
+    if log_buffer is not None and log_buffer != log_messages.maxlen:
+        with log_lock:
+            log_messages = deque(log_messages, maxlen=log_buffer)
+
+
+def open_log_file(
+    path: Path, *, max_bytes: int = MAX_BYTES, backup_count: int = BACKUP_COUNT
+) -> None:
+    """
+    Also write the log to a rotating file, from a background thread.
+
+    Args:
+        path: The log file
+        max_bytes: Rotate (and compress) the file once it is this large
+        backup_count: How many compressed files to keep
+
+    Raises:
+        OSError: If the file cannot be opened
+    """
+    global log_file_sink
+
+    log_file_sink = RotatingFileSink(
+        path, max_bytes=max_bytes, backup_count=backup_count
+    )
+    with log_lock:
+        log_listeners.append(log_file_sink)
+
+
+def close() -> None:
+    """Persist the scanner's state once the scan loop has stopped."""
+    seen_networks.flush()
+    if log_file_sink is not None:
+        log_file_sink.close()
+
+
+def log(message) -> None:
+    """Log a message to console and pass it on to the listeners."""
+    timestamp: str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    log_entry: str = f"[{timestamp}] {message}"
+    print(log_entry)
+
+    # The oldest line drops out once the buffer is full
+    with log_lock:
+        log_messages.append(log_entry)
+        for listener in log_listeners:
+            try:
+                listener(log_entry)
+            except Exception as e:
+                # A broken listener must not stop the scan loop that logs
+                print(f"⚠ Log listener failed: {e}")
+
+
+def subscribe_log(listener: Callable[[str], None]) -> List[str]:
+    """
+    Start passing log lines to a listener.
+
+    Args:
+        listener: Called with every new line, on the thread that logs it
+
+    Returns:
+        list: The lines logged so far; together with the listener, every line
+        is seen exactly once
+    """
+    with log_lock:
+        log_listeners.append(listener)
+        return list(log_messages)
+
+
+def _publish_scan_time(scan_time: str) -> None:
+    """Record the time of the last scan and pass it on to the listeners."""
+    global last_scan_time
+
+    last_scan_time = scan_time
+    for listener in scan_time_listeners:
+        try:
+            listener(scan_time)
+        except Exception as e:
+            print(f"⚠ Scan time listener failed: {e}")
+
+
+def get_wifi_interface() -> iface.Interface:
+    """Get the first available WiFi interface."""
+    try:
+        wifi = PyWiFi()
+        if wifi.interfaces():
+            return wifi.interfaces()[0]
+        else:
+            log("No WiFi interfaces found")
+            sys.exit(1)
+    except Exception as e:
+        log(f"Error initializing WiFi interface: {e}")
+        sys.exit(1)
+
+
+def scan_wifi_networks(top_k: Optional[int] = None) -> List[Dict]:
+    """
+    Scan for available Wi-Fi networks.
+
+    This is the pure Python version used as fallback if Cython is not available.
+
+    Args:
+        top_k: If given, only the strongest `top_k` networks are returned
+
+    Returns:
+        A list of dictionaries containing network information
+    """
+    interface: iface.Interface = get_wifi_interface()
+
+    # Get saved profiles (connections), listed again only when the index expires
+    with metrics.phase("profile_fetch"):
+        saved_profiles: FrozenSet[str] = shared_profile_index(interface).ssids()
+
+    # Trigger scan
+    with metrics.phase("scan_trigger"):
+        interface.scan()
+
+    # Wait for scan to complete
+    with metrics.phase("scan_wait"):
+        time.sleep(1.0)
+
+    # Get scan results
+    with metrics.phase("scan_results"):
+        scan_results = interface.scan_results()
+
+    # Process scan results
+    processing_started: float = time.perf_counter()
+    networks_dict: Dict[str, Dict] = {}
+
+    for result in scan_results:
+        ssid: str = result.ssid
+        if not ssid:  # Skip networks with empty SSIDs
+            continue
+
+        # Convert signal strength (dBm) to percentage (0-100%)
+        signal_strength: int = min(max(0, (result.signal + 100) * 2), 100)
+        signal_percent = int(signal_strength)
+
+        # Check if authentication is required
+        requires_login: bool = (
+            result.akm[0] != const.AKM_TYPE_NONE and ssid not in saved_profiles
+        )
+
+        # Keep only the strongest signal for each SSID
+        if (
+            ssid not in networks_dict
+            or signal_percent > networks_dict[ssid]["strength"]
+        ):
+            current_time: str = time.strftime(
+                "%Y-%m-%d %H:%M:%S", time.localtime(time.time())
+            )
+            frequency, channel, band = describe_frequency(getattr(result, "freq", 0))
+            networks_dict[ssid] = {
+                "ssid": ssid,
+                "strength": signal_percent,
+                "requires_login": requires_login,
+                "last_seen": current_time,
+                "security": describe_security(result.akm),
+                "frequency": frequency,
+                "channel": channel,
+                "band": band,
+                "akm": list(result.akm),
+                "cipher": result.cipher,
+            }
+
+    # Update last scan time
+    _publish_scan_time(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())))
+
+    # Convert to list and sort
+    result = sorted(networks_dict.values(), key=lambda x: x["strength"], reverse=True)
+    metrics.observe("processing", time.perf_counter() - processing_started)
+
+    return result if top_k is None else result[:top_k]
+
+
+def optimized_scan_wifi_networks() -> List[Dict]:
+    """
+    Wrapper function that uses Cython implementation if available,
+    otherwise falls back to pure Python version.
+
+    Returns:
+        A list of dictionaries containing network information
+    """
+    if using_cython:
+        # Use Cython optimized version
+        with metrics.phase("profile_fetch"):
+            saved_profiles = shared_profile_index(get_wifi_interface()).ssids()
+        with metrics.phase("cython_scan"):
+            networks = cy_scan_wifi_networks(MAX_NETWORKS, saved_profiles)
+    else:
+        # Use pure Python version
+        networks = scan_wifi_networks(MAX_NETWORKS)
+
+    # Update last scan time (moved from scan_wifi_networks)
+    _publish_scan_time(time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time())))
+
+    return networks
+
+
+def save_to_json(networks: List[Dict], scan_completed: Optional[float] = None) -> None:
+    """
+    Publish network data to the JSON file with the next sequence number.
+
+    Args:
+        networks: The networks found by the scan
+        scan_completed: When the scan returned, as time.monotonic(); the
+            window measures its scan-to-screen latency from this stamp
+    """
+    global snapshot_sequence
+
+    try:
+        # Manual scans run on their own thread, keep numbering and writes ordered
+        with snapshot_lock:
+            snapshot_sequence += 1
+            with metrics.phase("serialization"):
+                text: str = encode_snapshot(networks, snapshot_sequence, scan_completed)
+            with metrics.phase("write"):
+                write_snapshot_text(text, output_file)
+        seen_networks.mark(network["ssid"] for network in networks)
+    except Exception as e:
+        metrics.increment("errors")
+        log(f"Error saving to {output_file}: {e}")
+
+
+def write_metrics_file() -> None:
+    """Atomically rewrite the metrics file in the text exposition format."""
+    temp_path: Path = metrics_file.with_name(f"{metrics_file.name}.{os.getpid()}.tmp")
+    try:
+        with open(temp_path, "w", encoding="utf-8") as f:
+            f.write(metrics.exposition())
+        os.replace(temp_path, metrics_file)
+    except OSError as e:
+        log(f"Error saving metrics to {metrics_file}: {e}")
+
+
+def scanner_process() -> None:
+    """Main scanning process that runs in the background."""
+    log("WiFi scanner started")
+    log("Cython optimization: " + ("Enabled" if using_cython else "Disabled"))
+
+    try:
+        while running:
+            with metrics.phase("cycle"):
+                networks = optimized_scan_wifi_networks()
+                save_to_json(networks, time.monotonic())
+            metrics.increment("cycles")
+            metrics.set_gauge("networks", len(networks))
+            if metrics_file is not None:
+                write_metrics_file()
+            log(f"Scanned {len(networks)} networks")
+            if roaming_engine is not None:
+                roam()
+            # Wakes up at once when the scanner is stopped
+            _stop_requested.wait(SCAN_INTERVAL)
+    except Exception as e:
+        metrics.increment("errors")
+        log(f"Error in scanner process: {e}")
+
+
+def stop() -> None:
+    """Let the scan loop finish after the scan in progress."""
+    global running
+
+    running = False
+    _stop_requested.set()
+
+
+def start_roaming() -> None:
+    """Create the auto-connect engine; the scan loop drives it."""
+    global roaming_engine
+
+    # Only needed with --auto-connect, so imported here
+    from core.roaming import RoamingEngine
+    from core.wifi_connect import NoWirelessInterface, WiFiConnector
+
+    try:
+        roaming_engine = RoamingEngine(WiFiConnector(), log)
+    except NoWirelessInterface as e:
+        log(f"Auto-connect disabled: {e}")
+        return
+    log("Auto-connect enabled: roaming between saved networks")
+
+
+def roam() -> None:
+    """Let the roaming engine act on the scan that was just published."""
+    try:
+        roaming_engine.step()
+    except Exception as e:
+        log(f"Roaming error: {e}")
+
+
+def build_parser() -> ArgumentParser:
+    """The command line of wifi_scanner.py, shared by the GUI and headless modes."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Background Wi-Fi scanner")
+    parser.add_argument(
+        "--headless",
+        help="Run only the scan loop, without the tray icon and console (no Qt)",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--auto-connect",
+        help="Connect to the best saved network when the current link degrades",
+        action="store_true",
+    )
+    parser.add_argument(
+        "--interval",
+        help="Seconds between two scans",
+        type=float,
+        default=SCAN_INTERVAL,
+    )
+    parser.add_argument(
+        "--top-k",
+        help="Publish only the strongest K networks (default: all)",
+        type=int,
+        metavar="K",
+    )
+    parser.add_argument(
+        "--output",
+        help="The snapshot file to publish to",
+        type=Path,
+        default=WIFI_DATA_FILE,
+    )
+    parser.add_argument(
+        "--log-buffer",
+        help="Log lines kept for the console",
+        type=int,
+        default=MAX_LOG_MESSAGES,
+        metavar="LINES",
+    )
+    parser.add_argument(
+        "--log-file",
+        help="Also write the log to this file (rotated and compressed)",
+        type=Path,
+    )
+    parser.add_argument(
+        "--log-max-bytes",
+        help="Size at which the log file is rotated",
+        type=int,
+        default=MAX_BYTES,
+        metavar="BYTES",
+    )
+    parser.add_argument(
+        "--log-backups",
+        help="Compressed log files to keep",
+        type=int,
+        default=BACKUP_COUNT,
+        metavar="N",
+    )
+    parser.add_argument(
+        "--metrics-file",
+        help="Write scan phase metrics to this file after every scan "
+        "(Prometheus text format)",
+        type=Path,
+    )
+    parser.add_argument(
+        "--metrics-port",
+        help="Serve scan phase metrics at http://127.0.0.1:PORT/metrics",
+        type=int,
+        metavar="PORT",
+    )
+    parser.add_argument(
+        "--backend",
+        help="The scan implementation; auto uses Cython when it is built",
+        choices=BACKENDS,
+        default="auto",
+    )
+    return parser
+
+
+def parse_args(argv: Optional[List[str]] = None) -> Namespace:
+    """Parse the command line and configure the scan loop from it."""
+    global metrics_file
+
+    parser: ArgumentParser = build_parser()
+    args: Namespace = parser.parse_args(argv)
+
+    if args.interval < 0 or (args.top_k is not None and args.top_k < 1):
+        parser.error("--interval must not be negative and --top-k must be positive")
+    if args.log_buffer < 1 or args.log_max_bytes < 0 or args.log_backups < 0:
+        parser.error(
+            "--log-buffer must be positive; --log-max-bytes and --log-backups "
+            "must not be negative"
+        )
+    try:
+        configure(
+            interval=args.interval,
+            top_k=args.top_k,
+            output=args.output,
+            backend=args.backend,
+            log_buffer=args.log_buffer,
+        )
+    except ValueError as e:
+        parser.error(str(e))
+
+    if args.log_file is not None:
+        try:
+            open_log_file(
+                args.log_file,
+                max_bytes=args.log_max_bytes,
+                backup_count=args.log_backups,
+            )
+        except OSError as e:
+            parser.error(f"cannot open {args.log_file}: {e.strerror}")
+
+    metrics_file = args.metrics_file
+    if args.metrics_port is not None:
+        try:
+            serve_metrics(metrics, args.metrics_port)
+        except OSError as e:
+            parser.error(f"cannot serve metrics on port {args.metrics_port}: {e}")
+    return args
+
+
+def run_headless(auto_connect: bool = False) -> int:
+    """
+    Run the scan loop on this thread until Ctrl+C or SIGTERM.
+
+    Args:
+        auto_connect: Start the roaming engine
+
+    Returns:
+        int: The exit code
+    """
+    single_instance = SingleInstance()
+    if single_instance.already_running():
+        print("Another instance of WiFi Scanner is already running.")
+        return 1
+
+    signal.signal(signal.SIGTERM, lambda signum, frame: stop())
+    if auto_connect:
+        start_roaming()
+
+    try:
+        scanner_process()
+    except KeyboardInterrupt:
+        log("WiFi scanner stopped")
+    finally:
+        close()
+    return 0
+
+
+def main() -> int:
+    """Run the scanner without Qt (wifi_scanner.py --headless)."""
+    args: Namespace = parse_args()
+    return run_headless(args.auto_connect)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+# Built-in Modules
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, Optional
+
+# Constants
+SEEN_NETWORKS_FILE: Path = Path(__file__).parent / "seen_networks.json"
+FLUSH_INTERVAL: float = 60.0  # seconds between writes of the history
+
+
+class SeenNetworks:
+    """
+    When each SSID was last seen in a scan, persisted across restarts.
+
+    The scanner marks every network it publishes. Marks are kept in memory and
+    written at most once per FLUSH_INTERVAL, so scanning twice a second does not
+    mean writing the file twice a second. The history also records when it was
+    started, so a network that was never seen can be told apart from one seen
+    before the history existed.
+    """
+
+    def __init__(self, path: Path = SEEN_NETWORKS_FILE) -> None:
+        """
+        Load the history from disk, or start a new one.
+
+        Args:
+            path: The JSON file holding the history
+        """
+        self.path: Path = path
+        self.started_at: float = time.time()
+        self.networks: Dict[str, float] = {}
+        self._flushed_at: float = 0.0
+        self._dirty: bool = False
+        self._lock = threading.Lock()
+
+        try:
+            with open(path, "r") as f:
+                data: Dict = json.load(f)
+            self.started_at = float(data["started_at"])
+            self.networks = {str(k): float(v) for k, v in data["networks"].items()}
+        except (OSError, ValueError, KeyError, TypeError, AttributeError):
+            pass
+
+    def mark(self, ssids: Iterable[str], now: Optional[float] = None) -> None:
+        """
+        Record that networks were seen, flushing the history if it is due.
+
+        Args:
+            ssids: The networks seen in a scan
+            now: The time they were seen (defaults to now)
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            for ssid in ssids:
+                self.networks[ssid] = now
+            self._dirty = True
+
+        if now - self._flushed_at >= FLUSH_INTERVAL:
+            self.flush()
+
+    def last_seen(self, ssid: str) -> Optional[float]:
+        """Return when a network was last seen, or None if it never was."""
+        with self._lock:
+            return self.networks.get(ssid)
+
+    def flush(self) -> None:
+        """Write the history to disk if it changed."""
+        with self._lock:
+            if not self._dirty:
+                return
+            data: Dict = {"started_at": self.started_at, "networks": self.networks}
+            self._dirty = False
+            self._flushed_at = time.time()
+
+            try:
+                temp_path: Path = self.path.with_name(f"{self.path.name}.tmp")
+                with open(temp_path, "w") as f:
+                    json.dump(data, f)
+                os.replace(temp_path, self.path)
+            except OSError as e:
+                print(f"Could not save seen networks: {e}")
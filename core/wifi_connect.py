@@ -3,215 +3,160 @@ import re
 import sys
 import time
 from argparse import Namespace
-from functools import lru_cache
+from contextlib import contextmanager
+from dataclasses import dataclass, field
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Set, Tuple
 
 # PyWiFi Modules
 import pywifi
 
-# PyQt6 Modules
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import (
-    QApplication,
-    QCheckBox,
-    QDialog,
-    QFrame,
-    QHBoxLayout,
-    QLabel,
-    QLineEdit,
-    QPushButton,
-    QVBoxLayout,
-)
-
 if __name__ == "__main__":
     # Add the package root to the Python path
     sys.path.append(str(Path(__file__).parent.parent))
 
+# Core Modules
+from core.association import AssociationHistory, wait_for_association
+from core.connect_telemetry import ConnectTelemetry
+from core.negative_cache import NegativeCache, NegativeEntry
+from core.profile_index import ProfileIndex, shared_profile_index
+from core.wifi_disconnect import clear_user_disconnect, wait_for_disconnect
+from core.wifi_snapshot import WIFI_DATA_FILE, read_fresh_snapshot
+
 # Helpers Modules
-from helpers import Blur, center_on_screen, get_and_apply_styles
+from helpers import CancellationToken, OperationCancelled
+
+# Connection phases, in the order they run
+CONNECT_PHASES: Tuple[str, ...] = (
+    "resolve",
+    "profile_lookup",
+    "credentials",
+    "add_profile",
+    "associate",
+    "verify",
+)
 
+SCAN_WAIT: float = 2.0  # seconds to wait for a scan to complete
+SCAN_POLL_INTERVAL: float = 0.1  # seconds between scan result checks
+SNAPSHOT_MAX_AGE: float = 5.0  # seconds a scanner snapshot is trusted for
 
-class PasswordDialog(QDialog):
-    def __init__(self, ssid, parent=None) -> None:
-        super().__init__(parent)
-        self.ssid = ssid
-        self.password = None
-        self.init_ui()
 
-    def init_ui(self) -> None:
-        # Set window properties
-        self.setWindowTitle("Connect to Wi-Fi Network")
-        self.setFixedSize(400, 250)
+class NoWirelessInterface(Exception):
+    """Raised when there is no wireless interface to connect with."""
 
-        icon_path: Path = (
-            Path(__file__).parent.parent / "assets" / "connect_to_wifi_icon.png"
-        )
 
-        self.setWindowIcon(QIcon(str(icon_path)))
-
-        # Main layout
-        main_layout = QVBoxLayout()
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(15)
-
-        # Network name section
-        wifi_label = QLabel(f"Enter the password for: {self.ssid}")
-
-        # Password section
-        password_label = QLabel("Security key:")
-        password_label.adjustSize()
-
-        self.password_edit = QLineEdit()
-        self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
-        self.password_edit.setMinimumHeight(30)
-
-        # Show password checkbox
-        self.show_password = QCheckBox("Show password")
-        self.show_password.toggled.connect(self.toggle_password_visibility)
-
-        # Horizontal line separator
-        line = QFrame()
-        line.setFrameShape(QFrame.Shape.HLine)
-        line.setFrameShadow(QFrame.Shadow.Sunken)
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.setSpacing(10)
-
-        self.cancel_button = QPushButton("Cancel")
-        self.cancel_button.setMinimumHeight(32)
-        self.cancel_button.setMinimumWidth(80)
-        self.cancel_button.clicked.connect(self.reject)
-
-        self.next_button = QPushButton("Connect")
-        self.next_button.setMinimumHeight(32)
-        self.next_button.setMinimumWidth(80)
-        self.next_button.clicked.connect(self.accept_password)
-        self.next_button.setDefault(True)
-
-        button_layout.addStretch()
-        button_layout.addWidget(self.cancel_button)
-        button_layout.addWidget(self.next_button)
-
-        # Apply styles
-        get_and_apply_styles(
-            script_file=Path(__file__).parent,
-            set_content_funcs={
-                "cancel_button.qss": self.cancel_button.setStyleSheet,
-                "next_button.qss": self.next_button.setStyleSheet,
-                "password_label.qss": password_label.setStyleSheet,
-                "wifi_label.qss": wifi_label.setStyleSheet,
-                "password_edit.qss": self.password_edit.setStyleSheet,
-                "show_password.qss": self.show_password.setStyleSheet,
-                "line.qss": line.setStyleSheet,
-            },
-        )
+class ConnectionFailed(Exception):
+    """Raised by a connection phase that cannot continue."""
 
-        # Add widgets to main layout
-        main_layout.addWidget(wifi_label)
-        main_layout.addWidget(password_label)
-        main_layout.addWidget(self.password_edit)
-        main_layout.addWidget(self.show_password)
-        main_layout.addStretch()
-        main_layout.addWidget(line)
-        main_layout.addLayout(button_layout)
+    def __init__(self, error_class: str, message: str) -> None:
+        super().__init__(message)
+        self.error_class: str = error_class
 
-        self.setLayout(main_layout)
-        self.apply_window_style()
-        center_on_screen(self)
 
-    def toggle_password_visibility(self, checked) -> None:
-        """
-        Toggles the visibility of the password in the password edit field.
+@dataclass
+class ConnectionAttempt:
+    """The outcome of one connection attempt and the time spent in each phase."""
 
-        :param checked: True to show the password, False to hide it
-        :type checked: bool
-        """
-        if checked:
-            self.password_edit.setEchoMode(QLineEdit.EchoMode.Normal)
-        else:
-            self.password_edit.setEchoMode(QLineEdit.EchoMode.Password)
+    ssid: str
+    status: str = "pending"  # "success", "error" or "cancelled"
+    message: str = ""
+    timings: Dict[str, float] = field(default_factory=dict)
+    error_class: Optional[str] = None
+    resolved_from: Optional[str] = None  # "snapshot" or "scan"
+    # The unexpected exception that ended the attempt, if any (a bug, not a
+    # connection failure)
+    exception: Optional[Exception] = field(default=None, repr=False)
 
-    def accept_password(self) -> None:
-        """
-        Called when the user clicks the "Connect" button. Retrieves the password
-        from the password edit field, and then accepts the dialog, which will
-        cause the entered password to be returned to the caller of
-        `PasswordDialog.exec()`.
-        """
-        self.password: str = self.password_edit.text()
-        self.accept()
+    @property
+    def succeeded(self) -> bool:
+        return self.status == "success"
 
-    @lru_cache(maxsize=1)
-    def is_windows_11(self) -> bool:
-        """
-        Check if the system is running Windows 11.
+    def format_timings(self) -> str:
+        """Returns the phase timings as a single line, e.g. "resolve 2.01s · ..."."""
+        parts: List[str] = []
+        for phase, seconds in self.timings.items():
+            if phase == "resolve" and self.resolved_from:
+                parts.append(f"{phase} {seconds:.2f}s ({self.resolved_from})")
+            else:
+                parts.append(f"{phase} {seconds:.2f}s")
+        return " · ".join(parts)
 
-        Returns:
-            bool: True if Windows 11 (build >= 22000), False otherwise
-        """
-        windows_build: int = sys.getwindowsversion().build
-        return windows_build >= 22000
 
-    def apply_window_style(self) -> None:
-        """
-        Applies the appropriate window style based on the Windows version.
+def parse_connect_args(args: str) -> Tuple[List[str], bool]:
+    """
+    Split the arguments of "connect A | B | C [--force]".
 
-        This function checks the Windows build version to determine if the system
-        is running Windows 11 or an earlier version. Depending on the version, it
-        applies the corresponding stylesheets and settings to the window and its
-        components.
+    Returns:
+        tuple: (the SSIDs in priority order, True if --force was given)
+    """
+    # A trailing --force skips the cache of recently failed attempts
+    force: bool = args == "--force" or args.endswith(" --force")
+    if force:
+        args = args[: -len("--force")]
+    return ([ssid.strip() for ssid in args.split("|") if ssid.strip()], force)
 
-        On Windows 11:
-            - Sets the window to have a translucent background.
-            - Applies styles from 'win11.qss'.
-            - Enables blur effects on the window.
 
-        On Windows 10 or earlier:
-            - Applies styles from 'win10.qss'.
-        """
-        if self.is_windows_11():
-            self.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground, True)
-            get_and_apply_styles(
-                script_file=Path(__file__).parent,
-                set_content_funcs={
-                    "win11.qss": self.setStyleSheet,
-                },
-            )
-            Blur(self.winId(), DarkMode=True)
-        else:
-            get_and_apply_styles(
-                script_file=Path(__file__).parent,
-                set_content_funcs={
-                    "win10.qss": self.setStyleSheet,
-                },
-            )
+def first_wireless_interface() -> Any:
+    """
+    Return the first wireless interface.
+
+    Raises:
+        NoWirelessInterface: If there is none, or pywifi cannot list them
+    """
+    try:
+        interfaces: List[Any] = pywifi.PyWiFi().interfaces()
+    except Exception as e:
+        raise NoWirelessInterface(f"Wi-Fi is unavailable: {e}") from e
+    if not interfaces:
+        raise NoWirelessInterface("No Wi-Fi interfaces found.")
+    return interfaces[0]
 
 
 class WiFiConnector:
-    def __init__(self) -> None:
-        self.wifi = pywifi.PyWiFi()
-        try:
-            self.iface = self.wifi.interfaces()[0]  # Get the first wireless interface
-        except IndexError:
-            print("Error: No wireless interface found.")
-            sys.exit(1)
+    def __init__(
+        self,
+        interface: Optional[Any] = None,
+        *,
+        snapshot_max_age: float = SNAPSHOT_MAX_AGE,
+        snapshot_file: Path = WIFI_DATA_FILE,
+        association_history: Optional[AssociationHistory] = None,
+        telemetry: Optional[ConnectTelemetry] = None,
+    ) -> None:
+        """
+        Initialize the connector.
+
+        Args:
+            interface: The pywifi interface to use (or anything shaped like
+                one, such as the benchmarks' simulated adapter); defaults to
+                the first wireless interface
+            snapshot_max_age: How old (in seconds) the background scanner's
+                snapshot may be to resolve a network from it; 0 always scans
+            snapshot_file: The background scanner's snapshot
+            association_history: Store of association times (default file)
+            telemetry: Store of connection attempts (default database)
+
+        Raises:
+            NoWirelessInterface: If no interface is given and none is found
+        """
+        self.snapshot_max_age: float = snapshot_max_age
+        self.snapshot_file: Path = snapshot_file
+        if interface is None:
+            interface = first_wireless_interface()
+        self.iface = interface
+
+        self.profiles: ProfileIndex = shared_profile_index(self.iface)
+        self.association_history = association_history or AssociationHistory()
+        self.telemetry = telemetry or ConnectTelemetry()
+        self.negative_cache = NegativeCache()
 
         self.current_ssid = None
         self.password = None
         self.requires_password = False
 
-        # Initialize QApplication if not already initialized
-        if not QApplication.instance():
-            self.app = QApplication(sys.argv)
-        else:
-            self.app = QApplication.instance()
-
-    def scan_networks(self):
+    def scan_networks(self, token: Optional[CancellationToken] = None):
         """Scan for available Wi-Fi networks"""
         self.iface.scan()
-        time.sleep(2)  # Wait for scan to complete
+        (token or CancellationToken()).wait(SCAN_WAIT)  # Wait for scan to complete
         return self.iface.scan_results()
 
     def is_valid_wifi_name(self, name) -> bool:
@@ -219,15 +164,103 @@ class WiFiConnector:
         # Wi-Fi SSID can be up to 32 characters
         return bool(name) and len(name) <= 32
 
-    def get_network_info(self, target_ssid):
-        """Get information about a specific network"""
-        networks = self.scan_networks()
+    def scan_for_networks(
+        self, target_ssids: Iterable[str], token: Optional[CancellationToken] = None
+    ) -> Dict[str, Any]:
+        """
+        Run one scan targeted at some networks.
 
-        for network in networks:
-            if network.ssid == target_ssid:
-                return network
+        Scan results are polled while the scan runs, so this returns as soon as
+        every network shows up instead of always waiting for SCAN_WAIT.
 
-        return None
+        Returns:
+            dict: The scan result of each network that was found, by SSID
+        """
+        token = token or CancellationToken()
+        wanted: Set[str] = set(target_ssids)
+        found: Dict[str, Any] = {}
+        self.iface.scan()
+
+        deadline: float = time.perf_counter() + SCAN_WAIT
+        while True:
+            for network in self.iface.scan_results():
+                if network.ssid in wanted:
+                    found.setdefault(network.ssid, network)
+
+            if len(found) == len(wanted) or time.perf_counter() >= deadline:
+                return found
+            token.wait(SCAN_POLL_INTERVAL)
+
+    def get_network_info(self, target_ssid, token: Optional[CancellationToken] = None):
+        """Run a scan targeted at one network (see scan_for_networks)"""
+        return self.scan_for_networks([target_ssid], token).get(target_ssid)
+
+    def find_in_snapshot(
+        self, target_ssids: Iterable[str]
+    ) -> Dict[str, pywifi.Profile]:
+        """
+        Look networks up in the background scanner's latest snapshot.
+
+        Returns:
+            dict: Each network found, shaped like a scan result, by SSID; empty
+            if the snapshot is stale. Entries without security details are
+            skipped.
+        """
+        if self.snapshot_max_age <= 0:
+            return {}
+
+        snapshot: Optional[Dict] = read_fresh_snapshot(
+            self.snapshot_max_age, self.snapshot_file
+        )
+        if snapshot is None:
+            return {}
+
+        wanted: Set[str] = set(target_ssids)
+        found: Dict[str, pywifi.Profile] = {}
+        for item in snapshot["networks"]:
+            ssid = item.get("ssid")
+            if ssid in wanted and "akm" in item and ssid not in found:
+                network = pywifi.Profile()
+                network.ssid = ssid
+                network.akm = list(item["akm"])
+                network.cipher = item.get("cipher", pywifi.const.CIPHER_TYPE_NONE)
+                found[ssid] = network
+
+        return found
+
+    def resolve_networks(
+        self, target_ssids: List[str], token: Optional[CancellationToken] = None
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Find several networks at once, preferring the scanner's snapshot.
+
+        Networks missing from the snapshot are looked for in a single targeted
+        scan, never one scan per network.
+
+        Returns:
+            tuple: (the networks found by SSID, "snapshot" or "scan" by SSID)
+        """
+        found: Dict[str, Any] = self.find_in_snapshot(target_ssids)
+        sources: Dict[str, str] = {ssid: "snapshot" for ssid in found}
+
+        missing: List[str] = [ssid for ssid in target_ssids if ssid not in found]
+        if missing:
+            found.update(self.scan_for_networks(missing, token))
+            sources.update({ssid: "scan" for ssid in missing})
+
+        return (found, sources)
+
+    def resolve_network(
+        self, target_ssid, token: Optional[CancellationToken] = None
+    ) -> Tuple[Optional[Any], str]:
+        """
+        Find a network, preferring the scanner's snapshot over a new scan.
+
+        Returns:
+            tuple: (the network or None, "snapshot" or "scan")
+        """
+        found, sources = self.resolve_networks([target_ssid], token)
+        return (found.get(target_ssid), sources[target_ssid])
 
     def network_requires_password(self, network):
         """Check if the network requires a password"""
@@ -236,135 +269,41 @@ class WiFiConnector:
             network.akm and pywifi.const.AKM_TYPE_NONE not in network.akm
         )
 
+    def find_saved_profile(self, ssid):
+        """Return the saved Windows profile for this network, or None"""
+        return self.profiles.get(ssid)
+
     def has_profile_for_network(self, ssid) -> bool:
         """Check if Windows has a saved profile for this network"""
-        existing_profiles = self.iface.network_profiles()
-        return any(profile.ssid == ssid for profile in existing_profiles)
+        return self.find_saved_profile(ssid) is not None
 
-    def show_password_dialog(self) -> None | str:
+    def show_password_dialog(self, ssid=None) -> None | str:
         """Show a Windows 11 style password dialog and return entered password"""
-        dialog = PasswordDialog(self.current_ssid)
+        # Imported here so that connecting without a dialog needs no widgets
+        from PyQt6.QtWidgets import QApplication
+
+        from core.password_dialog import PasswordDialog
+
+        if not QApplication.instance():
+            self.app = QApplication(sys.argv)
+        dialog = PasswordDialog(ssid or self.current_ssid)
         if dialog.exec():
             return dialog.password
         return None
 
-    def parse_command(self, command) -> dict[str, str]:
-        """Parse user input command"""
-        # Handle connect command
-        connect_match = re.match(r"^(?:c|connect)=(.+)$", command)
-        if connect_match:
-            ssid = connect_match.group(1)
-            if not self.is_valid_wifi_name(ssid):
-                return {"status": "error", "message": "Invalid Wi-Fi name"}
-
-            # Find the network in available networks
-            network = self.get_network_info(ssid)
-            if not network:
-                return {"status": "error", "message": f"Network '{ssid}' not found"}
-
-            self.current_ssid = ssid
-            self.requires_password = self.network_requires_password(network)
-
-            # Check if Windows has a saved profile for this network
-            has_saved_profile = self.has_profile_for_network(ssid)
-
-            if has_saved_profile:
-                # Try to connect using the saved profile
-                self.password = None  # No need to provide password
-                return {
-                    "status": "use_saved_profile",
-                    "message": f"Wi-Fi network set to: {ssid}. Found saved profile. Attempting to connect...",
-                }
-            elif self.requires_password:
-                # Show password dialog for password-protected networks
-                self.password = self.show_password_dialog()
-
-                if self.password is None:
-                    return {
-                        "status": "cancelled",
-                        "message": f"Connection to {ssid} cancelled by user.",
-                    }
-
-                return {
-                    "status": "ready_to_connect",
-                    "message": f"Wi-Fi network set to: {ssid}. Password provided. Attempting to connect...",
-                }
-            else:
-                # Open network, no password needed
-                self.password = None
-                return {
-                    "status": "ready_to_connect",
-                    "message": f"Wi-Fi network set to: {ssid}. This is an open network. Attempting to connect...",
-                }
-
-        # Password command no longer needed due to dialog
-        password_match = re.match(r"^(?:p|password)=(.+)$", command)
-        if password_match:
-            return {
-                "status": "error",
-                "message": "Password entry via command line is disabled. Please use the graphical interface.",
-            }
-
-        return {
-            "status": "error",
-            "message": "Invalid command format. Use c=WIFINAME to connect to a network",
-        }
-
-    def connect_with_saved_profile(self) -> dict[str, str]:
-        """Try to connect using a saved Windows profile"""
-        existing_profiles = self.iface.network_profiles()
-        target_profile = None
-
-        for profile in existing_profiles:
-            if profile.ssid == self.current_ssid:
-                target_profile = profile
-                break
+    def build_profile(self, network, password: Optional[str]) -> pywifi.Profile:
+        """
+        Builds a new profile for a scanned network.
 
-        if not target_profile:
-            return {
-                "status": "error",
-                "message": f"No saved profile found for {self.current_ssid}",
-            }
-
-        # Connect with the existing profile
-        self.iface.connect(target_profile)
-
-        # Wait for connection
-        connection_timeout = 10  # seconds
-        start_time: float = time.time()
-
-        while time.time() - start_time < connection_timeout:
-            status = self.iface.status()
-            if status == pywifi.const.IFACE_CONNECTED:
-                return {
-                    "status": "success",
-                    "message": f"Successfully connected to {self.current_ssid} using saved profile",
-                }
-            time.sleep(0.5)
-
-        return {
-            "status": "error",
-            "message": f"Failed to connect to {self.current_ssid} using saved profile. You may need to provide a password.",
-        }
-
-    def connect_with_new_profile(self) -> dict[str, str]:
-        """Connect using a new profile (for networks without saved profiles)"""
-        network = self.get_network_info(self.current_ssid)
-        if not network:
-            return {
-                "status": "error",
-                "message": f"Network '{self.current_ssid}' not found",
-            }
-
-        # Check if password is required but not provided
-        if self.network_requires_password(network) and not self.password:
-            return {
-                "status": "error",
-                "message": f"Network '{self.current_ssid}' requires a password.",
-            }
+        Args:
+            network: The scan result of the network
+            password: The security key, or None for open networks
 
+        Returns:
+            pywifi.Profile: The profile to add to the interface
+        """
         profile = pywifi.Profile()
-        profile.ssid = self.current_ssid
+        profile.ssid = network.ssid
 
         # Configure security based on network type
         if self.network_requires_password(network):
@@ -386,67 +325,320 @@ class WiFiConnector:
                 profile.akm = network.akm.copy()
                 profile.cipher = network.cipher
 
-            profile.key = self.password
-
-        # Add new profile
-        profile_added = self.iface.add_network_profile(profile)
-
-        # Connect
-        self.iface.connect(profile_added)
-
-        # Wait for connection
-        connection_timeout = 10  # seconds
-        start_time: float = time.time()
-
-        while time.time() - start_time < connection_timeout:
-            status = self.iface.status()
-            if status == pywifi.const.IFACE_CONNECTED:
-                return {
-                    "status": "success",
-                    "message": f"Successfully connected to {self.current_ssid}",
-                }
-            time.sleep(0.5)
-
-        return {
-            "status": "error",
-            "message": f"Failed to connect to {self.current_ssid}. "
-            + (
-                "Check your password or network availability."
-                if self.requires_password
-                else "Check network availability."
-            ),
-        }
-
-    def connect_to_network(self) -> dict[str, str]:
-        """Connect to the specified Wi-Fi network, using saved profile if available"""
-        if not self.current_ssid:
-            return {"status": "error", "message": "No Wi-Fi network specified"}
-
-        # Check if we should use a saved profile
-        if self.has_profile_for_network(self.current_ssid) and not self.password:
-            return self.connect_with_saved_profile()
-        else:
-            return self.connect_with_new_profile()
+            profile.key = password
 
-    def process_input(self, user_input) -> str:
-        """Process user input and handle connection flow"""
-        result: dict[str, str] = self.parse_command(user_input)
+        return profile
+
+    def associate(self, profile, token: CancellationToken) -> str:
+        """
+        Connects the interface with a profile and waits for it to associate.
+
+        A link that is still up is dropped first, so its status cannot pass
+        for the new association. The timeout is derived from how long this
+        network took to associate before; successful associations are added
+        to that history.
+
+        Args:
+            profile: The saved or newly added profile
+            token: Checked between status polls
 
-        if result["status"] == "error" or result["status"] == "cancelled":
-            return result["message"]
+        Returns:
+            str: "connected", "failed" or "timeout" (see wait_for_association)
+
+        Raises:
+            OperationCancelled: If the token is cancelled while waiting
+        """
+        if self.iface.status() == pywifi.const.IFACE_CONNECTED:
+            self.iface.disconnect()
+            wait_for_disconnect(self.iface, token=token)
+
+        connected_before: bool = self.iface.status() == pywifi.const.IFACE_CONNECTED
+        start: float = time.perf_counter()
+        self.iface.connect(profile)
+
+        # "connected" is only reported once the old link has gone, so it is
+        # always a real association worth recording
+        outcome: str = wait_for_association(
+            self.iface,
+            token,
+            self.association_history.timeout_for(profile.ssid),
+            connected_before=connected_before,
+        )
+        if outcome == "connected":
+            self.association_history.record(profile.ssid, time.perf_counter() - start)
+        return outcome
+
+    def raise_if_recently_failed(self, ssid: str, credential: Optional[str]) -> None:
+        """
+        Raise if the same network (and password) failed moments ago.
+
+        Raises:
+            ConnectionFailed: With the "negative_cache" error class
+        """
+        entry: Optional[NegativeEntry] = self.negative_cache.check(ssid, credential)
+        if entry is not None:
+            raise ConnectionFailed("negative_cache", NegativeCache.explain(ssid, entry))
+
+    @contextmanager
+    def _phase(
+        self,
+        attempt: ConnectionAttempt,
+        phase: str,
+        on_phase: Optional[Callable[[str, Optional[float]], None]],
+    ) -> Iterator[None]:
+        """Times one phase of a connection attempt, including failed ones."""
+        if on_phase:
+            on_phase(phase, None)
+        start: float = time.perf_counter()
+        try:
+            yield
+        finally:
+            attempt.timings[phase] = time.perf_counter() - start
+            if on_phase:
+                on_phase(phase, attempt.timings[phase])
+
+    def connect(
+        self,
+        ssid: str,
+        *,
+        token: Optional[CancellationToken] = None,
+        on_phase: Optional[Callable[[str, Optional[float]], None]] = None,
+        request_password: Optional[Callable[[str], Optional[str]]] = None,
+        force: bool = False,
+        resolved: Optional[Tuple[Any, str, float]] = None,
+    ) -> ConnectionAttempt:
+        """
+        Connects to a network, running through the phases in CONNECT_PHASES.
+
+        This blocks, so the GUI runs it on a ConnectWorker. The credentials and
+        add_profile phases are skipped when Windows already has a saved profile.
+
+        Args:
+            ssid: The name of the network
+            token: Cancels the attempt between (and during) blocking steps
+            on_phase: Called with (phase, None) when a phase starts and with
+                (phase, seconds) when it ends
+            request_password: Called with the SSID when a password is needed;
+                returns the password, or None if the user cancelled
+            force: Retry even if the same attempt failed moments ago
+            resolved: The (network, source, seconds taken) from
+                resolve_networks, if the caller already resolved it; those
+                seconds are recorded as the resolve phase
+
+        Returns:
+            ConnectionAttempt: The outcome, with per-phase timings
+        """
+        token = token or CancellationToken()
+        attempt = ConnectionAttempt(ssid)
+        credential: Optional[str] = None
+
+        try:
+            if not self.is_valid_wifi_name(ssid):
+                raise ConnectionFailed("invalid_name", "Invalid Wi-Fi name")
 
-        if result["status"] == "ssid_set":
-            return result.get(
-                "message",
-                f"Wi-Fi network set to: {self.current_ssid}. Password dialog will appear if required.",
+            # Fail fast if the network was just unreachable
+            if not force:
+                self.raise_if_recently_failed(ssid, None)
+
+            if resolved is None:
+                with self._phase(attempt, "resolve", on_phase):
+                    network, attempt.resolved_from = self.resolve_network(ssid, token)
+            else:
+                network, attempt.resolved_from, attempt.timings["resolve"] = resolved
+            if not network:
+                raise ConnectionFailed("not_found", f"Network '{ssid}' not found")
+
+            self.current_ssid = ssid
+            self.requires_password = self.network_requires_password(network)
+            token.raise_if_cancelled()
+
+            with self._phase(attempt, "profile_lookup", on_phase):
+                profile = self.find_saved_profile(ssid)
+            saved: bool = profile is not None
+            token.raise_if_cancelled()
+
+            if not saved:
+                with self._phase(attempt, "credentials", on_phase):
+                    self.password = None
+                    if self.requires_password:
+                        if request_password:
+                            self.password = request_password(ssid)
+                        if self.password is None:
+                            raise OperationCancelled(
+                                f"Connection to {ssid} cancelled by user."
+                            )
+                    credential = self.password
+
+                    # Fail fast on a password that was just rejected
+                    if credential and not force:
+                        self.raise_if_recently_failed(ssid, credential)
+                token.raise_if_cancelled()
+
+                with self._phase(attempt, "add_profile", on_phase):
+                    profile = self.profiles.add(
+                        self.build_profile(network, self.password)
+                    )
+
+            with self._phase(attempt, "associate", on_phase):
+                outcome: str = self.associate(profile, token)
+            if outcome != "connected":
+                error_class: str = f"association_{outcome}"
+                if saved:
+                    raise ConnectionFailed(
+                        error_class,
+                        f"Failed to connect to {ssid} using saved profile. You may need to provide a password.",
+                    )
+                raise ConnectionFailed(
+                    error_class,
+                    f"Failed to connect to {ssid}. "
+                    + (
+                        "Check your password or network availability."
+                        if self.requires_password
+                        else "Check network availability."
+                    ),
+                )
+
+            with self._phase(attempt, "verify", on_phase):
+                verified: bool = self.iface.status() == pywifi.const.IFACE_CONNECTED
+            if not verified:
+                raise ConnectionFailed(
+                    "verify_failed",
+                    f"Connection to {ssid} dropped right after it was made.",
+                )
+
+            attempt.status = "success"
+            self.negative_cache.forget(ssid)
+            clear_user_disconnect()
+            attempt.message = (
+                f"Successfully connected to {ssid} using saved profile"
+                if saved
+                else f"Successfully connected to {ssid}"
             )
+        except OperationCancelled as e:
+            attempt.status = "cancelled"
+            attempt.message = str(e) or f"Connection to {ssid} cancelled."
+            attempt.error_class = "cancelled"
+        except ConnectionFailed as e:
+            attempt.status = "error"
+            attempt.message = str(e)
+            attempt.error_class = e.error_class
+            if e.error_class != "negative_cache":
+                self.negative_cache.remember(
+                    ssid, credential, e.error_class, attempt.message
+                )
+        except Exception as e:
+            attempt.status = "error"
+            attempt.message = f"Error connecting to {ssid}: {e}"
+            attempt.error_class = type(e).__name__
+            attempt.exception = e
+
+        self.telemetry.record(attempt)
+        return attempt
+
+    def connect_any(
+        self,
+        ssids: List[str],
+        *,
+        token: Optional[CancellationToken] = None,
+        on_phase: Optional[Callable[[str, Optional[float]], None]] = None,
+        on_target: Optional[Callable[[str], None]] = None,
+        request_password: Optional[Callable[[str], Optional[str]]] = None,
+        force: bool = False,
+    ) -> ConnectionAttempt:
+        """
+        Connects to the first of several networks that associates.
 
-        if result["status"] in ["ready_to_connect", "use_saved_profile"]:
-            # Attempt to connect
-            connection_result: dict[str, str] = self.connect_to_network()
-            return result.get("message", "") + "\n" + connection_result["message"]
+        Every target is resolved up front against one snapshot (or one scan),
+        then the targets are tried in priority order. Targets that were not
+        found are skipped without waiting for them to time out.
 
-        return "Unknown command"
+        Args:
+            ssids: The networks, highest priority first
+            token: Cancels the whole list
+            on_phase: See connect()
+            on_target: Called with each SSID as it is tried
+            request_password: See connect()
+            force: See connect()
+
+        Returns:
+            ConnectionAttempt: The winning attempt, or the last failure; its
+            message lists the targets that were skipped or failed first
+        """
+        token = token or CancellationToken()
+        failures: List[str] = []
+
+        if on_phase:
+            on_phase("resolve", None)
+        start: float = time.perf_counter()
+        try:
+            found, sources = self.resolve_networks(ssids, token)
+        except OperationCancelled as e:
+            cancelled = ConnectionAttempt(
+                " | ".join(ssids), "cancelled", str(e), error_class="cancelled"
+            )
+            self.telemetry.record(cancelled)
+            return cancelled
+        resolve_time: float = time.perf_counter() - start
+        if on_phase:
+            on_phase("resolve", resolve_time)
+
+        attempt: Optional[ConnectionAttempt] = None
+        for ssid in ssids:
+            if ssid not in found:
+                failures.append(f"{ssid}: not found")
+                continue
+
+            if on_target:
+                on_target(ssid)
+            attempt = self.connect(
+                ssid,
+                token=token,
+                on_phase=on_phase,
+                request_password=request_password,
+                force=force,
+                # The targets share one resolve, recorded with each attempt
+                resolved=(found[ssid], sources[ssid], resolve_time),
+            )
+
+            if attempt.succeeded or attempt.status == "cancelled":
+                break
+            failures.append(f"{ssid}: {attempt.error_class}")
+
+        if attempt is None:
+            attempt = ConnectionAttempt(
+                " | ".join(ssids),
+                "error",
+                f"None of the networks were found ({', '.join(ssids)})",
+                {"resolve": resolve_time},
+                "not_found",
+            )
+            self.telemetry.record(attempt)
+            return attempt
+
+        if failures:
+            attempt.message += f" (skipped {'; '.join(failures)})"
+        return attempt
+
+    def process_input(self, user_input) -> str:
+        """Process user input and connect synchronously (used by the CLI)"""
+        connect_match = re.match(r"^(?:c|connect)=(.+?)(\s+--force)?$", user_input)
+        if connect_match:
+            # "c=A | B | C" tries each network in order
+            ssids: List[str] = [
+                ssid.strip() for ssid in connect_match.group(1).split("|")
+            ]
+            attempt: ConnectionAttempt = self.connect_any(
+                [ssid for ssid in ssids if ssid],
+                request_password=self.show_password_dialog,
+                force=bool(connect_match.group(2)),
+            )
+            return attempt.message
+
+        # Password command no longer needed due to dialog
+        if re.match(r"^(?:p|password)=(.+)$", user_input):
+            return "Password entry via command line is disabled. Please use the graphical interface."
+
+        return "Invalid command format. Use c=WIFINAME to connect to a network"
 
 
 def main() -> None:
@@ -457,15 +649,32 @@ def main() -> None:
     parser.add_argument(
         "-c", "--connect", help="Wi-Fi network name to connect to", type=str
     )
+    parser.add_argument(
+        "--snapshot-max-age",
+        help="Seconds a background scanner snapshot is trusted for (0 always scans)",
+        type=float,
+        default=SNAPSHOT_MAX_AGE,
+    )
+    parser.add_argument(
+        "--force",
+        help="Retry even if the network failed moments ago",
+        action="store_true",
+    )
     args: Namespace = parser.parse_args()
 
-    connector = WiFiConnector()
+    try:
+        connector = WiFiConnector(snapshot_max_age=args.snapshot_max_age)
+    except NoWirelessInterface as e:
+        print(f"Error: {e}")
+        sys.exit(1)
     print("Wi-Fi Connection Utility")
     print("------------------------")
 
     # If Wi-Fi name is provided as an argument, connect to it directly
     if args.connect:
-        result: str = connector.process_input(f"connect={args.connect}")
+        result: str = connector.process_input(
+            f"connect={args.connect}" + (" --force" if args.force else "")
+        )
         print(result)
         return
 
@@ -474,6 +683,7 @@ def main() -> None:
     print(
         "  c=WIFINAME or connect=WIFINAME - Set Wi-Fi network to connect to (will show password dialog if needed)"
     )
+    print("  c=WIFINAME --force - Retry a network that failed moments ago")
     print("  exit - Exit the program")
 
     while True:
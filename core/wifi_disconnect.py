@@ -1,63 +1,137 @@
 # Built-in Modules
+import time
 from pathlib import Path
+from typing import Optional, Tuple
 
 # Third-Party Modules
 import pywifi
-
-# PyQt6 Modules
-from PyQt6.QtCore import QTimer
 from pywifi import const
 
 # Helpers Modules
-from helpers import (
-    get_and_apply_styles,
-    hide_output_box_with_animation,
-    processing,
-    show_output_box_with_animation,
-)
+from helpers import CancellationToken
 
+# Constants
+DISCONNECT_TIMEOUT: float = 2.0  # seconds to wait for the status to change
+DISCONNECT_POLL_INTERVAL: float = 0.05
+ALREADY_DISCONNECTED: str = "Already disconnected from Wi-Fi."
 
-def disconnect(self) -> None:
-    """Disconnects from the current Wi-Fi network using pywifi."""
-    processing(self, begin=True)
-    success = False
-    message = "❌ Failed to disconnect from Wi-Fi."
-    style_file = "output_box_failure.qss"
+# Present while the user has disconnected on purpose; auto-connect stays off
+# until the next successful connect removes it
+USER_DISCONNECT_FILE: Path = Path(__file__).parent / "user_disconnected"
+
+
+def user_disconnected(path: Path = USER_DISCONNECT_FILE) -> bool:
+    """Returns True if the user disconnected and has not connected since."""
+    return path.exists()
+
+
+def clear_user_disconnect(path: Path = USER_DISCONNECT_FILE) -> None:
+    """Forgets a manual disconnect, e.g. once a connection succeeds."""
+    try:
+        path.unlink(missing_ok=True)
+    except OSError as e:
+        print(f"Could not remove {path}: {e}")
 
+
+def _mark_user_disconnect(path: Path = USER_DISCONNECT_FILE) -> None:
     try:
-        wifi = pywifi.PyWiFi()
-        interfaces = wifi.interfaces()
-        if not interfaces:
-            message = "❌ No Wi-Fi interfaces found."
+        path.write_text(time.strftime("%Y-%m-%d %H:%M:%S"))
+    except OSError as e:
+        print(f"Could not write {path}: {e}")
+
+
+def wait_for_disconnect(
+    iface,
+    timeout: float = DISCONNECT_TIMEOUT,
+    token: Optional[CancellationToken] = None,
+) -> bool:
+    """
+    Polls the interface until it reports disconnected.
+
+    Args:
+        iface: The interface disconnect() was called on
+        timeout: How long to wait, in seconds
+        token: Checked between status polls, if given
+
+    Returns:
+        bool: True once disconnected, False if the status did not change in time
+
+    Raises:
+        OperationCancelled: If the token is cancelled while waiting
+    """
+    deadline: float = time.perf_counter() + timeout
+    while iface.status() != const.IFACE_DISCONNECTED:
+        if time.perf_counter() >= deadline:
+            return False
+        if token is not None:
+            token.wait(DISCONNECT_POLL_INTERVAL)
         else:
-            iface = interfaces[0]  # Use the first available interface
-            if iface.status() in [const.IFACE_CONNECTED, const.IFACE_CONNECTING]:
-                iface.disconnect()
-                # Check status again after attempting disconnect
-                # Give it a moment to update status
-                import time
-
-                time.sleep(1)
-                if iface.status() == const.IFACE_DISCONNECTED:
-                    success = True
-                    message = "✅ Successfully disconnected from Wi-Fi."
-                    style_file = "output_box_success.qss"
-                else:
-                    # Sometimes disconnect might fail silently or status update is slow
-                    message = "❌ Disconnect command sent, but status didn't change."
-            elif iface.status() == const.IFACE_DISCONNECTED:
-                success = True  # Already disconnected
-                message = "ℹ️ Already disconnected from Wi-Fi."
-                style_file = "output_box_success.qss"  # Use success style for info
-            else:
-                message = f"❌ Unknown interface status: {iface.status()}"
+            time.sleep(DISCONNECT_POLL_INTERVAL)
+    return True
+
+
+def disconnect_interface(iface=None) -> Tuple[bool, str]:
+    """
+    Disconnects the Wi-Fi interface and waits for the status to change.
+
+    Meant for a disconnect the user asked for: the scanner's auto-connect is
+    paused until the next successful connect (see user_disconnected).
+
+    Args:
+        iface: The interface; defaults to the first one pywifi finds
+
+    Returns:
+        tuple: (True if the interface is disconnected afterwards, a message)
+    """
+    try:
+        if iface is None:
+            iface = pywifi.PyWiFi().interfaces()[0]  # the first available interface
+
+        if iface.status() in [const.IFACE_CONNECTED, const.IFACE_CONNECTING]:
+            iface.disconnect()
+            # Returns as soon as the status changes instead of a fixed wait
+            if wait_for_disconnect(iface):
+                _mark_user_disconnect()
+                return (True, "Successfully disconnected from Wi-Fi.")
+            # Sometimes disconnect might fail silently or status update is slow
+            return (False, "Disconnect command sent, but status didn't change.")
+        if iface.status() == const.IFACE_DISCONNECTED:
+            _mark_user_disconnect()
+            return (True, ALREADY_DISCONNECTED)
+        return (False, f"Unknown interface status: {iface.status()}")
 
     except IndexError:
-        message = "❌ No Wi-Fi interfaces found."
+        return (False, "No Wi-Fi interfaces found.")
     except Exception as e:
         # Catching a broad exception might be necessary as pywifi errors aren't well-documented
-        message = f"❌ An error occurred: {e}"
-        print(f"⚠ Error during Wi-Fi disconnect: {e}")
+        return (False, f"An error occurred: {e}")
+
+
+def disconnect(self) -> bool:
+    """
+    Disconnects from the current Wi-Fi network and shows the result.
+
+    Returns:
+        bool: True if the interface is disconnected afterwards
+    """
+    # PyQt6 Modules
+    from PyQt6.QtCore import QTimer
+
+    # Helpers Modules
+    from helpers import (
+        get_and_apply_styles,
+        hide_output_box_with_animation,
+        processing,
+        show_output_box_with_animation,
+    )
+
+    processing(self, begin=True)
+    success, message = disconnect_interface()
+    if message == ALREADY_DISCONNECTED:
+        message = f"ℹ️ {message}"  # Use success style for info
+    else:
+        message = f"{'✅' if success else '❌'} {message}"
+    style_file: str = "output_box_success.qss" if success else "output_box_failure.qss"
 
     # Apply styles and set text
     get_and_apply_styles(
@@ -74,3 +148,5 @@ def disconnect(self) -> None:
 
     # Enable the command bar after the hide animation is complete (1200ms total)
     QTimer.singleShot(1200, lambda: processing(self, end=True))
+
+    return success
@@ -3,57 +3,87 @@ import json
 import subprocess
 import sys
 import time
+import weakref
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Set, Tuple
+from typing import Callable, Dict, FrozenSet, List, Optional, Tuple
 
 # Psutil Modules
 import psutil
 
-# QtAwesome Modules
-import qtawesome as qta
-
 # PyQt6 Modules
-from PyQt6.QtCore import QSize, Qt
-from PyQt6.QtGui import QIcon
-from PyQt6.QtWidgets import QHBoxLayout, QLabel, QTableWidget, QWidget
+from PyQt6.QtCore import (
+    QCoreApplication,
+    QObject,
+    QRunnable,
+    QThreadPool,
+    QTimer,
+    pyqtSignal,
+)
+from PyQt6.QtGui import QGuiApplication, QPixmap, QScreen
+from PyQt6.QtWidgets import QTableView, QWidget
 
 # PyWiFi Modules
 from pywifi import PyWiFi, const, iface
 
+# Core Modules
+from core.icon_atlas import Glyph, IconAtlas
+from core.metrics import RollingHistogram
+from core.network_details import describe_frequency, describe_security
+from core.profile_index import shared_profile_index
+from core.wifi_snapshot import WIFI_DATA_FILE, NetworkEntry, WifiCache, read_snapshot
+
 # Helpers Modules
-from helpers import Buttons, Icons, MessageBox
+from helpers import (
+    Buttons,
+    CancellationToken,
+    Icons,
+    MessageBox,
+    OperationCancelled,
+    show_status_notice,
+)
 
 
-class WifiCache:
-    """A class to handle WiFi network caching with timeout functionality."""
+def _load_networks(path: Path) -> Tuple[int, List[NetworkEntry]]:
+    """
+    Reads the scanner's snapshot and converts it to table rows.
 
-    def __init__(self, timeout_seconds: int = 10) -> None:
-        """Initialize the cache with a specified timeout period."""
-        self.data: Optional[List] = None
-        self.timestamp: float = 0
-        self.timeout: int = timeout_seconds
+    Args:
+        path: The path to the snapshot file
 
-    def is_valid(self) -> bool:
-        """Check if the cache contains valid, non-expired data."""
-        return self.data is not None and time.time() - self.timestamp < self.timeout
+    Returns:
+        A tuple of the snapshot sequence number and the list of
+        NetworkEntry rows without duplicates
+    """
+    snapshot: Dict = read_snapshot(path)
+    sequence: int = snapshot.get("sequence", 0)
 
-    def update(self, data: List) -> None:
-        """Update the cache with new data and reset the timestamp."""
-        self.data = data
-        self.timestamp = time.time()
+    # Kept until the snapshot is shown, to measure its scan-to-screen latency
+    if snapshot.get("scan_completed") is not None:
+        _scan_completed[sequence] = float(snapshot["scan_completed"])
+        for old in sorted(_scan_completed)[:-MAX_PENDING_SCANS]:
+            _scan_completed.pop(old, None)
 
-    def clear(self) -> None:
-        """Clear the cache data."""
-        self.data = None
-        self.timestamp = 0
+    seen_ssids = set()
+    result: List[NetworkEntry] = []
+    for item in snapshot["networks"]:
+        ssid = item["ssid"]
+        if ssid not in seen_ssids:
+            result.append(NetworkEntry.from_snapshot(item))
+            seen_ssids.add(ssid)
 
+    return sequence, result
 
-# Constants
-WIFI_DATA_FILE: Path = Path(__file__).parent / "wifi_data.json"
+
+# Scan-to-screen latency: from the scanner's scan-complete stamp to the table
+# update that first shows the snapshot
+MAX_PENDING_SCANS: int = 16  # scan stamps kept for snapshots not shown yet
+render_latency = RollingHistogram()
+_scan_completed: Dict[int, float] = {}  # sequence -> time.monotonic() stamp
+_last_rendered_sequence: int = 0
 
 # Global WiFi cache instance
-_wifi_cache = WifiCache(timeout_seconds=10)
+_wifi_cache = WifiCache(_load_networks, WIFI_DATA_FILE)
 
 # Global PyWiFi interface (initialized once)
 _wifi_interface = None
@@ -82,25 +112,79 @@ def get_wifi_interface() -> Optional[iface.Interface]:
     return None
 
 
-def load_wifi_networks(table: QTableWidget, *, force_refresh: bool = False) -> None:
+def load_wifi_networks(table: QTableView, *, force_refresh: bool = False) -> None:
     """
-    Loads the list of available Wi-Fi networks into the given QTableWidget.
+    Loads the list of available Wi-Fi networks into the given network table.
 
     Args:
-        table: The QTableWidget to load the networks into
+        table: The NetworkTableView to load the networks into
         force_refresh: If True, forces a refresh of the network data
     """
-    networks: List[Tuple[str | int | bool]] = get_wifi_networks(
-        force_refresh=force_refresh
+    window: QWidget = table.window()
+
+    def notify(message: str) -> None:
+        if hasattr(window, "output_box"):
+            show_status_notice(window, message, duration=2500)
+
+    networks: List[NetworkEntry] = get_wifi_networks(
+        force_refresh=force_refresh,
+        on_fallback=lambda networks: populate_table(table, networks),
+        notify=notify,
     )
+    populate_table(table, networks)
 
-    # Optimize table updates by setting row count once
-    table.setRowCount(len(networks))
 
-    # Update table widgets
-    for row, (ssid, strength, requires_login) in enumerate(networks):
-        table.setCellWidget(row, 0, get_network_name_widget(ssid, requires_login))
-        table.setCellWidget(row, 1, get_signal_icon(strength))
+def poll_wifi_networks(table: QTableView) -> None:
+    """
+    Pushes the scanner's latest snapshot into the network table.
+
+    Meant to be called on a timer: it only consults the Wi-Fi cache, without
+    checking the scanner process or starting a fallback scan.
+
+    Args:
+        table: The NetworkTableView to update
+    """
+    try:
+        networks: List[NetworkEntry] = _wifi_cache.get()
+    except (OSError, ValueError, KeyError):
+        return
+    populate_table(table, networks)
+
+
+def populate_table(table: QTableView, networks: List[NetworkEntry]) -> None:
+    """
+    Shows the given networks in the network table.
+
+    Args:
+        table: The NetworkTableView to fill
+        networks: A list of NetworkEntry rows
+    """
+    table.set_networks(networks)
+    _record_render(networks)
+
+
+def _record_render(networks: List[NetworkEntry]) -> None:
+    """
+    Records the scan-to-screen latency of a snapshot the first time it is shown.
+
+    Rows that did not come from the cached snapshot (a fallback scan, or a
+    stale list while the cache was refreshed) and snapshots without a scan
+    stamp are not measured.
+    """
+    global _last_rendered_sequence
+
+    sequence, cached = _wifi_cache.current()
+    # Not "<=": the sequence starts over when the scanner restarts
+    if cached is not networks or sequence == _last_rendered_sequence:
+        return
+    _last_rendered_sequence = sequence
+
+    scan_completed: Optional[float] = _scan_completed.pop(sequence, None)
+    # Written by the cache's refresh thread: iterate over a copy of the keys
+    for old in [key for key in list(_scan_completed) if key < sequence]:
+        _scan_completed.pop(old, None)
+    if scan_completed is not None:
+        render_latency.observe(max(0.0, time.monotonic() - scan_completed))
 
 
 def is_wifi_scanner_running() -> bool:
@@ -155,20 +239,32 @@ def start_wifi_scanner() -> None:
         raise
 
 
-def get_wifi_networks(force_refresh: bool = False) -> List[Tuple[str, int, bool]]:
+def get_wifi_networks(
+    force_refresh: bool = False,
+    *,
+    on_fallback: Optional[Callable[[List], None]] = None,
+    notify: Optional[Callable[[str], None]] = None,
+) -> List[NetworkEntry]:
     """
     Retrieves a list of available Wi-Fi networks and their respective signal strengths.
 
     The list is sorted by signal strength in descending order (strongest first).
-    Results are cached to improve performance with a timeout of 10 seconds.
-    Primarily reads from the JSON file created by the background scanner.
+    Primarily reads from the JSON file created by the background scanner. Results
+    are cached and revalidated against the file's version, so a newer snapshot is
+    picked up in the background without blocking the caller.
+
+    If the file is missing or corrupt, a direct scan is started on a worker
+    thread and an empty list is returned; the scan result is delivered later
+    through `on_fallback`.
 
     Args:
         force_refresh: If True, ignores cached data and fetches fresh data
+        on_fallback: Called with the networks found by a fallback scan
+        notify: Called with non-blocking status messages about the fallback
 
     Returns:
-        A list of tuples containing the available Wi-Fi networks and their properties
-        Each tuple contains (ssid, signal_strength, requires_login)
+        A list of NetworkEntry tuples containing the available Wi-Fi networks and
+        their properties (ssid, signal_strength, requires_login, security, ...)
     """
     # Check if wifi_scanner.py is running, start it if not
     if not is_wifi_scanner_running():
@@ -185,157 +281,198 @@ def get_wifi_networks(force_refresh: bool = False) -> List[Tuple[str, int, bool]
             not_started_msg_box.show()
             return []
 
-    # Use cached data if available and not forced to refresh
-    if not force_refresh and _wifi_cache.is_valid():
-        return _wifi_cache.data
-
     try:
-        # Load from file (primary method)
-        with open(WIFI_DATA_FILE, "r") as f:
-            wifi_data = json.load(f)
-
-        # Convert loaded data to the expected format and remove duplicates
-        seen_ssids = set()
-        result: List[Tuple[str, int, bool]] = []
-        for item in wifi_data:
-            ssid = item["ssid"]
-            if ssid not in seen_ssids:
-                result.append((ssid, item["strength"], item["requires_login"]))
-                seen_ssids.add(ssid)
-
-        # Update cache with the result
-        _wifi_cache.update(result)
-        return result
+        # Served from the cache unless the scanner has published a new snapshot
+        return _wifi_cache.get(force_refresh=force_refresh)
 
     except (FileNotFoundError, json.JSONDecodeError) as e:
-        msg_box = MessageBox(
-            title="Json File Not Found",
-            text=f"Error reading Wi-Fi data from file: {e}. Falling back to scanning.",
-            fixed_size=(502, 147),
-            icon=Icons.Critical,
-            buttons=Buttons.Ok,
-        )
-        msg_box.show()
-
         # Fallback to direct scanning only if file doesn't exist or is corrupt
         # This code will only run if the background scanner isn't working
-        try:
-            Iface: iface.Interface | None = get_wifi_interface()
-            if not Iface:
-                return []
+        if notify:
+            notify(f"Wi-Fi data unavailable ({e}). Scanning in the background...")
+        start_fallback_scan(on_finished=on_fallback, on_failed=notify)
+        return []
 
-            # Get saved profiles (connections) once
-            saved_profiles: Set[str] = {
-                profile.ssid for profile in Iface.network_profiles()
-            }
 
-            # Trigger scan
-            Iface.scan()
+def scan_networks_directly(token: CancellationToken) -> List[NetworkEntry]:
+    """
+    Scans for networks through the Wi-Fi interface, bypassing the scanner's file.
 
-            # Wait just enough time for the scan to complete
-            time.sleep(0.8)
+    Runs on a worker thread; the token is checked between the blocking steps.
 
-            # Get scan results
-            scan_results: list = Iface.scan_results()
+    Args:
+        token: The cancellation token of the calling worker
 
-            # Process scan results more efficiently
-            networks_dict: Dict[str, Tuple[str, int, bool]] = {}
+    Returns:
+        A list of NetworkEntry rows, strongest first
 
-            for result in scan_results:
-                ssid: str = result.ssid
-                if not ssid:  # Skip networks with empty SSIDs
-                    continue
+    Raises:
+        OperationCancelled: If the token is cancelled while scanning
+    """
+    Iface: iface.Interface | None = get_wifi_interface()
+    if not Iface:
+        return []
 
-                # Convert signal strength (dBm) to percentage (0-100%)
-                signal_strength: int = min(max(0, (result.signal + 100) * 2), 100)
-                signal_percent = int(signal_strength)
+    # Saved profiles (connections), from the index shared with the connector
+    saved_profiles: FrozenSet[str] = shared_profile_index(Iface).ssids()
+    token.raise_if_cancelled()
 
-                # Check if authentication is required (simplified check)
-                requires_login: bool = (
-                    result.akm[0] != const.AKM_TYPE_NONE and ssid not in saved_profiles
-                )
+    # Trigger scan
+    Iface.scan()
 
-                # Keep only the strongest signal for each SSID
-                if ssid not in networks_dict or signal_percent > networks_dict[ssid][1]:
-                    networks_dict[ssid] = (ssid, signal_percent, requires_login)
+    # Wait just enough time for the scan to complete
+    token.wait(0.8)
 
-            # Convert to list and sort only once
-            result: List[Tuple[str, int, bool]] = sorted(
-                networks_dict.values(), key=lambda x: x[1], reverse=True
-            )[:6]
+    # Get scan results
+    scan_results: list = Iface.scan_results()
 
-            # Update cache with the result
-            _wifi_cache.update(result)
+    # Process scan results more efficiently
+    current_time: str = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime())
+    networks_dict: Dict[str, NetworkEntry] = {}
 
-            return result[:6]  # Return only the top 6
+    for result in scan_results:
+        ssid: str = result.ssid
+        if not ssid:  # Skip networks with empty SSIDs
+            continue
 
-        except Exception as e:
-            retrieving_msg_box = MessageBox(
-                title="Retrieving Error",
-                text=f"Error retrieving Wi-Fi networks: {e}",
-                icon=Icons.Critical,
-                buttons=Buttons.Ok,
+        # Convert signal strength (dBm) to percentage (0-100%)
+        signal_strength: int = min(max(0, (result.signal + 100) * 2), 100)
+        signal_percent = int(signal_strength)
+
+        # Check if authentication is required (simplified check)
+        requires_login: bool = (
+            result.akm[0] != const.AKM_TYPE_NONE and ssid not in saved_profiles
+        )
+
+        # Keep only the strongest signal for each SSID
+        if ssid not in networks_dict or signal_percent > networks_dict[ssid].strength:
+            _, channel, band = describe_frequency(getattr(result, "freq", 0))
+            networks_dict[ssid] = NetworkEntry(
+                ssid,
+                signal_percent,
+                requires_login,
+                describe_security(result.akm),
+                channel,
+                band,
+                current_time,
             )
-            retrieving_msg_box.show()
-            return []
 
+    # Convert to list and sort only once
+    return sorted(networks_dict.values(), key=lambda x: x.strength, reverse=True)
+
+
+class FallbackScanSignals(QObject):
+    finished = pyqtSignal(list)
+    failed = pyqtSignal(str)
+
+
+class FallbackScanWorker(QRunnable):
+    """Runs scan_networks_directly on the global thread pool."""
 
-# Styling constants to avoid string repetition
-_LABEL_STYLE = """
-    color: #ffffff;
-    font-size: 14px;
-    font-weight: 700;
-    font-family: Cambria, Georgia, serif;
-"""
+    def __init__(self, token: CancellationToken) -> None:
+        super().__init__()
+        self.token = token
+        self.signals = FallbackScanSignals()
 
-_CONTAINER_STYLE = "background-color: transparent;"
+    def run(self) -> None:
+        """Scan and deliver the result through signals unless cancelled."""
+        try:
+            result: List[NetworkEntry] = scan_networks_directly(self.token)
+        except OperationCancelled:
+            return
+        except Exception as e:
+            if not self.token.is_cancelled:
+                self.signals.failed.emit(f"Error retrieving Wi-Fi networks: {e}")
+            return
+
+        if not self.token.is_cancelled:
+            self.signals.finished.emit(result)
+
+
+# The fallback scan in flight, if any (only one runs at a time)
+_fallback_worker: Optional[FallbackScanWorker] = None
 
+# Finished workers, kept alive until every slot queued by their signals has run
+_finished_workers: List[FallbackScanWorker] = []
 
-@lru_cache(maxsize=1)
-def get_label_style() -> str:
-    """Returns the cached style sheet for labels."""
-    return _LABEL_STYLE
+# Whether cancel_fallback_scan has been connected to aboutToQuit
+_cancel_on_quit: bool = False
 
 
-def get_network_name_widget(ssid: str, requires_login: bool) -> QWidget:
+def start_fallback_scan(
+    *,
+    on_finished: Optional[Callable[[List], None]] = None,
+    on_failed: Optional[Callable[[str], None]] = None,
+) -> FallbackScanWorker:
     """
-    Generates a QWidget containing a QLabel with the given ssid and a
-    QIcon of a lock if the network requires login.
+    Starts a fallback scan on a worker thread, or joins the one already running.
+
+    The result is stored in the Wi-Fi cache before `on_finished` is called.
 
     Args:
-        ssid: The name of the network to be displayed
-        requires_login: Whether the network requires login or not
+        on_finished: Called on the GUI thread with the scanned networks
+        on_failed: Called on the GUI thread with an error message
 
     Returns:
-        A QWidget containing the network name and lock icon if needed
+        The running FallbackScanWorker
     """
-    container = QWidget()
-    layout = QHBoxLayout()
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setAlignment(Qt.AlignmentFlag.AlignLeft)
+    global _fallback_worker, _cancel_on_quit
+
+    if _fallback_worker is None:
+        worker = FallbackScanWorker(CancellationToken())
+        # A weak reference: the slots must not keep their own sender alive
+        worker_ref = weakref.ref(worker)
+        worker.signals.finished.connect(
+            lambda result: _on_fallback_scan_finished(worker_ref(), result)
+        )
+        worker.signals.failed.connect(
+            lambda message: _on_fallback_scan_finished(worker_ref(), message)
+        )
+
+        app: QCoreApplication | None = QCoreApplication.instance()
+        if app is not None and not _cancel_on_quit:
+            app.aboutToQuit.connect(cancel_fallback_scan)
+            _cancel_on_quit = True
+
+        _fallback_worker = worker
+        QThreadPool.globalInstance().start(worker)
 
-    # Create the SSID label
-    ssid_label = QLabel(ssid)
-    ssid_label.setStyleSheet(_LABEL_STYLE)  # Direct use of constant
-    layout.addWidget(ssid_label)
+    if on_finished:
+        _fallback_worker.signals.finished.connect(on_finished)
+    if on_failed:
+        _fallback_worker.signals.failed.connect(on_failed)
 
-    # Add lock icon if the network requires login
-    if requires_login:
-        lock_icon: QIcon = get_lock_icon()
-        lock_label = QLabel()
-        lock_label.setPixmap(lock_icon.pixmap(QSize(12, 12)))
-        layout.addWidget(lock_label)
+    return _fallback_worker
 
-    container.setStyleSheet(_CONTAINER_STYLE)  # Direct use of constant
-    container.setLayout(layout)
 
-    return container
+def _on_fallback_scan_finished(
+    worker: Optional[FallbackScanWorker], result: List | str
+) -> None:
+    """Stores a successful fallback result and releases the worker."""
+    global _fallback_worker
+
+    if isinstance(result, list):
+        _wifi_cache.update(result)
+    if worker is None:
+        return
+    if _fallback_worker is worker:
+        _fallback_worker = None
+
+    # The callers' slots run after this one, from the same emit; the worker
+    # and its signals are released once they have all run
+    _finished_workers.append(worker)
+    QTimer.singleShot(0, lambda: _finished_workers.remove(worker))
 
 
-@lru_cache(maxsize=1)
-def get_lock_icon() -> QIcon:
-    """Returns a cached lock icon."""
-    return qta.icon("mdi.lock", color="#ffffff")
+def cancel_fallback_scan() -> bool:
+    """Cancels the fallback scan in flight; returns False if there is none."""
+    global _fallback_worker
+
+    if _fallback_worker is None:
+        return False
+    _fallback_worker.token.cancel("Fallback scan cancelled")
+    _fallback_worker = None
+    return True
 
 
 # Signal strength constants
@@ -346,6 +483,31 @@ _SIGNAL_LEVELS: List[Tuple[int | str]] = [
     (1, "mdi6.wifi-strength-1", "#ff0000"),  # Poor signal (red)
     (0, "mdi6.wifi-strength-off", "#777777"),  # No signal (gray)
 ]
+_SIGNAL_ICON_SIZE = 16
+
+_LOCK_GLYPH: Glyph = ("mdi.lock", "#ffffff", 12)
+
+# Every glyph the table can show, rendered together into one atlas per DPR
+_ATLAS_GLYPHS: List[Glyph] = [
+    (icon_name, color, _SIGNAL_ICON_SIZE) for _, icon_name, color in _SIGNAL_LEVELS
+] + [_LOCK_GLYPH]
+
+
+def _device_pixel_ratio() -> float:
+    """Returns the device pixel ratio of the primary screen."""
+    screen: QScreen | None = QGuiApplication.primaryScreen()
+    return screen.devicePixelRatio() if screen else 1.0
+
+
+@lru_cache(maxsize=4)  # One atlas per DPR in use
+def get_icon_atlas(dpr: float) -> IconAtlas:
+    """Returns the icon atlas for the given device pixel ratio."""
+    return IconAtlas(_ATLAS_GLYPHS, dpr)
+
+
+def get_lock_pixmap() -> QPixmap:
+    """Returns the pre-rendered lock pixmap."""
+    return get_icon_atlas(_device_pixel_ratio()).pixmap(*_LOCK_GLYPH)
 
 
 @lru_cache(maxsize=101)  # Cache for all possible strength values (0-100)
@@ -367,60 +529,53 @@ def _get_signal_icon_data(strength: int) -> Tuple[str, str]:
     return ("mdi6.wifi-strength-off", "#777777")
 
 
-@lru_cache(maxsize=101)  # Cache icons for all possible strength values
-def get_cached_wifi_icon(strength: int) -> QIcon:
-    """Returns a cached WiFi icon for a given strength."""
+def get_cached_wifi_pixmap(strength: int) -> QPixmap:
+    """Returns the pre-rendered WiFi pixmap for a given strength."""
     icon_name, color = _get_signal_icon_data(strength)
-    return qta.icon(icon_name, color=color)
+    return get_icon_atlas(_device_pixel_ratio()).pixmap(
+        icon_name, color, _SIGNAL_ICON_SIZE
+    )
 
 
-def get_signal_icon(strength: int) -> QWidget:
+def get_wifi_cache_stats() -> Dict[str, int]:
     """
-    Returns a QWidget containing a signal strength icon and its corresponding percentage value.
-
-    Args:
-        strength: Signal strength (0-100)
+    Returns the hit, miss and stale counters of the Wi-Fi data cache.
 
     Returns:
-        A QWidget containing the icon and percentage text
+        A dictionary of counter names to values
     """
-    # Use pre-cached icon
-    wifi_icon: QIcon = get_cached_wifi_icon(strength)
+    return _wifi_cache.stats()
 
-    container = QWidget()
-    layout = QHBoxLayout()
-    layout.setContentsMargins(0, 0, 0, 0)
-    layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-    # Create and add icon label
-    icon_label = QLabel()
-    icon_label.setPixmap(wifi_icon.pixmap(QSize(16, 16)))
-    layout.addWidget(icon_label)
-
-    # Create and add text label
-    text_label = QLabel(f"{strength}%")
-    text_label.setStyleSheet(_LABEL_STYLE)  # Direct use of constant
-    layout.addWidget(text_label)
-
-    container.setStyleSheet(_CONTAINER_STYLE)  # Direct use of constant
-    container.setLayout(layout)
+def get_render_latency_stats() -> Dict[str, float]:
+    """
+    Returns the scan-to-screen latency of the snapshots shown so far.
 
-    return container
+    Returns:
+        A dictionary with the sample count and the last, p50, p95 and max
+        latency of the recent samples, in seconds
+    """
+    return {
+        "count": render_latency.count,
+        "last": render_latency.last,
+        "p50": render_latency.percentile(0.5),
+        "p95": render_latency.percentile(0.95),
+        "max": max(render_latency.recent, default=0.0),
+    }
 
 
 def clear_caches() -> None:
     """
     Clears all caches used in this module.
     """
-    # Clear WiFi cache
+    # Clear WiFi cache and stop any fallback scan
     _wifi_cache.clear()
+    cancel_fallback_scan()
 
     # Reset WiFi interface
     global _wifi_interface
     _wifi_interface = None
 
     # Clear lru_cache caches
-    get_label_style.cache_clear()
-    get_lock_icon.cache_clear()
     _get_signal_icon_data.cache_clear()
-    get_cached_wifi_icon.cache_clear()
+    get_icon_atlas.cache_clear()
@@ -2,19 +2,28 @@
 # wifi_scanner.py - Background script to scan for Wi-Fi networks with system tray icon and PyQt6 GUI
 
 # Built-in Modules
-import datetime
-import json
 import os
-import socket
 import sys
 import threading
 import time
+from collections import deque
 from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Deque, List, Optional
+
+if __name__ == "__main__":
+    # Add the package root to the Python path
+    sys.path.append(str(Path(__file__).parent.parent))
+
+    # Headless mode runs only the scan loop; it is dispatched before Qt is
+    # imported, so none of it is loaded
+    if "--headless" in sys.argv[1:]:
+        from core.scanner_service import main as run_headless_scanner
+
+        sys.exit(run_headless_scanner())
 
 # PyQt6 Modules
-from PyQt6.QtCore import QObject, Qt, pyqtSignal
+from PyQt6.QtCore import QObject, Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QAction, QIcon, QPixmap
 from PyQt6.QtWidgets import (
     QApplication,
@@ -23,42 +32,27 @@ from PyQt6.QtWidgets import (
     QMainWindow,
     QMenu,
     QMessageBox,
+    QPlainTextEdit,
     QPushButton,
     QScrollBar,
     QSystemTrayIcon,
-    QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-# PyWiFi Modules
-from pywifi import PyWiFi, const, iface
-
-if __name__ == "__main__":
-    # Add the package root to the Python path
-    sys.path.append(str(Path(__file__).parent.parent))
+# Core Modules
+from core import scanner_service
+from core.scanner_service import (
+    SingleInstance,
+    log,
+    optimized_scan_wifi_networks,
+    save_to_json,
+    scanner_process,
+)
 
 # Helpers Modules
 from helpers import Blur, center_on_screen, get_and_apply_styles
 
-# Import Cython-optimized functions
-try:
-    from wifi_scanner_cy import cy_scan_wifi_networks  # type: ignore
-
-    using_cython = True
-    print("Using Cython-optimized scanning functions")
-except ImportError:
-    using_cython = False
-    print("Cython module not found, using pure Python implementation")
-
-# Constants
-WIFI_DATA_FILE: Path = Path(__file__).parent / "wifi_data.json"
-SCAN_INTERVAL = 0.5
-running = True
-last_scan_time = None
-log_messages: list = []
-MAX_LOG_MESSAGES = 100
-
 # For Windows console hiding
 if os.name == "nt":
     import ctypes
@@ -68,201 +62,17 @@ if os.name == "nt":
     ctypes.windll.user32.ShowWindow(console_hwnd, 0)
 
 
-# Single Instance Check
-class SingleInstance:
-    """Ensure only one instance of the application is running."""
-
-    def __init__(self, port=50000) -> None:
-        """
-        Initialize single instance check using a socket.
-
-        Args:
-            port (int): Port to use for single instance check
-        """
-        self.port = port
-        self.socket = None
-
-    def already_running(self) -> bool:
-        """
-        Check if another instance is already running.
-
-        Returns:
-            bool: True if another instance is running, False otherwise
-        """
-        try:
-            # Try to create a socket and bind to a specific port
-            self.socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-            self.socket.bind(("127.0.0.1", self.port))
-            self.socket.listen(1)
-            return False
-        except socket.error:
-            # Port is already in use, meaning another instance is running
-            return True
-
-    def __del__(self) -> None:
-        """Close the socket when the object is deleted."""
-        if hasattr(self, "socket") and self.socket:
-            try:
-                self.socket.close()
-            except:
-                pass
+LOG_FLUSH_INTERVAL = 200  # ms between two batches of log lines in the console
+METRICS_REFRESH_INTERVAL = 1000  # ms between two updates of the metrics table
 
 
 # Signal class for cross-thread communication
 class Signals(QObject):
-    update_log = pyqtSignal(str)
     update_scan_time = pyqtSignal(str)
 
 
 signals = Signals()
-
-
-def log(message) -> None:
-    """Log a message to console and emit signal for GUI."""
-    timestamp: str = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    log_entry: str = f"[{timestamp}] {message}"
-    print(log_entry)
-
-    # Add to log messages
-    log_messages.append(log_entry)
-    if len(log_messages) > MAX_LOG_MESSAGES:
-        log_messages.pop(0)
-
-    # Emit signal for GUI update
-    signals.update_log.emit(log_entry)
-
-
-def get_wifi_interface() -> iface.Interface:
-    """Get the first available WiFi interface."""
-    try:
-        wifi = PyWiFi()
-        if wifi.interfaces():
-            return wifi.interfaces()[0]
-        else:
-            log("No WiFi interfaces found")
-            sys.exit(1)
-    except Exception as e:
-        log(f"Error initializing WiFi interface: {e}")
-        sys.exit(1)
-
-
-def scan_wifi_networks() -> List[Dict]:
-    """
-    Scan for available Wi-Fi networks.
-
-    This is the pure Python version used as fallback if Cython is not available.
-
-    Returns:
-        A list of dictionaries containing network information
-    """
-    global last_scan_time
-
-    interface: iface.Interface = get_wifi_interface()
-
-    # Get saved profiles (connections)
-    saved_profiles: Set[str] = {
-        profile.ssid for profile in interface.network_profiles()
-    }
-
-    # Trigger scan
-    interface.scan()
-
-    # Wait for scan to complete
-    time.sleep(1.0)
-
-    # Get scan results
-    scan_results = interface.scan_results()
-
-    # Process scan results
-    networks_dict: Dict[str, Dict] = {}
-
-    for result in scan_results:
-        ssid: str = result.ssid
-        if not ssid:  # Skip networks with empty SSIDs
-            continue
-
-        # Convert signal strength (dBm) to percentage (0-100%)
-        signal_strength: int = min(max(0, (result.signal + 100) * 2), 100)
-        signal_percent = int(signal_strength)
-
-        # Check if authentication is required
-        requires_login: bool = (
-            result.akm[0] != const.AKM_TYPE_NONE and ssid not in saved_profiles
-        )
-
-        # Keep only the strongest signal for each SSID
-        if (
-            ssid not in networks_dict
-            or signal_percent > networks_dict[ssid]["strength"]
-        ):
-            current_time: str = time.strftime(
-                "%Y-%m-%d %H:%M:%S", time.localtime(time.time())
-            )
-            networks_dict[ssid] = {
-                "ssid": ssid,
-                "strength": signal_percent,
-                "requires_login": requires_login,
-                "last_seen": current_time,
-            }
-
-    # Update last scan time
-    last_scan_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time()))
-    signals.update_scan_time.emit(last_scan_time)
-
-    # Convert to list and sort
-    result = sorted(networks_dict.values(), key=lambda x: x["strength"], reverse=True)
-
-    return result[:6]  # Return top 6 networks by signal strength
-
-
-def optimized_scan_wifi_networks() -> List[Dict]:
-    """
-    Wrapper function that uses Cython implementation if available,
-    otherwise falls back to pure Python version.
-
-    Returns:
-        A list of dictionaries containing network information
-    """
-    global last_scan_time
-
-    if using_cython:
-        # Use Cython optimized version
-        networks = cy_scan_wifi_networks()
-    else:
-        # Use pure Python version
-        networks = scan_wifi_networks()
-
-    # Update last scan time (moved from scan_wifi_networks)
-    last_scan_time = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(time.time()))
-    signals.update_scan_time.emit(last_scan_time)
-
-    return networks
-
-
-def save_to_json(networks: List[Dict]) -> None:
-    """Save network data to JSON file."""
-    try:
-        with open(WIFI_DATA_FILE, "w") as f:
-            json.dump(networks, f, indent=4)
-    except Exception as e:
-        log(f"Error saving to {WIFI_DATA_FILE}: {e}")
-
-
-def scanner_process() -> None:
-    """Main scanning process that runs in the background."""
-    global running
-
-    log("WiFi scanner started")
-    log("Cython optimization: " + ("Enabled" if using_cython else "Disabled"))
-
-    try:
-        while running:
-            networks = optimized_scan_wifi_networks()
-            save_to_json(networks)
-            log(f"Scanned {len(networks)} networks")
-            time.sleep(SCAN_INTERVAL)
-    except Exception as e:
-        log(f"Error in scanner process: {e}")
+scanner_service.scan_time_listeners.append(signals.update_scan_time.emit)
 
 
 class ConsoleWindow(QMainWindow):
@@ -291,7 +101,8 @@ class ConsoleWindow(QMainWindow):
 
         # Optimization status label
         self.optimization_label = QLabel(
-            f"Cython optimization: {'Enabled' if using_cython else 'Disabled'}"
+            "Cython optimization: "
+            + ("Enabled" if scanner_service.using_cython else "Disabled")
         )
         self.optimization_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
@@ -301,9 +112,14 @@ class ConsoleWindow(QMainWindow):
 
         main_layout.addLayout(labels_layout)
 
-        # Log display
-        self.log_display = QTextEdit()
+        # Scan phase timings (scanner_service.metrics)
+        self.metrics_label = QLabel()
+        main_layout.addWidget(self.metrics_label)
+
+        # Log display, as long as the log buffer; older lines are dropped
+        self.log_display = QPlainTextEdit()
         self.log_display.setReadOnly(True)
+        self.log_display.setMaximumBlockCount(scanner_service.log_messages.maxlen)
         main_layout.addWidget(self.log_display)
 
         # Button area
@@ -322,7 +138,6 @@ class ConsoleWindow(QMainWindow):
         main_layout.addLayout(button_layout)
 
         # Connect signals
-        signals.update_log.connect(self.add_log)
         signals.update_scan_time.connect(self.update_scan_time)
 
         get_and_apply_styles(
@@ -330,6 +145,7 @@ class ConsoleWindow(QMainWindow):
             set_content_funcs={
                 "last_scan_time.qss": self.scan_time_label.setStyleSheet,
                 "optimization_label.qss": self.optimization_label.setStyleSheet,
+                "metrics_label.qss": self.metrics_label.setStyleSheet,
                 "clear_button.qss": self.clear_button.setStyleSheet,
                 "force_scan_button.qss": self.scan_button.setStyleSheet,
                 "log_display.qss": self.log_display.setStyleSheet,
@@ -342,13 +158,26 @@ class ConsoleWindow(QMainWindow):
         # Center the window on the screen
         center_on_screen(self)
 
-        # Load existing logs
-        for msg in log_messages:
-            self.log_display.append(msg)
+        # Lines logged on the scanner thread wait here and are shown in batches,
+        # so a burst of lines costs one append and one scroll per flush
+        self.pending_logs: Deque[str] = deque(
+            maxlen=scanner_service.log_messages.maxlen
+        )
+        # Holding the lock keeps the lines logged so far ahead of new ones
+        with scanner_service.log_lock:
+            self.pending_logs.extend(scanner_service.subscribe_log(self.add_log))
+        self.flush_timer = QTimer(self)
+        self.flush_timer.timeout.connect(self.flush_logs)
+        self.flush_timer.start(LOG_FLUSH_INTERVAL)
+        self.flush_logs()
+
+        self.metrics_timer = QTimer(self)
+        self.metrics_timer.timeout.connect(self.update_metrics)
+        self.metrics_timer.start(METRICS_REFRESH_INTERVAL)
 
         # Update scan time if available
-        if last_scan_time:
-            self.update_scan_time(last_scan_time)
+        if scanner_service.last_scan_time:
+            self.update_scan_time(scanner_service.last_scan_time)
 
     @lru_cache(maxsize=1)
     def is_windows_11(self) -> bool:
@@ -396,12 +225,33 @@ class ConsoleWindow(QMainWindow):
             )
 
     def add_log(self, message) -> None:
-        """Add a log message to the display."""
-        self.log_display.append(message)
+        """Queue a log message for the display (called from any thread)."""
+        self.pending_logs.append(message)
+
+    def flush_logs(self) -> None:
+        """Add the queued log messages to the display in one batch."""
+        if not self.pending_logs or not self.isVisible():
+            return
+
+        batch: List[str] = []
+        while self.pending_logs:
+            batch.append(self.pending_logs.popleft())
+        self.log_display.appendPlainText("\n".join(batch))
         # Scroll to bottom
         scrollbar: QScrollBar | None = self.log_display.verticalScrollBar()
         scrollbar.setValue(scrollbar.maximum())
 
+    def update_metrics(self) -> None:
+        """Show the recent timings of each scan phase."""
+        if self.isVisible():
+            self.metrics_label.setText(scanner_service.metrics.format_table())
+
+    def showEvent(self, event) -> None:
+        """Show the lines logged and the scans made while the window was hidden."""
+        super().showEvent(event)
+        self.flush_logs()
+        self.update_metrics()
+
     def update_scan_time(self, time_str) -> None:
         """Update the last scan time display."""
         self.scan_time_label.setText(f"Last scan: {time_str}")
@@ -409,8 +259,8 @@ class ConsoleWindow(QMainWindow):
     def clear_log(self) -> None:
         """Clear the log display."""
         self.log_display.clear()
-        global log_messages
-        log_messages = []
+        self.pending_logs.clear()
+        scanner_service.log_messages.clear()
         log("Log cleared")
 
     def force_scan(self) -> None:
@@ -424,7 +274,7 @@ class ConsoleWindow(QMainWindow):
     def perform_scan(self) -> None:
         """Perform the actual scan operation."""
         networks = optimized_scan_wifi_networks()
-        save_to_json(networks)
+        save_to_json(networks, time.monotonic())
         log(f"Manual scan complete - found {len(networks)} networks")
 
     def closeEvent(self, event) -> None:
@@ -435,13 +285,17 @@ class ConsoleWindow(QMainWindow):
 
 
 class WiFiScannerApp(QApplication):
-    def __init__(self, args) -> None:
+    def __init__(self, args, auto_connect: bool = False) -> None:
         super().__init__(args)
 
         self.setQuitOnLastWindowClosed(False)
 
-        # Create console window
-        self.console = ConsoleWindow()
+        if auto_connect:
+            self.start_roaming()
+
+        # The console is built the first time it is shown; until then the log
+        # is only kept in scanner_service.log_messages
+        self.console: Optional[ConsoleWindow] = None
 
         # Create system tray icon
         self.tray_icon = QSystemTrayIcon(self)
@@ -483,8 +337,15 @@ class WiFiScannerApp(QApplication):
         self.scanner_thread.daemon = True
         self.scanner_thread.start()
 
+    def start_roaming(self) -> None:
+        """Create the auto-connect engine; the scanner thread drives it."""
+        scanner_service.start_roaming()
+
     def show_console(self) -> None:
-        """Show the console window."""
+        """Show the console window, creating it on first use."""
+        if self.console is None:
+            # Loads the styles, applies the blur and replays the buffered log
+            self.console = ConsoleWindow()
         self.console.show()
         self.console.raise_()
         self.console.activateWindow()
@@ -492,9 +353,9 @@ class WiFiScannerApp(QApplication):
     def view_data(self) -> None:
         """Open the data file."""
         if os.name == "nt":
-            os.startfile(WIFI_DATA_FILE)
+            os.startfile(scanner_service.output_file)
         else:
-            os.system(f"open {WIFI_DATA_FILE}")
+            os.system(f"open {scanner_service.output_file}")
 
     def tray_activated(self, reason) -> None:
         """Handle tray icon activation (double-click)."""
@@ -503,15 +364,17 @@ class WiFiScannerApp(QApplication):
 
     def quit_app(self) -> None:
         """Quit the application."""
-        global running
-        running = False
+        scanner_service.stop()
         # Allow time for the scanner thread to terminate
-        time.sleep(0.5)
+        self.scanner_thread.join(timeout=0.5)
+        scanner_service.close()
         self.quit()
 
 
 def main():
     """Main function to run the Wi-Fi scanner with PyQt6 GUI."""
+    args = scanner_service.parse_args()
+
     # Check for single instance
     single_instance = SingleInstance()
 
@@ -527,7 +390,7 @@ def main():
         sys.exit(1)
 
     # Create Qt application
-    app = WiFiScannerApp(sys.argv)
+    app = WiFiScannerApp(sys.argv[:1], auto_connect=args.auto_connect)
 
     # Run the application
     sys.exit(app.exec())
@@ -13,6 +13,9 @@ from typing import Dict, List, Set
 # PyWiFi types - using python objects since we need the library functionality
 from pywifi import PyWiFi, const, iface
 
+# Network description helpers shared with the pure Python scanner
+from core.network_details import describe_frequency, describe_security
+
 # For type definitions
 from cpython cimport datetime
 from libc.stdlib cimport malloc, free
@@ -46,9 +49,14 @@ def get_wifi_interface():
     except Exception:
         return None
 
-def cy_scan_wifi_networks():
+def cy_scan_wifi_networks(top_k=None, saved_profiles=None):
     """
     Optimized Cython version of scan_wifi_networks.
+
+    Args:
+        top_k: If given, only the strongest `top_k` networks are returned
+        saved_profiles: The SSIDs of saved profiles (from the shared profile
+            index); listed from the interface if not given
     
     Returns:
         A list of dictionaries containing network information
@@ -64,8 +72,9 @@ def cy_scan_wifi_networks():
     if interface is None:
         return []
         
-    # Get saved profiles (connections)
-    cdef set saved_profiles = {profile.ssid for profile in interface.network_profiles()}
+    # Get saved profiles (connections) unless the caller already has them
+    if saved_profiles is None:
+        saved_profiles = {profile.ssid for profile in interface.network_profiles()}
     
     # Trigger scan
     interface.scan()
@@ -97,15 +106,23 @@ def cy_scan_wifi_networks():
         
         # Keep only the strongest signal for each SSID
         if ssid not in networks_dict or signal_percent > networks_dict[ssid]["strength"]:
+            frequency, channel, band = describe_frequency(getattr(result, "freq", 0))
             networks_dict[ssid] = {
                 "ssid": ssid,
                 "strength": signal_percent,
                 "requires_login": requires_login,
                 "last_seen": current_time,
+                "security": describe_security(result.akm),
+                "frequency": frequency,
+                "channel": channel,
+                "band": band,
+                "akm": list(result.akm),
+                "cipher": result.cipher,
             }
     
     # Convert to list and sort
     result_list = sorted(networks_dict.values(), key=lambda x: x["strength"], reverse=True)
     
-    # Return top 6 networks by signal strength
-    return result_list[:6]
+    if top_k is None:
+        return result_list
+    return result_list[:top_k]
@@ -0,0 +1,334 @@
+# Built-in Modules
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple
+
+# Constants
+WIFI_DATA_FILE: Path = Path(__file__).parent / "wifi_data.json"
+
+
+class NetworkEntry(NamedTuple):
+    """One network of a snapshot, as shown in the network table."""
+
+    ssid: str
+    strength: int
+    requires_login: bool
+    security: str = ""
+    channel: int = 0
+    band: str = ""
+    last_seen: str = ""
+
+    @classmethod
+    def from_snapshot(cls, item: Dict) -> "NetworkEntry":
+        """Builds an entry from a network dictionary published by the scanner."""
+        return cls(
+            item["ssid"],
+            item["strength"],
+            item["requires_login"],
+            item.get("security", ""),
+            item.get("channel", 0),
+            item.get("band", ""),
+            item.get("last_seen", ""),
+        )
+
+
+def read_snapshot(path: Path = WIFI_DATA_FILE) -> Dict:
+    """
+    Reads a snapshot published by the background scanner.
+
+    The scanner writes an envelope containing a sequence number and the list of
+    networks. Older versions wrote the bare list, which is still accepted and
+    reported with a sequence number of 0.
+
+    Args:
+        path: The path to the snapshot file
+
+    Returns:
+        A dictionary with the keys "sequence", "published_at" and "networks",
+        and "scan_completed" if the scanner stamped it
+
+    Raises:
+        FileNotFoundError: If the snapshot file does not exist
+        json.JSONDecodeError: If the snapshot file is corrupt
+    """
+    with open(path, "r") as f:
+        data = json.load(f)
+
+    if isinstance(data, list):
+        return {
+            "sequence": 0,
+            "published_at": 0.0,
+            "scan_completed": None,
+            "networks": data,
+        }
+
+    if not isinstance(data, dict) or not isinstance(data.get("networks"), list):
+        raise json.JSONDecodeError("Unexpected snapshot layout", "", 0)
+
+    return data
+
+
+def encode_snapshot(
+    networks: List[Dict], sequence: int, scan_completed: Optional[float] = None
+) -> str:
+    """
+    Serializes a snapshot of scanned networks.
+
+    Args:
+        networks: The list of network dictionaries to publish
+        sequence: The snapshot sequence number (increases with every scan)
+        scan_completed: When the scan finished, as time.monotonic(); defaults
+            to now. The monotonic clock is shared by every process on the
+            machine, so readers can measure how old the scan is
+
+    Returns:
+        The snapshot as JSON text
+    """
+    snapshot: Dict = {
+        "sequence": sequence,
+        "published_at": time.time(),
+        "scan_completed": (
+            time.monotonic() if scan_completed is None else scan_completed
+        ),
+        "networks": networks,
+    }
+    return json.dumps(snapshot, indent=4)
+
+
+def write_snapshot_text(text: str, path: Path = WIFI_DATA_FILE) -> None:
+    """
+    Atomically publishes a snapshot serialized by encode_snapshot.
+
+    The snapshot is written to a temporary file next to the target and then
+    moved over it, so readers never observe a partially written file.
+
+    Args:
+        text: The serialized snapshot
+        path: The path to the snapshot file
+    """
+    temp_path: Path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    with open(temp_path, "w") as f:
+        f.write(text)
+
+    # A reader holding the file open on Windows makes the replace fail briefly
+    for attempt in range(3):
+        try:
+            os.replace(temp_path, path)
+            return
+        except PermissionError:
+            if attempt == 2:
+                os.remove(temp_path)
+                raise
+            time.sleep(0.05)
+
+
+def write_snapshot(
+    networks: List[Dict], sequence: int, path: Path = WIFI_DATA_FILE
+) -> None:
+    """
+    Atomically publishes a snapshot of scanned networks.
+
+    Args:
+        networks: The list of network dictionaries to publish
+        sequence: The snapshot sequence number (increases with every scan)
+        path: The path to the snapshot file
+    """
+    write_snapshot_text(encode_snapshot(networks, sequence), path)
+
+
+def last_snapshot_sequence(path: Path = WIFI_DATA_FILE) -> int:
+    """
+    Returns the sequence number of the snapshot currently on disk.
+
+    Used by the scanner to continue numbering after a restart.
+
+    Args:
+        path: The path to the snapshot file
+
+    Returns:
+        The sequence number, or 0 if there is no readable snapshot
+    """
+    try:
+        return int(read_snapshot(path).get("sequence", 0))
+    except (OSError, ValueError, TypeError):
+        return 0
+
+
+def read_fresh_snapshot(max_age: float, path: Path = WIFI_DATA_FILE) -> Optional[Dict]:
+    """
+    Reads the snapshot only if the scanner published it recently.
+
+    Args:
+        max_age: The maximum age of the snapshot, in seconds
+        path: The path to the snapshot file
+
+    Returns:
+        The snapshot (see read_snapshot), or None if it is missing, unreadable
+        or older than `max_age`
+    """
+    try:
+        snapshot: Dict = read_snapshot(path)
+    except (OSError, ValueError):
+        return None
+
+    age: float = time.time() - float(snapshot.get("published_at") or 0.0)
+    return snapshot if 0.0 <= age <= max_age else None
+
+
+class WifiCache:
+    """
+    A stale-while-revalidate cache around the scanner's snapshot file.
+
+    Every lookup compares the file's modification time and size against the
+    version the cached data was read from. An unchanged file is a hit. A changed
+    file is served stale immediately while a background thread re-reads it, so
+    the caller never blocks once the cache has been filled.
+    """
+
+    def __init__(
+        self,
+        loader: Callable[[Path], Tuple[int, List]],
+        source: Path = WIFI_DATA_FILE,
+    ) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            loader: Reads the source and returns (sequence, data)
+            source: The file the cached data is read from
+        """
+        self.loader = loader
+        self.source: Path = source
+        self.data: Optional[List] = None
+        self.sequence: int = -1
+        self.version: Optional[Tuple[int, int]] = None
+
+        # Counters
+        self.hits: int = 0
+        self.misses: int = 0
+        self.stale: int = 0
+        self.refresh_errors: int = 0
+
+        self._lock = threading.Lock()
+        self._refreshing: bool = False
+
+    def source_version(self) -> Optional[Tuple[int, int]]:
+        """Return the (mtime_ns, size) of the source, or None if it is missing."""
+        try:
+            stat: os.stat_result = os.stat(self.source)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+
+    def get(self, *, force_refresh: bool = False) -> List:
+        """
+        Return the cached data, reading the source only when necessary.
+
+        Args:
+            force_refresh: If True, re-reads the source synchronously
+
+        Returns:
+            The cached data
+
+        Raises:
+            Any exception raised by the loader on a synchronous read
+        """
+        version: Optional[Tuple[int, int]] = self.source_version()
+
+        with self._lock:
+            if not force_refresh and self.data is not None:
+                if version == self.version or version is None:
+                    self.hits += 1
+                    return self.data
+
+                # Serve what we have and revalidate in the background
+                self.stale += 1
+                if not self._refreshing:
+                    self._refreshing = True
+                    threading.Thread(
+                        target=self._refresh, args=(version,), daemon=True
+                    ).start()
+                return self.data
+
+            self.misses += 1
+
+        sequence, data = self.loader(self.source)
+        self._store(version, sequence, data, force=True)
+        return data
+
+    def _refresh(self, version: Optional[Tuple[int, int]]) -> None:
+        """Re-read the source on a background thread."""
+        try:
+            sequence, data = self.loader(self.source)
+            self._store(version, sequence, data)
+        except Exception:
+            # Keep serving the previous data; the next lookup will retry
+            with self._lock:
+                self.refresh_errors += 1
+        finally:
+            with self._lock:
+                self._refreshing = False
+
+    def _store(
+        self,
+        version: Optional[Tuple[int, int]],
+        sequence: int,
+        data: List,
+        *,
+        force: bool = False,
+    ) -> None:
+        """
+        Store freshly read data unless a newer snapshot is already cached.
+
+        A lower sequence normally means a slow background read finished after a
+        newer one. It is still accepted when it was read from a newer file: the
+        scanner restarts its sequence when the snapshot file was missing or
+        corrupt, and rejecting those would keep the cache stale indefinitely.
+        """
+        with self._lock:
+            if not force and sequence < self.sequence:
+                restarted: bool = (
+                    version is not None
+                    and self.version is not None
+                    and version[0] > self.version[0]
+                )
+                if not restarted:
+                    return
+            self.data = data
+            self.sequence = sequence
+            self.version = version
+
+    def current(self) -> Tuple[int, Optional[List]]:
+        """Return the cached (sequence, data) pair, without reading the source."""
+        with self._lock:
+            return (self.sequence, self.data)
+
+    def update(self, data: List) -> None:
+        """
+        Seed the cache with data that was not read from the source.
+
+        The data is kept until the source reappears or changes, at which point it
+        is revalidated like any other stale entry.
+        """
+        self._store(None, -1, data, force=True)
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache counters."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "stale": self.stale,
+                "refresh_errors": self.refresh_errors,
+                "sequence": self.sequence,
+            }
+
+    def clear(self) -> None:
+        """Clear the cache data."""
+        with self._lock:
+            self.data = None
+            self.sequence = -1
+            self.version = None
@@ -1,35 +1,42 @@
-from helpers.blurWindow import Blur
-from helpers.center import center_on_screen
-from helpers.command_bar_enabled_state import processing
-from helpers.message_box import Buttons, Icons, MessageBox
-from helpers.output_box_animation import (
-    hide_output_box_with_animation,
-    show_output_box_with_animation,
-)
-from helpers.path_utils import (
-    _load_stylesheet,
-    get_and_apply_styles,
-    get_downloads_directory,
-)
-from helpers.system_commands import hibernate, lock_or_logout, reboot, shutdown, sleep
-from helpers.win_style_helper import apply_window_style
+# Built-in Modules
+from importlib import import_module
+from typing import Any
 
-__all__: list[str] = [
-    "Icons",
-    "Buttons",
-    "MessageBox",
-    "Blur",
-    "center_on_screen",
-    "processing",
-    "hide_output_box_with_animation",
-    "show_output_box_with_animation",
-    "get_and_apply_styles",
-    "get_downloads_directory",
-    "apply_window_style",
-    "_load_stylesheet",
-    "hibernate",
-    "lock_or_logout",
-    "reboot",
-    "shutdown",
-    "sleep",
-]
+# Module of each public name. Modules are imported on first use, so importing
+# one helper (e.g. the cancellation token) does not load the Windows-only ones.
+_EXPORTS: dict[str, str] = {
+    "Icons": "helpers.message_box",
+    "Buttons": "helpers.message_box",
+    "MessageBox": "helpers.message_box",
+    "Blur": "helpers.blurWindow",
+    "CancellationToken": "helpers.cancellation",
+    "OperationCancelled": "helpers.cancellation",
+    "center_on_screen": "helpers.center",
+    "processing": "helpers.command_bar_enabled_state",
+    "hide_output_box_with_animation": "helpers.output_box_animation",
+    "show_output_box_with_animation": "helpers.output_box_animation",
+    "show_status_notice": "helpers.output_box_animation",
+    "hold_output_box": "helpers.output_box_animation",
+    "release_output_box": "helpers.output_box_animation",
+    "is_output_box_held": "helpers.output_box_animation",
+    "get_and_apply_styles": "helpers.path_utils",
+    "get_downloads_directory": "helpers.path_utils",
+    "apply_window_style": "helpers.win_style_helper",
+    "_load_stylesheet": "helpers.path_utils",
+    "hibernate": "helpers.system_commands",
+    "lock_or_logout": "helpers.system_commands",
+    "reboot": "helpers.system_commands",
+    "shutdown": "helpers.system_commands",
+    "sleep": "helpers.system_commands",
+}
+
+__all__: list[str] = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    """Import a public name from its module on first access."""
+    if name not in _EXPORTS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value: Any = getattr(import_module(_EXPORTS[name]), name)
+    globals()[name] = value
+    return value
@@ -0,0 +1,55 @@
+# Built-in Modules
+import threading
+from typing import Optional
+
+
+class OperationCancelled(Exception):
+    """Raised when an operation notices that its cancellation token was set."""
+
+
+class CancellationToken:
+    """
+    A thread-safe flag used to ask a background operation to stop.
+
+    The owner calls cancel(); the operation checks the token between steps and
+    uses wait() instead of time.sleep() so that it wakes up immediately when it
+    is cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._event = threading.Event()
+        self.reason: Optional[str] = None
+
+    @property
+    def is_cancelled(self) -> bool:
+        """Return True once cancel() has been called."""
+        return self._event.is_set()
+
+    def cancel(self, reason: str = "Operation cancelled") -> None:
+        """
+        Request cancellation.
+
+        Args:
+            reason: A short, user-facing explanation of why it was cancelled
+        """
+        if not self._event.is_set():
+            self.reason = reason
+            self._event.set()
+
+    def raise_if_cancelled(self) -> None:
+        """Raise OperationCancelled if cancellation has been requested."""
+        if self._event.is_set():
+            raise OperationCancelled(self.reason)
+
+    def wait(self, timeout: float) -> None:
+        """
+        Sleep for up to `timeout` seconds, waking early on cancellation.
+
+        Args:
+            timeout: The number of seconds to sleep
+
+        Raises:
+            OperationCancelled: If the token is cancelled before or during the wait
+        """
+        if self._event.wait(timeout):
+            raise OperationCancelled(self.reason)
@@ -1,18 +1,19 @@
 def processing(self, *, begin: bool = False, end: bool = False) -> None:
     """
-    Helper function to control the command bar's enabled state.
+    Helper function to mark the command bar as busy while a command runs.
 
-    Disables the command bar at the beginning of a function and enables it at the end.
-    Useful for preventing user input during long-running operations.
+    The command bar stays enabled, so the user can press Esc to cancel or queue
+    the next command; the command processor checks `processing_active` to tell
+    whether input has to wait.
 
     Parameters:
-        begin (bool, optional): If True, disables the command bar. Defaults to False.
-        end (bool, optional): If True, enables the command bar and focuses it. Defaults to False.
+        begin (bool, optional): If True, marks a command as running. Defaults to False.
+        end (bool, optional): If True, marks it finished and focuses the command bar. Defaults to False.
     """
     if begin:
-        # Disable the command bar at the beginning of the function
-        self.command_bar.setDisabled(True)
+        self.processing_active = True
 
-    if end:
-        self.command_bar.setDisabled(False)
+    # A running command chain keeps the command bar busy until it ends
+    if end and not getattr(self, "output_box_holds", 0):
+        self.processing_active = False
         self.command_bar.setFocus()
@@ -1,5 +1,15 @@
+# Built-in Modules
+from pathlib import Path
+
 # PyQt6 Modules
-from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRect
+from PyQt6.QtCore import QEasingCurve, QPropertyAnimation, QRect, QTimer
+
+# Helpers Modules
+from helpers.path_utils import get_and_apply_styles
+
+# A notice raised before the window is shown waits for it, up to 5 seconds
+NOTICE_RETRY_INTERVAL: int = 100  # milliseconds between checks
+NOTICE_MAX_RETRIES: int = 50
 
 
 def show_output_box_with_animation(self) -> None:
@@ -13,8 +23,11 @@ def show_output_box_with_animation(self) -> None:
 
     The output box is centered horizontally and positioned at the bottom
     with a 10-pixel margin. The animations run simultaneously with a duration
-    of 400 milliseconds.
+    of 400 milliseconds. Showing a box that is already shown does nothing.
     """
+    if getattr(self, "output_box_shown", False):
+        return
+    self.output_box_shown = True
     self.output_box.show()
 
     # Get the center position
@@ -88,7 +101,14 @@ def hide_output_box_with_animation(self) -> None:
     2. Slide the output box out of view, also with an InOutQuad curve.
     3. Slide the command bar and table back down to their original positions.
     4. Hide the output box once the animation is complete.
+
+    Nothing happens if the box is not shown, or while it is held (see
+    hold_output_box).
     """
+    if not getattr(self, "output_box_shown", False) or is_output_box_held(self):
+        return
+    self.output_box_shown = False
+
     # Get the center position
     center_x: int = (self.width() - self.output_box.width()) // 2
     # 10px margin from bottom
@@ -144,3 +164,79 @@ def hide_output_box_with_animation(self) -> None:
     self.fade_out_animation.start()
     self.slide_out_animation.start()
     self.command_bar_animation.start()
+
+
+def hold_output_box(self) -> None:
+    """
+    Keeps the output box up and the window busy until released.
+
+    Used while a command chain runs: each step shows its result in the box,
+    and the hide animations and the end of processing (see processing) that a
+    step schedules for itself are skipped, so steps can follow each other
+    without waiting for animations. The command bar stays enabled, so input
+    is queued and Esc cancels the chain.
+    """
+    self.output_box_holds = getattr(self, "output_box_holds", 0) + 1
+
+
+def release_output_box(self) -> None:
+    """Releases one hold_output_box; the caller hides the box afterwards."""
+    self.output_box_holds = max(getattr(self, "output_box_holds", 0) - 1, 0)
+
+
+def is_output_box_held(self) -> bool:
+    """Returns True while the output box is held."""
+    return getattr(self, "output_box_holds", 0) > 0
+
+
+def show_status_notice(
+    self,
+    message: str,
+    *,
+    success: bool = False,
+    duration: int = 1500,
+    retries: int = NOTICE_MAX_RETRIES,
+) -> None:
+    """
+    Shows a short, non-blocking notice in the output box.
+
+    Unlike command results, a notice leaves the command bar untouched. If the
+    output box is already visible only its text is replaced, and a notice raised
+    before the window is shown is deferred until it is, or dropped if it is not
+    shown in time.
+
+    Args:
+        message: The text to display
+        success: If True, uses the success style instead of the failure style
+        duration: How long the notice stays visible, in milliseconds
+        retries: How many more times to check for a hidden window to be shown
+    """
+    if not self.isVisible():
+        if retries > 0:
+            QTimer.singleShot(
+                NOTICE_RETRY_INTERVAL,
+                lambda: show_status_notice(
+                    self,
+                    message,
+                    success=success,
+                    duration=duration,
+                    retries=retries - 1,
+                ),
+            )
+        return
+
+    get_and_apply_styles(
+        script_file=Path(__file__).parent,
+        set_content_funcs={
+            (
+                "output_box_success.qss" if success else "output_box_failure.qss"
+            ): self.output_box.setStyleSheet
+        },
+    )
+    self.output_box.setPlainText(message)
+
+    if self.output_box.isVisible():
+        return
+
+    show_output_box_with_animation(self)
+    QTimer.singleShot(duration, lambda: hide_output_box_with_animation(self))
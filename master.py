@@ -2,21 +2,37 @@
 import sys
 from pathlib import Path
 
+if __name__ == "__main__" and any(
+    arg == "--exec" or arg.startswith("--exec=") for arg in sys.argv[1:]
+):
+    # Headless mode runs the commands without a window; it is dispatched before
+    # the Qt widgets are imported, so none of them are loaded
+    from core.headless import main as run_headless_cli
+
+    sys.exit(run_headless_cli(sys.argv[1:]))
+
 # PyQt6 Modules
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QIcon
+from PyQt6.QtCore import Qt, QTimer
+from PyQt6.QtGui import QIcon, QKeySequence, QShortcut
 from PyQt6.QtWidgets import (
     QApplication,
     QHBoxLayout,
     QHeaderView,
-    QTableWidget,
+    QLineEdit,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
 # Core Modules
-from core import CommandProcessor, TerminalAutoComplete, load_wifi_networks
+from core import (
+    CommandProcessor,
+    NetworkTableView,
+    TerminalAutoComplete,
+    load_wifi_networks,
+    poll_wifi_networks,
+)
 
 # Helpers Modules
 from helpers import apply_window_style, center_on_screen, get_and_apply_styles
@@ -32,11 +48,11 @@ class MasterWindow(QWidget):
 
         self.setWindowIcon(QIcon(str(icon_path)))
 
-        self.initUI()
-
-        # Initialize the command processor
+        # The command processor registers the commands the command bar completes
         self.command_processor = CommandProcessor(self)
 
+        self.initUI()
+
     def initUI(self) -> None:
         # Hidden Text Box
         self.output_box = QTextEdit()
@@ -52,33 +68,23 @@ class MasterWindow(QWidget):
         )
         self.output_box.hide()
 
+        # Filter Bar
+        self.filter_bar = QLineEdit()
+        self.filter_bar.setFixedWidth(580)
+        self.filter_bar.setFixedHeight(30)
+        self.filter_bar.setPlaceholderText("Filter networks... (Ctrl+F)")
+
         # Table
-        self.table = QTableWidget()
-        self.table.setColumnCount(2)
-        self.table.setFixedHeight(325)
-        self.table.setHorizontalHeaderLabels(["Network Name", "Signal Strength"])
+        self.table = NetworkTableView()
+        self.table.setFixedHeight(285)
         self.configure_table()
 
+        self.filter_bar.textChanged.connect(self.table.set_filter_text)
+
         # Command Bar
-        commands: list[str] = [
-            "quit",
-            "exit",
-            "close",
-            "terminate",
-            "disconnect",
-            "refresh",
-            "shutdown",
-            "reboot",
-            "restart",
-            "sleep",
-            "hibernate",
-            "lock",
-            "logout",
-            "connect",
-            "wifi-manager",
-        ]
-
-        self.command_bar = TerminalAutoComplete(commands)
+        self.command_bar = TerminalAutoComplete(
+            self.command_processor.registry.completions()
+        )
         self.command_bar.setFixedWidth(580)
         self.command_bar.setFixedHeight(40)
         self.command_bar.setPlaceholderText("Type here...")
@@ -101,6 +107,7 @@ class MasterWindow(QWidget):
 
         table = QVBoxLayout()
         table.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        table.addWidget(self.filter_bar)
         table.addWidget(self.table)
 
         get_and_apply_styles(
@@ -108,9 +115,21 @@ class MasterWindow(QWidget):
             set_content_funcs={
                 "command_bar.qss": self.command_bar.setStyleSheet,
                 "output_box.qss": self.output_box.setStyleSheet,
+                "network_filter.qss": self.filter_bar.setStyleSheet,
             },
         )
 
+        # Keyboard access to the filter: Ctrl+F to focus it, Esc to clear it
+        QShortcut(QKeySequence.StandardKey.Find, self, self.focus_filter)
+        clear_filter = QShortcut(QKeySequence(Qt.Key.Key_Escape), self.filter_bar)
+        clear_filter.setContext(Qt.ShortcutContext.WidgetShortcut)
+        clear_filter.activated.connect(self.clear_filter)
+
+        # Esc in the command bar aborts the running command and the queue
+        cancel_command = QShortcut(QKeySequence(Qt.Key.Key_Escape), self.command_bar)
+        cancel_command.setContext(Qt.ShortcutContext.WidgetShortcut)
+        cancel_command.activated.connect(self.command_processor.cancel)
+
         master_layout.addLayout(table)
         master_layout.addLayout(output_layout)
         master_layout.addStretch()
@@ -122,23 +141,29 @@ class MasterWindow(QWidget):
         apply_window_style(self)
         center_on_screen(self)
 
+        # Pick up new scanner snapshots while the window is open
+        self.poll_timer = QTimer(self)
+        self.poll_timer.setInterval(1000)
+        self.poll_timer.timeout.connect(lambda: poll_wifi_networks(self.table))
+        self.poll_timer.start()
+
     def configure_table(self) -> None:
         """
-        Configures the QTableWidget to have a fixed size and layout, and
-        disables editing, selection, and sorting.
+        Configures the network table to have a fixed size and layout, and
+        disables editing, selection, and header sorting.
 
         This function is called once, when the window is created, to set up
         the table's appearance and behavior.
         """
-        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)  # Read-only
+        self.table.setEditTriggers(QTableView.EditTrigger.NoEditTriggers)  # Read-only
 
         # 🚀 Disable selection completely
-        self.table.setSelectionMode(QTableWidget.SelectionMode.NoSelection)
+        self.table.setSelectionMode(QTableView.SelectionMode.NoSelection)
         self.table.setFocusPolicy(Qt.FocusPolicy.NoFocus)
 
         # 🚀 Fix row positions
         self.table.verticalHeader().setSectionsMovable(False)  # Prevent dragging
-        self.table.setSortingEnabled(False)  # Prevent sorting from changing row order
+        self.table.setSortingEnabled(False)  # Order is controlled by the proxy model
         self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
         self.table.verticalHeader().setDefaultSectionSize(40)  # Fixed row height
 
@@ -153,11 +178,22 @@ class MasterWindow(QWidget):
             1, QHeaderView.ResizeMode.Fixed
         )
 
-        # ®️ Remove row numbers and scrollbars
+        # ®️ Remove row numbers, scroll vertically through long lists
         self.table.verticalHeader().setVisible(False)
         self.table.horizontalHeader().setStretchLastSection(True)
-        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
         self.table.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.table.setVerticalScrollMode(QTableView.ScrollMode.ScrollPerPixel)
+
+    def focus_filter(self) -> None:
+        """Moves the keyboard focus to the network filter."""
+        self.filter_bar.setFocus()
+        self.filter_bar.selectAll()
+
+    def clear_filter(self) -> None:
+        """Clears the network filter and returns to the command bar."""
+        self.filter_bar.clear()
+        self.command_bar.setFocus()
 
     def check_input(self) -> None:
         """